@@ -0,0 +1,102 @@
+"""
+키워드 매칭 마이크로 벤치마크
+
+    python -m benchmarks.bench_keyword_matcher [--rows 500] [--repeat 20]
+
+500행 합성 등기부 시트에서 구간 키워드(시작/종료)와 헤더 키워드를 찾는 작업을
+기존 셀 단위 함수(매 호출마다 정규화)와 KeywordMatcher로 각각 수행해 시간을 비교
+"""
+import argparse
+import random
+import re
+import timeit
+
+import pandas as pd
+
+from keyword_matcher import KeywordMatcher, NormalizedSheet
+
+SECTION_KEYWORDS = ["소유지분현황", "소유권", "저당권", "3.(근)저당권및전세권등(을구)", "참고", "비고", "총계", "전산자료"]
+HEADER_KEYWORDS = ["등기명의인", "(주민)등록번호", "최종지분", "주소", "순위번호", "등기목적", "접수정보", "주요등기사항", "대상소유자"]
+
+
+def legacy_match_partial(cell, keyword):
+    if pd.isnull(cell): return False
+    return keyword.replace(" ", "") in str(cell).replace(" ", "")
+
+
+def legacy_match_exact(cell, keyword):
+    if pd.isnull(cell): return False
+    return re.sub(r"\s+", "", str(cell)) == re.sub(r"\s+", "", keyword)
+
+
+def synthetic_register_sheet(rows=500, seed=0):
+    """소유지분현황/을구 구간과 다수의 공유자 행을 가진 합성 시트"""
+    rnd = random.Random(seed)
+    data = [["고유번호 1234-5678-123456"], ["[토지] 경기도 화성시 우정읍 조암리 123  답  1,234㎡"],
+            ["1. 소유지분현황 ( 갑구 )"],
+            ["등기명의인", "", "(주민)등록번호", "", "최종지분", "", "주  소", "", "순위번호"]]
+    owners = max(rows - 12, 1)
+    for k in range(owners):
+        data.append([f"공유자{k} (공유자)", "", "650101-*******", "", f"{owners}분의 1", "",
+                     rnd.choice(["서울특별시 강남구 테헤란로 1", "경기도 화성시 우정읍 조암리 45"]), "", str(k + 1)])
+    data += [["2. 소유지분을 제외한 소유권에 관한 사항 ( 갑구 )"],
+             ["순위번호", "", "등기목적", "", "접수정보", "", "주요등기사항", "", "대상소유자"],
+             ["기록사항 없음"], ["3. (근)저당권 및 전세권 등 ( 을구 )"],
+             ["순위번호", "", "등기목적", "", "접수정보", "", "주요등기사항", "", "대상소유자"],
+             ["1", "", "근저당권설정", "", "2015년1월2일 제1호", "", "채권최고액 금120,000,000원", "", "홍길동"],
+             ["[ 참 고 사 항 ]"]]
+    width = max(len(row) for row in data)
+    return pd.DataFrame([row + [""] * (width - len(row)) for row in data], dtype=object)
+
+
+def legacy_scan(df):
+    """기존 방식: 행마다, 키워드마다 셀 함수 호출"""
+    hits = 0
+    for _, row in df.iterrows():
+        for kw in SECTION_KEYWORDS:
+            if any(legacy_match_partial(cell, kw) for cell in row):
+                hits += 1
+            if any(legacy_match_exact(cell, kw) for cell in row):
+                hits += 1
+    for _, row in df.iterrows():
+        for kw in HEADER_KEYWORDS:
+            for cell in row:
+                if legacy_match_exact(cell, kw):
+                    hits += 1
+                    break
+    return hits
+
+
+def matcher_scan(df, partial, exact, header):
+    """KeywordMatcher 방식: 시트 정규화 1회 + 벡터화 검사"""
+    sheet = NormalizedSheet(df)
+    hits = 0
+    for kw in SECTION_KEYWORDS:
+        hits += len(partial.matching_rows(sheet, kw))
+        hits += len(exact.matching_rows(sheet, kw))
+    hits += int(header.count_per_row(sheet).sum())
+    return hits
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=500)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    df = synthetic_register_sheet(args.rows)
+    partial = KeywordMatcher(SECTION_KEYWORDS, exact=False)
+    exact = KeywordMatcher(SECTION_KEYWORDS, exact=True)
+    header = KeywordMatcher(HEADER_KEYWORDS, exact=True)
+    assert legacy_scan(df) == matcher_scan(df, partial, exact, header), "결과 불일치"
+
+    legacy = min(timeit.repeat(lambda: legacy_scan(df), number=1, repeat=args.repeat))
+    fast = min(timeit.repeat(lambda: matcher_scan(df, partial, exact, header), number=1, repeat=args.repeat))
+    print(f"시트 {len(df)}행 x {df.shape[1]}열")
+    print(f"기존 셀 함수      : {legacy * 1000:8.2f} ms")
+    print(f"KeywordMatcher    : {fast * 1000:8.2f} ms")
+    print(f"속도 향상         : {legacy / fast:8.1f}배")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+"""
+지목/주소/구간 키워드 트라이 매칭 회귀 검사 및 속도 비교
+
+    python -m benchmarks.bench_keyword_trie [--zip 업로드.zip] [--repeat 5]
+
+시트의 행 문자열과 셀 문자열에서
+1) 지목: 기존 방식(지목마다 정규식을 만들어 검사)과 KeywordTrie 한 번 검색 후 LAND_TYPES 순서로 판단
+2) 주소: 기존 방식(주소 키워드마다 포함 여부 검사)과 is_address_pattern
+3) 구간 끝 키워드: 키워드마다 포함 여부 검사와 KeywordTrie.search
+의 결과가 같은지 확인하고 처리 시간을 비교
+--zip을 주면 실제 등기부 압축파일의 시트를 사용, 없으면 합성 시트 사용
+"""
+import argparse
+import io
+import re
+import timeit
+
+from benchmarks.bench_keyword_matcher import synthetic_register_sheet
+from keyword_matcher import KeywordTrie
+from register_engine import (ADDRESS_KEYWORDS, LAND_TYPES, _follows_land_tag, _LAND_TYPE_TRIE, _land_type_near_tag,
+                             _near_land_tag, is_address_pattern, row_cell_texts)
+from sheet_reader import read_register_frame
+from zip_ingest import iter_zip_members
+
+END_KEYWORDS = ["소유권", "저당권", "참고", "비고", "총계", "전산자료"]
+
+
+def legacy_land_type(text):
+    """트라이 이전 구현: 지목마다 정규식을 만들어 [토지] 다음 지목 -> 단어 -> 50자 이내 순서로 검사"""
+    for lt in LAND_TYPES:
+        if re.search(r'\[토지\][^가-힣]*' + lt + r'(?:\s|$|[^가-힣])', text):
+            return lt
+        if lt in text and abs(text.find(lt) - text.find("[토지]")) < 50:
+            return lt
+    for lt in LAND_TYPES:
+        if re.search(r'(^|\s|[^가-힣])' + lt + r'($|\s|[^가-힣])', text):
+            return lt
+    for lt in LAND_TYPES:
+        if lt in text and abs(text.find(lt) - text.find("[토지]")) < 30:
+            return lt
+    return ""
+
+
+def trie_land_type(text):
+    """legacy_land_type과 같은 판단을 KeywordTrie 검색 한 번으로 수행"""
+    hits = _LAND_TYPE_TRIE.find_all(text)
+    for lt in LAND_TYPES:
+        if lt in hits:
+            if any(_follows_land_tag(text, pos, lt) for pos in hits[lt]) or _near_land_tag(text, hits, lt, 50):
+                return lt
+    return _land_type_near_tag(text, 30, hits)
+
+
+def legacy_address_pattern(text):
+    if not isinstance(text, str):
+        return False
+    if "단독소유" in text or "단독" in text:
+        return False
+    text_no_space = re.sub(r'\s+', '', text)
+    return any(kw in text_no_space for kw in ADDRESS_KEYWORDS)
+
+
+def record_texts(zip_path=None):
+    """[토지] 행 문자열, 셀 문자열 목록 (압축파일이 없으면 합성 시트 사용)"""
+    if zip_path:
+        frames = (read_register_frame(io.BytesIO(data)) for _, data in iter_zip_members(zip_path))
+    else:
+        frames = (synthetic_register_sheet(rows, seed) for seed in range(20) for rows in (20, 50, 100))
+    land_texts, cells = [], []
+    for df in frames:
+        for texts in row_cell_texts(df):
+            row_text = " ".join(texts)
+            if "[토지]" in row_text:
+                land_texts.append(row_text)
+            cells.extend(texts)
+    return land_texts, cells
+
+
+def compare(label, legacy, trie, values, repeat):
+    mismatches = sum(legacy(v) != trie(v) for v in values)
+    if mismatches:
+        raise SystemExit(f"{label}: 결과 불일치 {mismatches}개")
+    old = min(timeit.repeat(lambda: [legacy(v) for v in values], number=1, repeat=repeat))
+    new = min(timeit.repeat(lambda: [trie(v) for v in values], number=1, repeat=repeat))
+    print(f"{label} ({len(values)}개)")
+    print(f"  기존 반복문  : {old * 1000:9.2f} ms")
+    print(f"  KeywordTrie  : {new * 1000:9.2f} ms")
+    print(f"  속도 향상    : {old / new:9.1f}배")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--zip", help="행 문자열을 기록할 등기부등본 압축파일")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    land_texts, cells = record_texts(args.zip)
+    end_trie = KeywordTrie(END_KEYWORDS)
+    compare("지목", legacy_land_type, trie_land_type, land_texts, args.repeat)
+    compare("주소", legacy_address_pattern, is_address_pattern, cells, args.repeat)
+    compare("구간 끝 키워드", lambda text: any(kw in text for kw in END_KEYWORDS), end_trie.search, cells, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""
+merge_dataframe_cells 회귀 검사 및 속도 비교
+
+    python -m benchmarks.bench_merge_cells [--zip 업로드.zip] [--repeat 5]
+
+소유지분현황 구간마다 기존 행 단위 방식(merge_adjacent_cells를 한 행씩 적용)과
+벡터화된 merge_dataframe_cells의 결과가 같은지 확인하고 처리 시간을 비교
+--zip을 주면 실제 등기부 압축파일에서 구간을 기록해 사용, 없으면 합성 구간 사용
+"""
+import argparse
+import io
+import timeit
+
+from benchmarks.bench_keyword_matcher import synthetic_register_sheet
+from register_engine import build_section_index, merge_adjacent_cells, merge_dataframe_cells, slice_section
+from sheet_reader import read_register_frame
+from zip_ingest import iter_zip_members
+
+
+def merge_dataframe_cells_rowwise(df):
+    """벡터화 이전 구현 (행마다 merge_adjacent_cells 적용)"""
+    if df.empty:
+        return df
+    merged_df = df.copy()
+    for i in range(len(merged_df)):
+        merged_df.iloc[i] = merge_adjacent_cells(merged_df.iloc[i])
+    return merged_df
+
+
+def record_sections(zip_path=None):
+    """소유지분현황 구간 목록 (압축파일이 없으면 공유자 수를 바꿔 가며 합성)"""
+    if zip_path:
+        frames = (read_register_frame(io.BytesIO(data)) for _, data in iter_zip_members(zip_path))
+    else:
+        frames = (synthetic_register_sheet(rows) for rows in (20, 50, 100, 300, 600))
+    sections = []
+    for df in frames:
+        section, has_section = slice_section(df, build_section_index(df), "소유지분현황")
+        if has_section:
+            sections.append(section)
+    return sections
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--zip", help="구간을 기록할 등기부등본 압축파일")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    sections = record_sections(args.zip)
+    mismatches = [i for i, section in enumerate(sections)
+                  if not merge_dataframe_cells(section).equals(merge_dataframe_cells_rowwise(section))]
+    print(f"구간 {len(sections)}개, 전체 {sum(len(s) for s in sections)}행 - 결과 불일치 {len(mismatches)}개")
+    if mismatches:
+        raise SystemExit(f"불일치 구간 번호: {mismatches[:20]}")
+
+    rowwise = min(timeit.repeat(lambda: [merge_dataframe_cells_rowwise(s) for s in sections], number=1, repeat=args.repeat))
+    vectorized = min(timeit.repeat(lambda: [merge_dataframe_cells(s) for s in sections], number=1, repeat=args.repeat))
+    print(f"행 단위 (기존) : {rowwise * 1000:9.2f} ms")
+    print(f"벡터화         : {vectorized * 1000:9.2f} ms")
+    print(f"속도 향상      : {rowwise / vectorized:9.1f}배")
+
+
+if __name__ == "__main__":
+    main()
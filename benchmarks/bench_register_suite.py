@@ -0,0 +1,164 @@
+"""
+등기부등본 분석 단계별/전체 벤치마크
+
+    python -m benchmarks.bench_register_suite [--sizes 10,1000,10000] [-j 4] [--sample 200]
+        [--work-dir 임시폴더] [--save-baseline benchmarks/baseline.json] [--baseline benchmarks/baseline.json]
+
+파일 수별로 합성 등기부 압축파일(benchmarks.register_generator)을 만들고 (작업 폴더에 두고 재사용)
+1) 함수 단위: 표본 파일에서 시트 읽기, extract_section_range(구간 3개), build_section_index,
+   merge_dataframe_cells, extract_named_cols, extract_precise_named_cols, 결과 엑셀 생성
+   (write_grouped_sheet 포함)의 파일당 시간
+2) 전체: 압축파일 -> run_register_files -> 결과 엑셀 생성까지의 시간과 단계별 합계 (register_profile)
+를 측정. --save-baseline으로 결과를 JSON으로 저장하고, --baseline을 주면 저장된 결과와 비교
+"""
+import argparse
+import io
+import json
+import os
+import platform
+import tempfile
+import time
+import timeit
+
+import pandas as pd
+
+from benchmarks.register_generator import GENERATOR_VERSION, write_register_zip
+from register_engine import (REGISTER_SECTIONS, build_section_index, extract_named_cols, extract_precise_named_cols,
+                             extract_section_range, keyword_match_exact, keyword_match_partial, merge_dataframe_cells,
+                             run_register_files, slice_section)
+from register_export import collect_result_frames, export_result_xlsx
+from register_profile import build_profile_report
+from sheet_reader import read_register_frame
+from zip_ingest import iter_zip_members
+
+DEFAULT_SIZES = "10,1000,10000"
+SZJ_COLUMNS = ["등기명의인", "(주민)등록번호", "최종지분", "주소", "순위번호"]
+ENTRY_COLUMNS = ["순위번호", "등기목적", "접수정보", "주요등기사항", "대상소유자"]
+
+
+def corpus_path(work_dir, size, seed):
+    """파일 수별 합성 압축파일 (이미 있으면 그대로 사용)"""
+    path = os.path.join(work_dir, f"등기부_{size}_{seed}_v{GENERATOR_VERSION}.zip")
+    if not os.path.exists(path):
+        started = time.perf_counter()
+        write_register_zip(path + ".tmp", size, seed)
+        os.replace(path + ".tmp", path)
+        print(f"  합성 등기부 {size}개 생성 ({time.perf_counter() - started:.1f}초)")
+    return path
+
+
+def _best(fn, repeat):
+    return min(timeit.repeat(fn, number=1, repeat=repeat))
+
+
+def bench_functions(zip_path, sample, repeat):
+    """표본 파일의 함수별 처리 시간 (파일당 ms)"""
+    members = []
+    for _, data in iter_zip_members(zip_path):
+        members.append(data)
+        if len(members) >= sample:
+            break
+    frames = [read_register_frame(io.BytesIO(data)) for data in members]
+    indexes = [build_section_index(df) for df in frames]
+    szj = [section for df, index in zip(frames, indexes)
+           for section, found in [slice_section(df, index, "소유지분현황")] if found]
+    entries = [section for df, index in zip(frames, indexes) for name in ("소유권사항", "저당권사항")
+               for section, found in [slice_section(df, index, name)] if found]
+    results = list(run_register_files(((str(n), data) for n, data in enumerate(members)), max_workers=1))
+
+    def section_ranges():
+        for df in frames:
+            for start_kw, end_kws, mode in REGISTER_SECTIONS.values():
+                match_fn = keyword_match_partial if mode == "partial" else keyword_match_exact
+                extract_section_range(df, start_kw, end_kws, match_fn)
+
+    stages = {
+        "시트읽기": lambda: [read_register_frame(io.BytesIO(data)) for data in members],
+        "extract_section_range": section_ranges,
+        "build_section_index": lambda: [build_section_index(df) for df in frames],
+        "merge_dataframe_cells": lambda: [merge_dataframe_cells(section) for section in szj],
+        "extract_named_cols": lambda: [extract_named_cols(section, SZJ_COLUMNS) for section in szj],
+        "extract_precise_named_cols": lambda: [extract_precise_named_cols(section, ENTRY_COLUMNS) for section in entries],
+        "결과파일생성": lambda: export_result_xlsx(collect_result_frames(results)),
+    }
+    return {name: round(_best(fn, repeat) * 1000 / len(members), 4) for name, fn in stages.items()}
+
+
+def bench_end_to_end(zip_path, workers):
+    """압축파일 전체 처리 시간 (캐시 없이)"""
+    started = time.perf_counter()
+    results = list(run_register_files(iter_zip_members(zip_path), max_workers=workers))
+    frames = collect_result_frames(results)
+    export_started = time.perf_counter()
+    export_result_xlsx(frames)
+    finished = time.perf_counter()
+    report = build_profile_report(results, finished - started, finished - export_started)
+    return {
+        "파일수": report["파일수"],
+        "실패파일수": report["실패파일수"],
+        "전체(초)": round(finished - started, 3),
+        "파일당(ms)": round((finished - started) * 1000 / max(report["파일수"], 1), 3),
+        "결과파일생성(초)": report["결과파일생성(초)"],
+        "단계별합계(초)": {stage: total["합계(초)"] for stage, total in report["단계별합계"].items()},
+    }
+
+
+def compare(current, baseline):
+    """현재 결과와 기준 결과의 비교표 (배율 = 현재 / 기준, 1보다 크면 느려짐)"""
+    rows = []
+    for size, entry in current["sizes"].items():
+        base = baseline.get("sizes", {}).get(size)
+        if base is None:
+            continue
+        pairs = [(f"함수 {name} (ms/파일)", value, base["functions"].get(name))
+                 for name, value in entry["functions"].items()]
+        pairs.append(("전체 파일당 (ms)", entry["end_to_end"]["파일당(ms)"], base["end_to_end"]["파일당(ms)"]))
+        pairs.append(("결과파일생성 (초)", entry["end_to_end"]["결과파일생성(초)"], base["end_to_end"]["결과파일생성(초)"]))
+        for metric, value, base_value in pairs:
+            ratio = round(value / base_value, 2) if base_value else None
+            rows.append({"파일수": size, "항목": metric, "기준": base_value, "현재": value, "배율": ratio})
+    return pd.DataFrame(rows, columns=["파일수", "항목", "기준", "현재", "배율"])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", default=DEFAULT_SIZES, help=f"쉼표로 구분한 파일 수 (기본: {DEFAULT_SIZES})")
+    parser.add_argument("-j", "--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--sample", type=int, default=200, help="함수 단위 측정에 쓸 파일 수")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--work-dir", default=os.path.join(tempfile.gettempdir(), "register_bench"))
+    parser.add_argument("--save-baseline", help="결과를 기준 파일(JSON)로 저장")
+    parser.add_argument("--baseline", help="비교할 기준 파일(JSON)")
+    args = parser.parse_args()
+
+    os.makedirs(args.work_dir, exist_ok=True)
+    current = {
+        "환경": {"python": platform.python_version(), "pandas": pd.__version__, "platform": platform.platform(),
+                 "cpu": os.cpu_count(), "workers": args.workers},
+        "sizes": {},
+    }
+    for size in [int(size) for size in args.sizes.split(",")]:
+        print(f"[{size}개 파일]")
+        zip_path = corpus_path(args.work_dir, size, args.seed)
+        functions = bench_functions(zip_path, min(args.sample, size), args.repeat)
+        for name, ms in functions.items():
+            print(f"  {name:28s}: {ms:9.3f} ms/파일")
+        end_to_end = bench_end_to_end(zip_path, args.workers)
+        print(f"  전체 {end_to_end['전체(초)']:.2f}초 ({end_to_end['파일당(ms)']:.2f} ms/파일, "
+              f"결과파일생성 {end_to_end['결과파일생성(초)']:.2f}초)")
+        for stage, seconds in end_to_end["단계별합계(초)"].items():
+            print(f"    {stage}: {seconds:.2f}초")
+        current["sizes"][str(size)] = {"functions": functions, "end_to_end": end_to_end}
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            print(compare(current, json.load(f)).to_string(index=False))
+    if args.save_baseline:
+        with open(args.save_baseline, "w", encoding="utf-8") as f:
+            json.dump(current, f, ensure_ascii=False, indent=2)
+        print(f"기준 결과 저장 -> {args.save_baseline}")
+
+
+if __name__ == "__main__":
+    main()
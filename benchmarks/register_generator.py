@@ -0,0 +1,195 @@
+"""
+합성 등기부등본(주요 등기사항 요약) 엑셀 생성기
+
+    python -m benchmarks.register_generator 합성등기부.zip --count 1000 [--seed 0]
+        [--owners 3] [--gapgu 2] [--eulgu 4] [--split-headers 0.3] [--noise 0.2]
+
+소유지분현황(갑구) 공유자 수, 소유권사항(갑구)/저당권사항(을구) 등기 건수를 지정하거나
+(지정하지 않으면 파일마다 무작위), 헤더를 "등기"/"명의인"처럼 나눈 셀과 잡음(빈 서식 행,
+셀 앞뒤 공백, 표 밖의 문구, 붙여 쓴 이름/주민번호 등)을 섞은 파일을 만듦
+"""
+import argparse
+import io
+import random
+import zipfile
+
+from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import Border, Side
+
+NAMES = ["홍길동", "김철수", "이영희", "박민수", "최지우", "정다은", "농업협동조합", "(주)건화", "화성시", "대한민국"]
+ADDRESSES = ["서울특별시 강남구 테헤란로 123", "경기도 화성시 우정읍 조암리 45", "부산광역시 해운대구 우동 1",
+             "충청남도 천안시 동남구 신부동 7 아파트 101동", "경기도 수원시 팔달구 인계동 1111-2 (인계동)"]
+LAND_TYPES = ["답", "전", "대", "임야", "공장용지", "도로", "잡종지", "하천", "과수원", "목장용지"]
+TOWNS = [("우정읍", "조암리"), ("팔탄면", "구장리"), ("남양읍", "화산리"), ("송산면", "사강리")]
+BANKS = ["농협은행", "신한은행", "국민은행", "화성농업협동조합"]
+# 생성 규칙이 바뀌면 올림 (성능 측정 작업 폴더에 남은 이전 합성 파일을 재사용하지 않도록)
+GENERATOR_VERSION = 2
+
+# 헤더 - 나눠 쓴 헤더는 merge_split_headers가 합치는 형태
+SZJ_HEADER = ["등기명의인", "", "(주민)등록번호", "", "최종지분", "", "주  소", "", "순위번호"]
+SZJ_SPLIT_HEADER = ["등기", "명의인", "", "(주민)등록번호", "", "최종", "지분", "주  소", "", "순위번호"]
+ENTRY_HEADER = ["순위번호", "", "등기목적", "", "접수정보", "", "주요등기사항", "", "대상소유자"]
+ENTRY_SPLIT_HEADER = ["순위", "번호", "등기목적", "", "접수정보", "", "주요", "등기사항", "대상소유자"]
+
+
+def _receipt(rnd):
+    return f"{rnd.randint(1990, 2024)}년{rnd.randint(1, 12)}월{rnd.randint(1, 28)}일 제{rnd.randint(100, 99999)}호"
+
+
+def _shares(rnd, owners):
+    if owners == 1:
+        return ["단독소유"]
+    form = rnd.random()
+    if form < 0.6:
+        return [f"{owners}분의 1"] * owners
+    if form < 0.8:
+        return [f"1/{owners}"] * owners
+    # 면적 기준 소수 지분 (합계가 정확히 1이 되도록 마지막 공유자가 나머지)
+    total = rnd.randint(1000, 99999) + rnd.randint(0, 99) / 100
+    parts = [round(total / owners, 2)] * (owners - 1)
+    parts.append(round(total - sum(parts), 2))
+    # 소수점 2자리로 표기해야 반올림 없이 표기한 지분의 합계가 정확히 1
+    return [f"{total:.2f}분의{part:.2f}" for part in parts]
+
+
+def _noisy(rnd, noise, text):
+    # 셀 앞뒤 공백, 줄바꿈 잡음
+    if text and rnd.random() < noise:
+        return rnd.choice([" ", "  ", "\n"]) + text + rnd.choice(["", " ", "\n"])
+    return text
+
+
+def register_rows(seed=0, owners=None, gapgu=None, eulgu=None, split_headers=0.3, noise=0.2):
+    """
+    합성 등기부 한 건의 행 목록 (셀 문자열 리스트의 리스트, 빈 리스트는 빈 행)
+    owners/gapgu/eulgu: 공유자 수, 소유권사항 건수, 저당권사항 건수 (None이면 무작위)
+    split_headers: 구간 헤더를 나눠 쓸 확률, noise: 잡음을 넣을 확률
+    """
+    rnd = random.Random(seed)
+    owners = owners if owners is not None else rnd.choice([1, 1, 2, 3, 4, 6, 10, rnd.randint(11, 40)])
+    gapgu = gapgu if gapgu is not None else rnd.choice([0, 0, 0, 1, 2])
+    eulgu = eulgu if eulgu is not None else rnd.randint(0, 5)
+
+    land_type = rnd.choice(LAND_TYPES)
+    town, village = rnd.choice(TOWNS)
+    lot = f"{'산' if rnd.random() < 0.2 else ''}{rnd.randint(1, 999)}-{rnd.randint(1, 20)}"
+    rows = [
+        ["주요 등기사항 요약 (참고용)"],
+        ["[주의사항]", "", "본 주요 등기사항 요약은 증명서상에 말소되지 않은 사항을 간략히 요약한 것으로 증명서로서의 기능을 제공하지 않습니다."],
+        [f"고유번호 {rnd.randint(1000, 9999)}-{rnd.randint(1996, 2024)}-{rnd.randint(0, 999999):06d}"],
+        [f"[토지] 경기도 화성시 {town} {village} {lot}", "", land_type, "", f"{rnd.randint(100, 99999):,}㎡"],
+        [],
+        ["1. 소유지분현황 ( 갑구 )"],
+    ]
+
+    split = rnd.random() < split_headers
+    rows.append(SZJ_SPLIT_HEADER if split else SZJ_HEADER)
+    for position, share in enumerate(_shares(rnd, owners), start=1):
+        name = rnd.choice(NAMES) + (" (공유자)" if owners > 1 else " (소유자)")
+        jumin = f"{rnd.randint(0, 999999):06d}-*******"
+        address = _noisy(rnd, noise, rnd.choice(ADDRESSES))
+        if split:
+            rows.append([name, "", "", jumin, "", share, "", address, "", str(position)])
+        elif rnd.random() < noise / 2:
+            # 이름과 주민번호를 한 셀에 붙여 쓴 행
+            rows.append([f"{name} {jumin}", "", "", "", share, "", address, "", str(position)])
+        else:
+            rows.append([name, "", jumin, "", share, "", address, "", str(position)])
+
+    rows.append(["2. 소유지분을 제외한 소유권에 관한 사항 ( 갑구 )"])
+    rows.append(ENTRY_SPLIT_HEADER if split else ENTRY_HEADER)
+    if not gapgu:
+        rows.append(["기록사항 없음"])
+    for position in range(1, gapgu + 1):
+        kind = rnd.choice(["가압류", "압류", "가처분"])
+        detail = f"청구금액 금{rnd.randint(1, 500) * 1000000:,}원 채권자 {rnd.choice(NAMES)}"
+        rows.append([str(position), "", kind, "", _receipt(rnd), "", detail, "", rnd.choice(NAMES)])
+
+    rows.append(["3. (근)저당권 및 전세권 등 ( 을구 )"])
+    rows.append(ENTRY_SPLIT_HEADER if split else ENTRY_HEADER)
+    if not eulgu:
+        rows.append(["기록사항 없음"])
+    for position in range(1, eulgu + 1):
+        holder = rnd.choice(NAMES)
+        if rnd.random() < 0.75:
+            amount = f"금{rnd.randint(1, 900) * 1000000:,}원"
+            if rnd.random() < 0.5:
+                # 채권최고액과 금액이 다음 행으로 나뉜 경우
+                rows.append([str(position), "", "근저당권설정", "", _receipt(rnd), "", "채권최고액", "", holder])
+                rows.append(["", "", "", "", "", "", f"{amount} 근저당권자 {rnd.choice(BANKS)}", "", ""])
+            else:
+                rows.append([str(position), "", "근저당권설정", "", _receipt(rnd), "",
+                             f"채권최고액 {amount} 근저당권자 {rnd.choice(BANKS)}", "", holder])
+        else:
+            rows.append([str(position), "", "지상권설정", "", _receipt(rnd), "",
+                         f"지상권자 {rnd.choice(BANKS)}, 목적 건물소유", "", holder])
+
+    rows.append(["[ 참 고 사 항 ]"])
+    rows.append(["가. 등기기록에서 유효한 지분을 가진 소유자 혹은 공유자 현황을 가나다 순으로 표시합니다."])
+    rows.append(["나. 최종지분은 등기명의인이 가진 최종지분이며, 2개 이상의 순위번호에 지분을 가진 경우 그 지분을 합산하였습니다."])
+    if rnd.random() < noise:
+        rows.append([])
+        rows.append(["", "", "", "", "", "", "", "", f"출력일시 {rnd.randint(2020, 2024)}-01-01 12:00"])
+    return rows
+
+
+def register_workbook(seed=0, styled_blank_rows=None, **options):
+    """
+    합성 등기부 엑셀 파일 내용(bytes)
+    styled_blank_rows: 끝에 붙일 서식만 있는 빈 행 수 (None이면 noise 확률로 0 또는 수백 행)
+    나머지 인자는 register_rows와 같음
+    """
+    rows = register_rows(seed, **options)
+    if styled_blank_rows is None:
+        rnd = random.Random(seed + 1)
+        styled_blank_rows = rnd.randint(100, 500) if rnd.random() < options.get("noise", 0.2) / 4 else 0
+
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet("Sheet1")
+    for row in rows:
+        ws.append(row)
+    if styled_blank_rows:
+        thin = Side(style="thin", color="D3D3D3")
+        border = Border(left=thin, right=thin, top=thin, bottom=thin)
+        for _ in range(styled_blank_rows):
+            cells = []
+            for _ in range(9):
+                cell = WriteOnlyCell(ws)
+                cell.border = border
+                cells.append(cell)
+            ws.append(cells)
+    buffer = io.BytesIO()
+    wb.save(buffer)
+    return buffer.getvalue()
+
+
+def write_register_zip(path, count, seed=0, **options):
+    """합성 등기부 count개를 하위 폴더에 나눠 담은 압축파일 생성 (엑셀이 아닌 파일도 하나 포함)"""
+    with zipfile.ZipFile(path, "w", compression=zipfile.ZIP_DEFLATED) as zf:
+        for number in range(count):
+            folder = f"{number % 7:02d}_지역/{number % 3}/" if number % 5 else ""
+            zf.writestr(f"{folder}등기부_{number:05d}.xlsx", register_workbook(seed * 1000003 + number, **options))
+        zf.writestr("목록.txt", "합성 등기부등본")
+    return path
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("output", help="만들 압축파일 경로")
+    parser.add_argument("--count", type=int, default=100)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--owners", type=int, help="공유자 수 (기본: 파일마다 무작위)")
+    parser.add_argument("--gapgu", type=int, help="소유권사항(갑구) 건수 (기본: 파일마다 무작위)")
+    parser.add_argument("--eulgu", type=int, help="저당권사항(을구) 건수 (기본: 파일마다 무작위)")
+    parser.add_argument("--split-headers", type=float, default=0.3, help="헤더를 나눠 쓸 확률")
+    parser.add_argument("--noise", type=float, default=0.2, help="잡음을 넣을 확률")
+    args = parser.parse_args()
+
+    write_register_zip(args.output, args.count, args.seed, owners=args.owners, gapgu=args.gapgu,
+                       eulgu=args.eulgu, split_headers=args.split_headers, noise=args.noise)
+    print(f"{args.count}개 파일 -> {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,197 @@
+import re
+from functools import lru_cache
+
+import numpy as np
+import pandas as pd
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+@lru_cache(maxsize=65536)
+def normalize_exact(text):
+    """정확 매칭용 정규화 - 모든 공백문자 제거 (같은 셀 문자열은 캐시에서 재사용)"""
+    return _WHITESPACE.sub("", text)
+
+
+def normalize_partial(text):
+    """부분 매칭용 정규화 - 띄어쓰기만 제거"""
+    return text.replace(" ", "")
+
+
+class NormalizedSheet:
+    """
+    시트(또는 구간) 셀의 정규화 문자열을 한 번만 계산해 두는 객체
+    여러 키워드 집합으로 같은 시트를 검사할 때 정규화를 반복하지 않음
+    """
+
+    def __init__(self, df):
+        self.index = df.index
+        self.columns = df.columns
+        values = df.to_numpy(dtype=object)
+        self.notna = pd.notna(values)
+        self.text = np.where(self.notna, values, "").astype(str)
+        self._exact = None
+        self._partial = None
+
+    @property
+    def exact(self):
+        if self._exact is None:
+            flat = [normalize_exact(text) for text in self.text.ravel()]
+            self._exact = np.array(flat, dtype=str).reshape(self.text.shape) if flat else self.text
+        return self._exact
+
+    @property
+    def partial(self):
+        if self._partial is None:
+            self._partial = np.char.replace(self.text, " ", "")
+        return self._partial
+
+
+class KeywordMatcher:
+    """
+    키워드 집합을 미리 정규화해 두고 셀/행/열 단위로 매칭하는 객체
+    exact=True이면 keyword_match_exact, False이면 keyword_match_partial과 같은 기준
+    """
+
+    def __init__(self, keywords, exact=True):
+        self.keywords = list(dict.fromkeys(keywords))
+        self.exact = exact
+        normalize = normalize_exact if exact else normalize_partial
+        self.normalized = {kw: normalize(kw) for kw in self.keywords}
+        # 정규화 결과 -> 원래 키워드 (정확 매칭용 역참조)
+        self._lookup = {}
+        for kw, norm in self.normalized.items():
+            self._lookup.setdefault(norm, []).append(kw)
+
+    def _normalize_cell(self, cell):
+        if pd.isnull(cell):
+            return None
+        return normalize_exact(str(cell)) if self.exact else normalize_partial(str(cell))
+
+    def match(self, cell, keyword):
+        """셀 하나가 특정 키워드와 매칭되는지 확인"""
+        text = self._normalize_cell(cell)
+        if text is None:
+            return False
+        norm = self.normalized[keyword]
+        return text == norm if self.exact else norm in text
+
+    def keywords_in(self, cell):
+        """셀 하나와 매칭되는 키워드 목록"""
+        text = self._normalize_cell(cell)
+        if text is None:
+            return []
+        if self.exact:
+            return list(self._lookup.get(text, []))
+        return [kw for kw, norm in self.normalized.items() if norm in text]
+
+    def first_columns(self, row):
+        """
+        행(Series)에서 키워드별로 처음 매칭되는 열 라벨을 찾는 함수
+        {키워드: 열 라벨} 형태로 반환 (매칭되지 않은 키워드는 제외)
+        """
+        found = {}
+        for label, cell in row.items():
+            for kw in self.keywords_in(cell):
+                found.setdefault(kw, label)
+            if len(found) == len(self.keywords):
+                break
+        return found
+
+    def match_array(self, sheet, keyword=None):
+        """
+        시트 전체를 한 번에 검사해 (행 x 열) bool 배열을 반환
+        keyword를 지정하지 않으면 키워드 중 하나라도 매칭되는 셀이 True
+        """
+        if not isinstance(sheet, NormalizedSheet):
+            sheet = NormalizedSheet(sheet)
+        keywords = [keyword] if keyword is not None else self.keywords
+        norms = [self.normalized[kw] for kw in keywords]
+        if self.exact:
+            result = np.isin(sheet.exact, norms)
+        else:
+            result = np.zeros(sheet.text.shape, dtype=bool)
+            for norm in norms:
+                result |= np.char.find(sheet.partial, norm) >= 0
+        return result & sheet.notna
+
+    def matching_rows(self, sheet, keyword=None):
+        """키워드와 매칭되는 셀이 있는 행의 위치(0부터) 배열"""
+        return np.flatnonzero(self.match_array(sheet, keyword).any(axis=1))
+
+    def matching_columns(self, sheet, keyword=None):
+        """키워드와 매칭되는 셀이 있는 열의 위치(0부터) 배열"""
+        return np.flatnonzero(self.match_array(sheet, keyword).any(axis=0))
+
+    def count_per_row(self, sheet):
+        """행마다 매칭되는 서로 다른 키워드 수"""
+        if not isinstance(sheet, NormalizedSheet):
+            sheet = NormalizedSheet(sheet)
+        counts = np.zeros(sheet.text.shape[0], dtype=int)
+        for kw in self.keywords:
+            counts += self.match_array(sheet, kw).any(axis=1)
+        return counts
+
+
+@lru_cache(maxsize=256)
+def get_matcher(keywords, exact=True):
+    """같은 키워드 집합(튜플)의 매처는 한 번만 만들어 재사용"""
+    return KeywordMatcher(keywords, exact)
+
+
+class KeywordTrie:
+    """
+    여러 키워드를 트라이로 묶어 한 번에 찾는 객체 (키워드마다 문자열을 다시 훑지 않음)
+    트라이를 정규식 하나로 바꿔 컴파일하며, 같은 위치에서는 긴 키워드부터 시도
+    (예: '공장용지'와 '공장'이 있으면 '공장용지'를 먼저 매칭)
+    """
+
+    def __init__(self, keywords):
+        self.keywords = [kw for kw in dict.fromkeys(keywords) if kw]
+        trie = {}
+        for kw in self.keywords:
+            node = trie
+            for ch in kw:
+                node = node.setdefault(ch, {})
+            node[""] = kw
+        self.pattern = self._trie_pattern(trie) if self.keywords else "(?!)"
+        self.regex = re.compile(self.pattern)
+        # 겹치는 위치도 모두 찾도록 전방탐색 안에서 캡처
+        self._overlapping = re.compile(f"(?=({self.pattern}))")
+        # 키워드 -> 같은 위치에서 함께 매칭되는 짧은 키워드 (자신 포함, 긴 것부터)
+        self._prefixes = {kw: [other for other in sorted(self.keywords, key=len, reverse=True) if kw.startswith(other)]
+                          for kw in self.keywords}
+
+    @classmethod
+    def _trie_pattern(cls, node):
+        # 자식 문자별로 묶은 정규식 (키워드 끝이 되는 노드는 뒤를 선택사항으로 만들어 긴 매칭 우선)
+        branches = [re.escape(ch) + cls._trie_pattern(child) for ch, child in node.items() if ch]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+        if "" in node:
+            return f"(?:{body})?" if len(branches) > 1 or len(body) > 1 else body + "?"
+        return body
+
+    def search(self, text):
+        """키워드 중 하나라도 문자열에 있는지 확인"""
+        return self.regex.search(text) is not None
+
+    def find_all(self, text):
+        """
+        문자열을 한 번 훑어서 키워드별 시작 위치 리스트를 반환 ({키워드: [위치, ...]}, 없는 키워드는 제외)
+        다른 키워드 안에 들어 있는 키워드(예: '염전' 안의 '전')의 위치도 포함
+        """
+        found = {}
+        for match in self._overlapping.finditer(text):
+            start = match.start()
+            # 같은 위치에서 시작하는 모든 키워드 (가장 긴 매칭의 접두어)
+            for kw in self._prefixes[match.group(1)]:
+                found.setdefault(kw, []).append(start)
+        return found
+
+
+@lru_cache(maxsize=256)
+def get_keyword_trie(keywords):
+    """같은 키워드 집합(튜플)의 트라이는 한 번만 만들어 재사용"""
+    return KeywordTrie(keywords)
@@ -0,0 +1,130 @@
+import hashlib
+import json
+import os
+
+# 헤더 레이아웃 캐시 파일 이름 (추출기 버전별로 따로 저장)
+LAYOUT_FILE_NAME = "header_layouts_v{version}.jsonl"
+# 레이아웃 캐시를 파일로 저장할 폴더를 지정하는 환경변수 (없으면 작업 프로세스 메모리에만 보관)
+LAYOUT_CACHE_DIR_ENV = "REGISTER_LAYOUT_CACHE_DIR"
+# 파일에 저장할 레이아웃 수 상한 (잡음이 많은 헤더가 계속 추가되는 것을 막음)
+MAX_STORED_LAYOUTS = 2000
+
+
+def header_signature(kind, col_keywords, header_row):
+    """
+    헤더 행의 레이아웃 서명 - 열 라벨과 셀 문자열(앞뒤 공백 제거), 찾을 키워드, 추출 방식(kind)의 해시
+    열 찾기는 앞뒤 공백을 무시하므로 서명이 같으면 같은 열 매핑이 나옴
+    """
+    cells = [(type(label).__name__, str(label), str(value).strip()) for label, value in header_row.items()]
+    payload = json.dumps([kind, list(col_keywords), cells], ensure_ascii=False)
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()
+
+
+def _portable(value):
+    # JSON으로 저장해도 같은 값으로 복원되는 열 라벨/매핑인지 (int, str, 그 튜플)
+    if isinstance(value, tuple):
+        return all(_portable(item) for item in value)
+    return type(value) in (int, str, bool)
+
+
+class HeaderLayoutCache:
+    """
+    헤더 서명 -> 열 매핑(col_map 등) 캐시
+    등기부는 소수의 열 배치를 반복해서 쓰므로 처음 보는 배치만 헤더를 분석하고,
+    분석 결과는 path(JSON Lines)에 한 줄씩 추가해 다음 실행과 다른 작업 프로세스에서도 재사용
+    path가 None이면 메모리에만 보관, 파일에는 max_entries개까지만 저장
+    """
+
+    def __init__(self, path=None, max_entries=MAX_STORED_LAYOUTS):
+        self.path = path
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._layouts = {}
+        self._stored = 0
+        self._loaded = path is None
+
+    def _load(self):
+        self._loaded = True
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                lines = f.readlines()
+        except OSError:
+            return
+        for line in lines:
+            try:
+                entry = json.loads(line)
+                self._layouts.setdefault(entry["signature"], _restore(entry["layout"]))
+            except (ValueError, KeyError, TypeError):
+                continue  # 다른 프로세스가 쓰는 중이던 줄 등은 무시
+            self._stored += 1
+
+    def get(self, signature):
+        """저장된 레이아웃 딕셔너리, 없으면 None (적중/미스 횟수 기록)"""
+        if not self._loaded:
+            self._load()
+        layout = self._layouts.get(signature)
+        if layout is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return layout
+
+    def put(self, signature, layout):
+        self._layouts[signature] = layout
+        if self.path is None or self._stored >= self.max_entries:
+            return
+        if not all(_portable(value) for value in _values(layout)):
+            return
+        line = json.dumps({"signature": signature, "layout": _dump(layout)}, ensure_ascii=False) + "\n"
+        try:
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+            # 한 줄을 한 번에 추가하므로 여러 작업 프로세스가 동시에 써도 줄이 섞이지 않음
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(line)
+        except OSError:
+            return
+        self._stored += 1
+
+    def stats(self):
+        """(적중 수, 미스 수)"""
+        return self.hits, self.misses
+
+
+def _values(layout):
+    yield from layout["col_map"].values()
+    for key, value in layout.items():
+        if key != "col_map":
+            yield value
+
+
+def _dump(layout):
+    # 튜플(최종/지분 두 열)은 JSON 배열과 구분되도록 표시해서 저장
+    dumped = dict(layout)
+    dumped["col_map"] = {key: {"tuple": list(value)} if isinstance(value, tuple) else value
+                         for key, value in layout["col_map"].items()}
+    return dumped
+
+
+def _restore(layout):
+    restored = dict(layout)
+    restored["col_map"] = {key: tuple(value["tuple"]) if isinstance(value, dict) else value
+                           for key, value in layout["col_map"].items()}
+    return restored
+
+
+_default_cache = {}
+
+
+def get_layout_cache(version=""):
+    """
+    작업 프로세스마다 하나씩 쓰는 헤더 레이아웃 캐시 (기본은 메모리에만 보관)
+    환경변수 REGISTER_LAYOUT_CACHE_DIR에 폴더를 지정한 경우에만 추출기 버전별 파일에 저장해 다음 실행과 공유
+    """
+    if version not in _default_cache:
+        path = None
+        directory = os.environ.get(LAYOUT_CACHE_DIR_ENV)
+        if directory:
+            path = os.path.join(directory, LAYOUT_FILE_NAME.format(version=version))
+        _default_cache[version] = HeaderLayoutCache(path)
+    return _default_cache[version]
@@ -0,0 +1,107 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from sheet_reader import rows_to_frame, trim_rows
+
+try:
+    import pymupdf
+except ImportError:  # 이전 버전 PyMuPDF는 fitz 이름만 제공
+    try:
+        import fitz as pymupdf
+    except ImportError:  # 선택 설치 패키지
+        pymupdf = None
+
+# 같은 행으로 볼 텍스트 줄의 세로 위치 차이 (pt)
+ROW_TOLERANCE = 3.0
+# 페이지를 나눠 병렬 처리할 때 작업 하나에 맡기는 최소 페이지 수
+MIN_PAGES_PER_JOB = 2
+
+
+def _cell_text(text):
+    """표 셀 문자열 정리 - 셀 안의 줄바꿈은 공백으로 합침"""
+    if not text:
+        return ""
+    return " ".join(line.strip() for line in text.splitlines() if line.strip())
+
+
+def _inside(bbox, rects):
+    x = (bbox[0] + bbox[2]) / 2
+    y = (bbox[1] + bbox[3]) / 2
+    return any(r[0] <= x <= r[2] and r[1] <= y <= r[3] for r in rects)
+
+
+def page_rows(page):
+    """
+    PDF 페이지 하나를 엑셀 시트와 같은 행 목록으로 변환하는 함수
+    표는 표의 행/열 그대로, 표 밖의 텍스트는 같은 높이의 줄끼리 한 행으로 묶고 왼쪽부터 셀로 배치
+    (세로 위치, 셀 문자열 리스트) 목록을 위에서 아래 순서로 반환
+    """
+    rows = []
+    tables = page.find_tables().tables
+    for table in tables:
+        for row, values in zip(table.rows, table.extract()):
+            rows.append((row.bbox[1], [_cell_text(value) for value in values]))
+
+    table_rects = [table.bbox for table in tables]
+    lines = []
+    for block in page.get_text("dict")["blocks"]:
+        for line in block.get("lines", []):
+            text = "".join(span["text"] for span in line["spans"]).strip()
+            if text and not _inside(line["bbox"], table_rects):
+                lines.append((line["bbox"][1], line["bbox"][0], text))
+
+    # 표 밖의 텍스트 줄을 세로 위치로 묶어 행 구성
+    lines.sort()
+    group = []
+    for line in lines:
+        if group and line[0] - group[0][0] > ROW_TOLERANCE:
+            rows.append((group[0][0], [text for _, _, text in sorted(group, key=lambda item: item[1])]))
+            group = []
+        group.append(line)
+    if group:
+        rows.append((group[0][0], [text for _, _, text in sorted(group, key=lambda item: item[1])]))
+
+    rows.sort(key=lambda item: item[0])
+    return rows
+
+
+def _extract_pages(data, start, stop):
+    """start~stop-1 페이지의 행 목록 (프로세스 풀 작업 함수)"""
+    with pymupdf.open(stream=data, filetype="pdf") as doc:
+        rows = []
+        for number in range(start, stop):
+            rows += [cells for _, cells in page_rows(doc[number])]
+        return rows
+
+
+def iter_pdf_rows(source, page_workers=1):
+    """
+    등기부등본 PDF의 모든 페이지를 순서대로 행 목록으로 변환하는 함수
+    page_workers가 2 이상이면 페이지를 나눠 여러 프로세스에서 동시에 추출
+    """
+    if pymupdf is None:
+        raise ImportError("PDF 파일을 읽으려면 PyMuPDF가 필요합니다 (pip install PyMuPDF)")
+    if hasattr(source, "read"):
+        data = source.read()
+    else:
+        with open(source, "rb") as f:
+            data = f.read()
+
+    with pymupdf.open(stream=data, filetype="pdf") as doc:
+        page_count = doc.page_count
+    jobs = min(page_workers or os.cpu_count() or 1, page_count // MIN_PAGES_PER_JOB)
+    if jobs <= 1:
+        return trim_rows(_extract_pages(data, 0, page_count))
+
+    bounds = [page_count * k // jobs for k in range(jobs + 1)]
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        chunks = executor.map(_extract_pages, [data] * jobs, bounds[:-1], bounds[1:])
+        return trim_rows([cells for chunk in chunks for cells in chunk])
+
+
+def read_pdf_frame(source, page_workers=1):
+    """
+    등기부등본 PDF를 read_register_frame과 같은 형태의 데이터프레임으로 읽는 함수
+    PDF에는 엑셀 헤더 행이 없으므로 첫 번째 행부터 데이터로 사용
+    """
+    return rows_to_frame(list(iter_pdf_rows(source, page_workers)), header=False)
@@ -0,0 +1,212 @@
+import importlib.util
+import os
+import time
+import zipfile
+from collections import OrderedDict
+
+import streamlit as st
+
+# 아래 모듈은 표준 라이브러리만 사용하므로 화면을 그리기 전에 불러와도 가벼움
+from zip_ingest import REGISTER_SUFFIXES, upload_digest
+
+# 세션마다 보관할 분석 결과 수 (압축파일 기준, 넘으면 가장 오래 사용하지 않은 결과부터 삭제)
+SESSION_RESULT_LIMIT = 3
+RESULT_FILE_NAME = "등기사항_통합_시트별구성.xlsx"
+# 분석 결과를 필지별로 누적할 SQLite 저장소 경로 (설정하지 않으면 저장/조회 화면을 표시하지 않음)
+STORE_PATH = os.environ.get("REGISTER_STORE_PATH")
+# 열 기반(Parquet/Arrow) 결과 파일은 pyarrow가 설치된 경우에만 선택 가능 (설치 여부만 확인하고 불러오지는 않음)
+COLUMNAR_CHOICES = ["사용 안 함", "parquet", "arrow"] if importlib.util.find_spec("pyarrow") else ["사용 안 함"]
+
+
+def _analysis_options(advanced):
+    """분석 옵션 입력 (advanced가 아니면 기본값 사용)"""
+    if not advanced:
+        return {"max_workers": os.cpu_count() or 1, "use_cache": True, "include_stats": False,
+                "timeout": 0, "max_memory_mb": 0, "columnar": "사용 안 함", "xlsx": True}
+    return {
+        "max_workers": st.number_input("병렬 처리 프로세스 수", min_value=1, max_value=64, value=os.cpu_count() or 1),
+        "use_cache": st.checkbox("이전에 분석한 파일은 저장된 결과 사용 (캐시)", value=True),
+        "include_stats": st.checkbox("결과 파일에 처리통계 시트 포함", value=False),
+        "timeout": st.number_input("파일당 처리시간 한도 (초, 0이면 제한 없음)", min_value=0, value=0),
+        "max_memory_mb": st.number_input("작업 프로세스 메모리 한도 (MB, 0이면 제한 없음)", min_value=0, value=0),
+        "columnar": st.selectbox("Parquet/Arrow 결과 파일 (소유지분현황, 소유권사항, 저당권사항 표를 압축)", COLUMNAR_CHOICES),
+        "xlsx": st.checkbox("엑셀 결과 파일 생성", value=True),
+    }
+
+
+def _run_analysis(uploaded_zip, options, suffixes):
+    """압축파일 분석 후 세션에 보관할 결과 딕셔너리 반환 (pandas, openpyxl은 여기서 처음 불러옴)"""
+    from register_engine import EXTRACTOR_VERSION, run_register_files, summarize_worker_timing
+    from register_export import collect_result_frames, export_result_xlsx
+    from register_profile import (DEFAULT_TOP_N, build_profile_report, failure_frame, layout_cache_summary,
+                                  profile_report_json, slowest_files)
+    from result_cache import ResultCache
+    from zip_ingest import ZipSizeLimitError, iter_zip_members
+
+    started = time.perf_counter()
+    # ✅ 압축을 풀지 않고 하위 폴더(및 내부 zip) 포함 모든 분석 대상 파일을 바로 읽어서 분석
+    try:
+        cache = ResultCache(version=EXTRACTOR_VERSION) if options["use_cache"] else None
+        results = list(run_register_files(iter_zip_members(uploaded_zip, suffixes), max_workers=options["max_workers"],
+                                          cache=cache, timeout=options["timeout"] or None,
+                                          max_memory_mb=options["max_memory_mb"] or None))
+    except (ZipSizeLimitError, zipfile.BadZipFile) as e:
+        st.error(f"압축파일을 읽을 수 없습니다: {e}")
+        st.stop()
+
+    stored = None
+    if STORE_PATH:
+        from register_store import RegisterStore
+
+        with RegisterStore(STORE_PATH) as store:
+            stored = store.upsert_results(results)
+
+    # 파일 순서대로 결과 병합 (실패한 파일은 제외)
+    frames = collect_result_frames(results, include_stats=options["include_stats"])
+    # 결과 파일은 메모리에서 한 번만 만들고, 다시 실행(rerun)되어도 같은 내용을 재사용
+    export_started = time.perf_counter()
+    columnar = options["columnar"] if options["columnar"] != "사용 안 함" else None
+    # 열 기반 파일을 만들지 않으면 엑셀 결과 파일은 항상 생성
+    xlsx = export_result_xlsx(frames) if options["xlsx"] or columnar is None else None
+    columnar_data = None
+    if columnar is not None:
+        from register_columnar import export_result_columnar
+
+        columnar_data = export_result_columnar(frames, columnar)
+    finished = time.perf_counter()
+    return {
+        "frames": frames,
+        "xlsx": xlsx,
+        "columnar": (columnar, columnar_data) if columnar is not None else None,
+        "cache_hits": cache.hits if cache is not None else None,
+        "cache_misses": cache.misses if cache is not None else None,
+        "stored": stored,
+        "worker_timing": summarize_worker_timing(results),
+        "layout_cache": layout_cache_summary(results),
+        "slowest_files": slowest_files(results, DEFAULT_TOP_N),
+        "top_n": DEFAULT_TOP_N,
+        "failures": failure_frame(results),
+        "profile_report": profile_report_json(build_profile_report(results, finished - started, finished - export_started)),
+    }
+
+
+def _show_result(analysis_result, advanced):
+    from register_export import XLSX_MIME
+
+    st.success("✅ 분석 완료! 다운로드 버튼을 클릭하세요.")
+    if analysis_result["cache_hits"] is not None:
+        st.caption(f"캐시 사용: {analysis_result['cache_hits']}개 파일 재사용, {analysis_result['cache_misses']}개 파일 새로 분석")
+    if analysis_result.get("stored") is not None:
+        st.caption(f"누적 저장소에 {analysis_result['stored']}개 필지 저장")
+    if len(analysis_result["failures"]):
+        st.warning(f"{len(analysis_result['failures'])}개 파일을 처리하지 못했습니다. (결과 파일의 처리실패 시트 참고)")
+        st.dataframe(analysis_result["failures"])
+    if advanced:
+        layouts = analysis_result["layout_cache"]
+        if layouts["적중률(%)"] is not None:
+            st.caption(f"헤더 레이아웃 캐시: {layouts['적중']}회 적중, {layouts['미스']}회 새로 분석 (적중률 {layouts['적중률(%)']}%)")
+        with st.expander("작업 프로세스별 처리 시간"):
+            st.dataframe(analysis_result["worker_timing"])
+        with st.expander(f"처리 시간이 가장 긴 파일 (상위 {analysis_result['top_n']}개)"):
+            st.dataframe(analysis_result["slowest_files"])
+            st.download_button("처리통계 보고서 (JSON)", data=analysis_result["profile_report"].encode("utf-8"),
+                               file_name="처리통계.json", mime="application/json")
+    if analysis_result["xlsx"] is not None:
+        st.download_button("📥 결과 다운로드", data=analysis_result["xlsx"], file_name=RESULT_FILE_NAME, mime=XLSX_MIME)
+    if analysis_result.get("columnar"):
+        fmt, data = analysis_result["columnar"]
+        st.download_button(f"📥 {fmt.capitalize()} 결과 다운로드 (.zip)", data=data,
+                           file_name=f"{os.path.splitext(RESULT_FILE_NAME)[0]}.{fmt}.zip", mime="application/zip")
+
+
+def _store_lookup():
+    """누적 저장소에서 등기명의인/주민등록번호/근저당권자/토지주소로 필지를 조회하고 조회한 필지만 내보내기"""
+    columns = st.columns(4)
+    conditions = {
+        "owner": columns[0].text_input("등기명의인"),
+        "registration_number": columns[1].text_input("(주민)등록번호"),
+        "mortgagee": columns[2].text_input("근저당권자"),
+        "address": columns[3].text_input("토지주소 (일부)"),
+    }
+    if st.button("조회") and any(conditions.values()):
+        from register_export import collect_result_frames, export_result_xlsx
+        from register_store import RegisterStore
+
+        with RegisterStore(STORE_PATH) as store:
+            parcels = store.find_parcels(**conditions)
+            stored = store.parcel_results(parcels["필지키"])
+        xlsx = export_result_xlsx(collect_result_frames(stored))
+        # 다운로드 클릭으로 다시 실행돼도 조회 결과 유지
+        st.session_state["store_lookup"] = (parcels, xlsx)
+
+    lookup = st.session_state.get("store_lookup")
+    if lookup:
+        from register_export import XLSX_MIME
+
+        parcels, xlsx = lookup
+        st.caption(f"{len(parcels)}개 필지")
+        st.dataframe(parcels)
+        if len(parcels):
+            st.download_button("📥 조회한 필지 내보내기", data=xlsx, file_name="등기사항_조회결과.xlsx", mime=XLSX_MIME)
+
+
+def render_app(password, title, description="", upload_label="📁 .zip 파일을 업로드하세요 (내부에 .xlsx 또는 .pdf 파일 포함)",
+               suffixes=REGISTER_SUFFIXES, advanced=True, page_title="(주)건화 등기부등본 Excel 통합기"):
+    """
+    등기부등본 통합분석 화면 (앱 파일마다 비밀번호, 제목, 분석 대상 확장자, 옵션 표시 여부만 다르게 호출)
+    비밀번호/업로드 화면은 Streamlit만으로 그리고, 분석 엔진(pandas, openpyxl 등)은
+    분석을 시작하거나 이전 결과를 표시할 때 처음 불러옴
+    advanced가 False이면 병렬 처리/캐시/한도 옵션과 처리통계를 숨기고 기본값 사용
+    환경변수 REGISTER_STORE_PATH를 설정하면 분석 결과를 그 저장소에 누적하고 조회 화면을 표시
+    """
+    st.set_page_config(page_title=page_title, layout="wide")
+
+    entered = st.text_input('비밀번호를 입력하세요', type='password')
+    if entered != password:
+        st.warning('올바른 비밀번호를 입력하세요.')
+        st.stop()
+
+    st.title(title)
+    if description:
+        st.markdown(description)
+    if STORE_PATH:
+        with st.expander("🔎 누적 저장소 조회 (다시 분석하지 않고 이전 결과에서 검색)"):
+            _store_lookup()
+
+    uploaded_zip = st.file_uploader(upload_label, type=["zip"])
+    options = _analysis_options(advanced)
+    run_button = st.button("분석 시작")
+
+    # 분석 결과는 업로드한 압축파일의 해시로 세션에 보관 -> 다운로드 클릭 등으로 다시 실행돼도 재분석하지 않음
+    session_results = st.session_state.setdefault("analysis_results", OrderedDict())
+    if not uploaded_zip or not (run_button or session_results):
+        return
+
+    from register_engine import EXTRACTOR_VERSION
+
+    # 같은 업로드 파일(file_id)은 해시를 한 번만 계산
+    upload_id = getattr(uploaded_zip, "file_id", None)
+    last_digest = st.session_state.get("upload_digest")
+    if upload_id is not None and last_digest and last_digest[0] == upload_id:
+        digest = last_digest[1]
+    else:
+        digest = upload_digest(uploaded_zip)
+        st.session_state["upload_digest"] = (upload_id, digest)
+    # 결과는 압축파일 해시로만 보관하고, 분석 옵션은 결과와 함께 저장해 비교
+    # (옵션만 바꿔도 이전 결과와 다운로드 버튼은 그대로 표시)
+    result_key = (digest, EXTRACTOR_VERSION, tuple(suffixes))
+    option_values = tuple(sorted(options.items()))
+
+    analysis_result = session_results.get(result_key)
+    if run_button and (analysis_result is None or analysis_result["options"] != option_values):
+        analysis_result = _run_analysis(uploaded_zip, options, suffixes)
+        analysis_result["options"] = option_values
+        session_results[result_key] = analysis_result
+        while len(session_results) > SESSION_RESULT_LIMIT:
+            session_results.popitem(last=False)
+
+    if analysis_result:
+        session_results.move_to_end(result_key)
+        if analysis_result["options"] != option_values:
+            st.info("분석 옵션이 바뀌었습니다. 아래는 이전 옵션으로 분석한 결과이며, 새 옵션을 적용하려면 '분석 시작'을 다시 누르세요.")
+        _show_result(analysis_result, advanced)
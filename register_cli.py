@@ -0,0 +1,149 @@
+"""
+등기부등본 통합분석 배치 실행 (Streamlit 없이 명령행에서 실행)
+
+사용 예:
+    python register_cli.py 등기부_1.zip 등기부_폴더/ -j 16 -o 결과.xlsx
+    python register_cli.py /data/nightly --no-cache -o /data/out/통합.xlsx
+    python register_cli.py 등기부.zip --stats-sheet --report 처리통계.json --top 10
+    python register_cli.py 등기부.zip --store 등기부.sqlite   (결과를 저장소에 누적, 조회는 register_lookup.py)
+    python register_cli.py 등기부.zip --columnar parquet --no-xlsx   (엑셀 대신 Parquet 표 3개를 압축해 저장)
+
+입력은 압축파일(.zip), 폴더(하위 폴더 포함), 개별 .xlsx/.pdf 파일을 섞어서 지정할 수 있음
+"""
+import argparse
+import os
+import sys
+import time
+import zipfile
+
+from layout_cache import LAYOUT_CACHE_DIR_ENV
+from register_columnar import COLUMNAR_FORMATS, columnar_available, export_result_columnar
+from register_engine import EXTRACTOR_VERSION, run_register_files, summarize_worker_timing
+from register_export import collect_result_frames, export_result_xlsx
+from register_profile import (DEFAULT_TOP_N, build_profile_report, layout_cache_summary, profile_report_json,
+                              slowest_files)
+from result_cache import DEFAULT_CACHE_DIR, ResultCache
+from sheet_reader import DEFAULT_READER, SHEET_READERS
+from zip_ingest import ZipSizeLimitError, iter_input_files
+
+DEFAULT_OUTPUT = "등기사항_통합_시트별구성.xlsx"
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="등기부등본 엑셀/PDF 파일을 분석해 하나의 통합 엑셀 파일로 저장합니다.")
+    parser.add_argument("inputs", nargs="+", help="압축파일(.zip), 폴더 또는 .xlsx/.pdf 파일 경로")
+    parser.add_argument("-j", "--workers", type=int, default=os.cpu_count() or 1,
+                        help="병렬 처리 프로세스 수 (기본: CPU 코어 수)")
+    parser.add_argument("--page-workers", type=int, default=1,
+                        help="PDF 한 파일의 페이지를 나눠 처리할 프로세스 수 (파일 수가 적고 PDF가 클 때 사용)")
+    parser.add_argument("-o", "--output", default=DEFAULT_OUTPUT, help=f"결과 엑셀 파일 경로 (기본: {DEFAULT_OUTPUT})")
+    parser.add_argument("--reader", choices=sorted(SHEET_READERS), default=DEFAULT_READER,
+                        help=f"시트 읽기 방식 (기본: {DEFAULT_READER})")
+    parser.add_argument("--no-cache", action="store_true", help="이전 분석 결과 캐시를 사용하지 않음")
+    parser.add_argument("--cache-dir", default=DEFAULT_CACHE_DIR, help="결과 캐시 디렉터리")
+    parser.add_argument("--layout-cache-dir", default=os.environ.get(LAYOUT_CACHE_DIR_ENV),
+                        help="헤더 레이아웃 캐시를 저장해 다음 실행에서 재사용할 폴더 (기본: 저장하지 않음)")
+    parser.add_argument("--timeout", type=float, default=0,
+                        help="파일 하나의 처리시간 한도(초, 예: 300), 넘으면 처리실패로 분류 (기본: 0 = 제한 없음)")
+    parser.add_argument("--max-memory", type=float, default=0,
+                        help="작업 프로세스 메모리 한도(MB), 넘으면 처리실패로 분류 (기본: 0 = 제한 없음, 리눅스만 지원)")
+    parser.add_argument("--stats-sheet", action="store_true", help="결과 엑셀에 파일별 처리통계 시트 추가")
+    parser.add_argument("--report", help="처리통계 JSON 보고서를 저장할 경로")
+    parser.add_argument("--top", type=int, default=DEFAULT_TOP_N, help=f"처리 시간이 긴 파일을 출력할 개수 (기본: {DEFAULT_TOP_N})")
+    parser.add_argument("--columnar", choices=sorted(COLUMNAR_FORMATS),
+                        help="소유지분현황/소유권사항/저당권사항 표를 Parquet 또는 Arrow 파일로 압축해 함께 저장 (pyarrow 필요)")
+    parser.add_argument("--columnar-output", help="열 기반 결과 압축파일 경로 (기본: 결과 파일 이름.<형식>.zip)")
+    parser.add_argument("--no-xlsx", action="store_true", help="스타일 적용 엑셀 결과 파일을 만들지 않음 (--columnar와 함께 사용)")
+    parser.add_argument("--store", help="분석 결과를 필지별로 누적할 SQLite 저장소 경로 (register_lookup.py로 조회)")
+    parser.add_argument("--progress-every", type=int, default=500, help="진행 상황을 출력할 파일 간격 (0이면 출력 안 함)")
+    args = parser.parse_args(argv)
+    if args.workers < 1 or args.page_workers < 1:
+        parser.error("--workers, --page-workers는 1 이상이어야 합니다.")
+    if args.no_xlsx and not args.columnar:
+        parser.error("--no-xlsx는 --columnar와 함께 사용해야 합니다.")
+    if args.columnar and not columnar_available():
+        parser.error("--columnar를 사용하려면 pyarrow를 설치해야 합니다.")
+    if args.timeout < 0 or args.max_memory < 0:
+        parser.error("--timeout, --max-memory는 0 이상이어야 합니다.")
+    return args
+
+
+def log(message):
+    print(message, file=sys.stderr, flush=True)
+
+
+def write_file(path, data):
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    with open(path, "wb") as f:
+        f.write(data)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    cache = None if args.no_cache else ResultCache(args.cache_dir, version=EXTRACTOR_VERSION)
+    if args.layout_cache_dir:
+        # 작업 프로세스는 환경변수로 레이아웃 캐시 폴더를 전달받음
+        os.environ[LAYOUT_CACHE_DIR_ENV] = args.layout_cache_dir
+
+    started = time.perf_counter()
+    results = []
+    failed = []
+    try:
+        items = iter_input_files(args.inputs)
+        for result in run_register_files(items, max_workers=args.workers, reader=args.reader, cache=cache,
+                                         page_workers=args.page_workers, timeout=args.timeout or None,
+                                         max_memory_mb=args.max_memory or None):
+            results.append(result)
+            if result["error"]:
+                failed.append(result)
+            if args.progress_every and len(results) % args.progress_every == 0:
+                log(f"{len(results)}개 파일 처리 ({time.perf_counter() - started:.1f}초)")
+    except (FileNotFoundError, ZipSizeLimitError, zipfile.BadZipFile) as e:
+        log(f"입력 파일을 읽을 수 없습니다: {e}")
+        return 2
+
+    if not results:
+        log("분석할 .xlsx/.pdf 파일이 없습니다.")
+        return 1
+
+    frames = collect_result_frames(results, include_stats=args.stats_sheet)
+    export_started = time.perf_counter()
+    outputs = []
+    if not args.no_xlsx:
+        write_file(args.output, export_result_xlsx(frames))
+        outputs.append(args.output)
+    if args.columnar:
+        columnar_output = args.columnar_output or f"{os.path.splitext(args.output)[0]}.{args.columnar}.zip"
+        write_file(columnar_output, export_result_columnar(frames, args.columnar))
+        outputs.append(columnar_output)
+    export_seconds = time.perf_counter() - export_started
+    if args.report:
+        report = build_profile_report(results, time.perf_counter() - started, export_seconds, args.top)
+        write_file(args.report, profile_report_json(report).encode("utf-8"))
+
+    if args.store:
+        from register_store import RegisterStore
+
+        with RegisterStore(args.store) as store:
+            updated = store.upsert_results(results)
+            log(f"저장소에 {updated}개 필지 저장 (전체 {store.count()}개 필지) -> {args.store}")
+
+    log(summarize_worker_timing(results).to_string(index=False))
+    if args.top > 0:
+        columns = ["파일", "처리결과", "처리시간(초)", "입력행수", "최대메모리(MB)"]
+        log(f"처리 시간이 가장 긴 파일 {args.top}개:")
+        log(slowest_files(results, args.top)[columns].to_string(index=False))
+    if cache is not None:
+        log(f"캐시 사용: {cache.hits}개 파일 재사용, {cache.misses}개 파일 새로 분석")
+    layouts = layout_cache_summary(results)
+    if layouts["적중률(%)"] is not None:
+        log(f"헤더 레이아웃 캐시: {layouts['적중']}회 적중, {layouts['미스']}회 새로 분석 (적중률 {layouts['적중률(%)']}%)")
+    for result in failed:
+        log(f"실패: {result['file']} - {result['error']}")
+    log(f"{len(results)}개 파일 중 {len(results) - len(failed)}개 분석 완료 "
+        f"({time.perf_counter() - started:.1f}초) -> {', '.join(outputs)}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,87 @@
+import io
+import zipfile
+
+import pandas as pd
+
+try:
+    import pyarrow as pa
+    import pyarrow.ipc
+    import pyarrow.parquet
+except ImportError:  # 선택 설치 패키지
+    pa = None
+
+from register_export import SHEET_NAMES
+
+# 열 기반 결과 형식 -> 파일 확장자 (pyarrow가 설치된 경우에만 사용 가능)
+COLUMNAR_FORMATS = {"parquet": ".parquet", "arrow": ".arrow"}
+COLUMNAR_MIME = "application/zip"
+# 결과 표 이름 (압축파일 안의 파일 이름, SHEET_NAMES 순서)
+TABLE_NAMES = ["소유지분현황", "소유권사항", "저당권사항"]
+# 숫자로 저장하는 열 (나머지 열은 문자열, 빈 값은 null)
+FLOAT_COLUMNS = ["최종지분 수치화", "토지면적", "지분면적"]
+INT_COLUMNS = ["채권최고액"]
+
+
+def columnar_available():
+    return pa is not None
+
+
+def _string_array(series):
+    return pa.array([None if value is None or (not isinstance(value, str) and pd.isna(value)) else str(value)
+                     for value in series], type=pa.string())
+
+
+def _numeric_values(series):
+    # 쉼표가 들어간 문자열 숫자도 숫자로, 해석할 수 없는 값은 null
+    text = series.astype(object).where(series.notna(), None).map(lambda v: v.replace(",", "") if isinstance(v, str) else v)
+    return pd.to_numeric(text, errors="coerce")
+
+
+def result_table(df):
+    """
+    결과 데이터프레임을 열 dtype을 지정한 Arrow 표로 변환하는 함수
+    FLOAT_COLUMNS는 float64, INT_COLUMNS는 int64(빈 값은 null), 나머지는 문자열로 저장하며
+    엑셀 결과처럼 내부용 그룹정보 열은 제외
+    """
+    df = df.drop(columns=["그룹정보"], errors="ignore")
+    arrays = []
+    for col in df.columns:
+        if col in FLOAT_COLUMNS:
+            arrays.append(pa.array(_numeric_values(df[col]).astype("float64"), type=pa.float64(), from_pandas=True))
+        elif col in INT_COLUMNS:
+            arrays.append(pa.array(_numeric_values(df[col]).astype("Int64"), type=pa.int64(), from_pandas=True))
+        else:
+            arrays.append(_string_array(df[col]))
+    return pa.Table.from_arrays(arrays, names=[str(col) for col in df.columns])
+
+
+def _table_bytes(table, fmt):
+    buffer = io.BytesIO()
+    if fmt == "parquet":
+        pyarrow.parquet.write_table(table, buffer, compression="zstd")
+    else:
+        with pyarrow.ipc.new_stream(buffer, table.schema) as writer:
+            writer.write_table(table)
+    return buffer.getvalue()
+
+
+def export_result_columnar(frames, fmt="parquet"):
+    """
+    prepare_result_frames 결과 중 소유지분현황, 소유권사항, 저당권사항 표를
+    Parquet 파일 또는 Arrow IPC 스트림(fmt: 'parquet' | 'arrow')으로 만들어 하나의 압축파일(bytes)로 반환
+    데이터가 없는 표는 넣지 않음 (pyarrow가 없으면 RuntimeError)
+    """
+    if pa is None:
+        raise RuntimeError("Parquet/Arrow 결과 파일을 만들려면 pyarrow를 설치해야 합니다.")
+    if fmt not in COLUMNAR_FORMATS:
+        raise ValueError(f"지원하지 않는 형식입니다: {fmt} ({', '.join(COLUMNAR_FORMATS)} 중 선택)")
+    buffer = io.BytesIO()
+    # Parquet은 이미 압축되어 있으므로 그대로 저장, Arrow 스트림은 zip에서 압축
+    compression = zipfile.ZIP_STORED if fmt == "parquet" else zipfile.ZIP_DEFLATED
+    with zipfile.ZipFile(buffer, "w", compression) as zf:
+        for sheetname, table_name in zip(SHEET_NAMES, TABLE_NAMES):
+            df = frames.get(sheetname)
+            if df is None:
+                continue
+            zf.writestr(table_name + COLUMNAR_FORMATS[fmt], _table_bytes(result_table(df), fmt))
+    return buffer.getvalue()
@@ -0,0 +1,1430 @@
+import io
+import os
+import re
+import time
+from collections import deque
+from fractions import Fraction
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from keyword_matcher import KeywordTrie, get_keyword_trie, get_matcher, normalize_exact
+from layout_cache import get_layout_cache, header_signature
+from pdf_reader import read_pdf_frame
+from register_profile import new_profile, peak_memory_mb, reset_peak_memory, timed_stage
+from share_parser import format_fixed, parse_share, parse_share_column
+from sheet_reader import read_register_frame
+from watchdog_pool import BudgetExceeded, WatchdogPool
+
+# 파일별 추출 결과가 달라지는 변경을 하면 올려서 이전 캐시를 무효화
+EXTRACTOR_VERSION = "4"
+
+
+def merge_adjacent_cells(row_series, max_gap=3):
+    """
+    인접한 셀들을 병합하여 하나의 의미있는 단위로 만드는 함수
+    데이터 행에서는 더 신중하게 병합
+    """
+    merged_row = row_series.copy()
+    row_dict = row_series.to_dict()
+    
+    # 빈 셀이 아닌 셀들의 인덱스를 찾기
+    non_empty_indices = [idx for idx, val in row_dict.items() if str(val).strip()]
+    
+    # 데이터가 너무 적거나 많으면 병합하지 않음 (헤더가 아닌 경우)
+    if len(non_empty_indices) < 2 or len(non_empty_indices) > 10:
+        return merged_row
+    
+    # 연속된 셀들을 그룹화 (더 엄격한 조건)
+    groups = []
+    current_group = []
+    
+    for i, idx in enumerate(non_empty_indices):
+        if not current_group:
+            current_group = [idx]
+        else:
+            # 이전 인덱스와의 거리가 2 이하면 같은 그룹 (더 엄격하게)
+            if idx - current_group[-1] <= 2:
+                current_group.append(idx)
+            else:
+                # 새로운 그룹 시작
+                groups.append(current_group)
+                current_group = [idx]
+    
+    if current_group:
+        groups.append(current_group)
+    
+    # 각 그룹 내의 셀들을 병합 (더 신중하게)
+    for group in groups:
+        if len(group) > 1 and len(group) <= 3:  # 너무 많은 셀은 병합하지 않음
+            # 그룹 내 모든 값을 연결
+            merged_value = ""
+            for idx in group:
+                val = str(row_dict.get(idx, "")).strip()
+                if val:
+                    if merged_value and not merged_value.endswith((" ", "-", "/")):
+                        merged_value += " "
+                    merged_value += val
+            
+            # 첫 번째 인덱스에 병합된 값 저장
+            merged_row[group[0]] = merged_value
+            
+            # 나머지 인덱스는 빈 값으로 설정
+            for idx in group[1:]:
+                merged_row[idx] = ""
+    
+    return merged_row
+
+def merge_dataframe_cells(df, is_header_row=False):
+    """
+    데이터프레임에 셀 병합 로직 적용 (merge_adjacent_cells를 모든 행에 적용한 것과 같은 결과)
+    행마다 반복하지 않고 구간 전체의 빈 셀 마스크와 그룹을 NumPy로 한 번에 계산
+    """
+    if df.empty:
+        return df
+    
+    values = df.to_numpy(dtype=object)
+    text = np.char.strip(values.astype(str))
+    non_empty = text != ""
+    
+    # 빈 셀이 아닌 셀이 2~10개인 행만 병합 대상
+    counts = non_empty.sum(axis=1)
+    eligible = (counts >= 2) & (counts <= 10)
+    rows, cols = np.nonzero(non_empty & eligible[:, None])
+    if len(rows) == 0:
+        return df.copy()
+    
+    # 같은 행에서 열 번호 차이가 2 이하로 이어지는 셀들을 한 그룹으로 묶음
+    labels = np.asarray(df.columns)[cols]
+    starts = np.ones(len(rows), dtype=bool)
+    starts[1:] = (rows[1:] != rows[:-1]) | (labels[1:] - labels[:-1] > 2)
+    group_ids = np.cumsum(starts) - 1
+    group_sizes = np.bincount(group_ids)
+    mergeable = (group_sizes >= 2) & (group_sizes <= 3)  # 너무 많은 셀은 병합하지 않음
+    in_merge = mergeable[group_ids]
+    if not in_merge.any():
+        return df.copy()
+    
+    # 그룹 내 값 연결: 앞 값이 '-', '/'로 끝나면 붙이고 아니면 띄어쓰기로 연결
+    cell_text = text[rows, cols].astype(object)
+    separators = np.full(len(rows), " ", dtype=object)
+    separators[starts] = ""
+    ends_joined = np.char.endswith(text[rows, cols], "-") | np.char.endswith(text[rows, cols], "/")
+    separators[1:][ends_joined[:-1] & ~starts[1:]] = ""
+    pieces = (separators + cell_text)[in_merge]
+    first_positions = np.flatnonzero(starts[in_merge])
+    merged_values = np.add.reduceat(pieces, first_positions)
+    
+    merged = values.copy()
+    first = starts & in_merge
+    merged[rows[first], cols[first]] = [str(value) for value in merged_values]
+    rest = in_merge & ~starts
+    merged[rows[rest], cols[rest]] = ""
+    return pd.DataFrame(merged, index=df.index, columns=df.columns, dtype=object)
+
+def trim_after_reference_note(df):
+    for i, row in df.iterrows():
+        row_text = "".join(str(cell) for cell in row)
+        normalized = re.sub(r"\s+", "", row_text)
+        if "참고사항" in normalized or "참고" in normalized or "비고" in normalized:
+            return df.iloc[:i]
+    return df
+
+def extract_identifier(df):
+    """
+    파일에서 토지/건물 식별자를 추출하는 함수
+    """
+    for i in range(len(df)):
+        row = df.iloc[i]
+        row_text = " ".join(str(cell) for cell in row if pd.notna(cell))
+        if "고유번호" in row_text:
+            for j in range(i+1, min(i+10, len(df))):
+                content = " ".join(str(cell) for cell in df.iloc[j] if pd.notna(cell))
+                if content.strip().startswith(("[토지]", "[건물]")):
+                    return content.strip()
+            break
+    
+    # 고유번호 이후에 [토지] 또는 [건물]이 없는 경우, 전체 데이터에서 찾기
+    for i in range(len(df)):
+        row_text = " ".join(str(cell) for cell in df.iloc[i] if pd.notna(cell))
+        if row_text.strip().startswith(("[토지]", "[건물]")):
+            return row_text.strip()
+            
+    return "알수없음"
+
+def convert_jibun_to_decimal(jibun_text):
+    """
+    최종지분 텍스트를 소수점 형태로 변환하는 함수
+    예: "2분의 1" -> 0.5, "1/2" -> 0.5, "50%" -> 0.5, "단독소유" -> 1
+    해석은 share_parser.parse_share(정확한 분수, 결과 캐시)를 사용
+    """
+    if not jibun_text or pd.isna(jibun_text):
+        return None
+    
+    share = parse_share(str(jibun_text))
+    return float(share) if share is not None else None
+
+def keyword_match_partial(cell, keyword):
+    if pd.isnull(cell): return False
+    return keyword.replace(" ", "") in str(cell).replace(" ", "")
+
+def keyword_match_exact(cell, keyword):
+    if pd.isnull(cell): return False
+    return normalize_exact(str(cell)) == normalize_exact(keyword)
+
+def merge_split_headers(header_row):
+    """분리된 헤더를 병합하는 함수 - 개선된 버전"""
+    # 셀 병합을 하지 않고 원본 헤더를 그대로 사용
+    merged_row = header_row.copy()
+    
+    # 기존 특정 키워드 병합 로직만 적용 (인접 셀 병합은 제외)
+    split_patterns = {
+        "주소": ["주", "소"],
+        "등기명의인": ["등기", "명의인"],
+        "주민등록번호": ["주민", "등록번호"],
+        "최종지분": ["최종", "지분"],
+        "순위번호": ["순위", "번호"],
+        "등기목적": ["등기", "목적"],
+        "접수정보": ["접수", "정보"],
+        "주요등기사항": ["주요", "등기사항"],
+        "대상소유자": ["대상", "소유자"]
+    }
+    
+    for target_keyword, split_parts in split_patterns.items():
+        found_indices = []
+        for part in split_parts:
+            for idx, cell_value in merged_row.items():
+                cell_str = str(cell_value).strip()
+                if cell_str == part:
+                    found_indices.append(idx)
+                    break
+        
+        if len(found_indices) == len(split_parts):
+            if all(found_indices[i+1] - found_indices[i] <= 2 for i in range(len(found_indices)-1)):
+                merged_row[found_indices[0]] = target_keyword
+                for idx in found_indices[1:]:
+                    merged_row[idx] = ""
+    
+    return merged_row
+
+def enhanced_keyword_match(header_row, keyword, max_distance=2):
+    """인접한 셀들을 고려한 키워드 매칭 - 개선된 버전"""
+    # 먼저 정확한 매칭, 다음으로 부분 매칭 시도
+    for exact in (True, False):
+        found = get_matcher((keyword,), exact).first_columns(header_row)
+        if keyword in found:
+            return found[keyword]
+    return match_split_keyword(header_row, keyword, max_distance)
+
+def match_split_keyword(header_row, keyword, max_distance=2):
+    """글자 단위로 나뉘어 인접 셀에 흩어진 키워드를 찾는 함수"""
+    # 분리된 키워드 매칭 시도 (더 엄격하게)
+    keyword_chars = list(keyword.replace(" ", ""))
+    if len(keyword_chars) <= 1:
+        return None
+    
+    for start_idx, cell in header_row.items():
+        if str(cell).strip() == keyword_chars[0]:
+            # 첫 글자가 매칭되면 다음 글자들을 인접 셀에서 찾기
+            current_text = str(cell).strip()
+            current_idx = start_idx
+            
+            for i in range(1, len(keyword_chars)):
+                found_next = False
+                # 최대 max_distance까지 떨어진 셀에서 다음 글자 찾기
+                for offset in range(1, max_distance + 1):
+                    next_idx = current_idx + offset
+                    if next_idx in header_row:
+                        next_cell = str(header_row[next_idx]).strip()
+                        if next_cell == keyword_chars[i]:
+                            current_text += next_cell
+                            current_idx = next_idx
+                            found_next = True
+                            break
+                
+                if not found_next:
+                    break
+            
+            # 전체 키워드가 매칭되었는지 확인
+            if current_text == keyword.replace(" ", ""):
+                return start_idx
+    
+    return None
+
+def extract_section_range(df, start_kw, end_kw_list, match_fn):
+    df = df.fillna("")
+    df.columns = range(df.shape[1])
+    start_idx, end_idx = None, len(df)
+    for i, row in df.iterrows():
+        if any(match_fn(cell, start_kw) for cell in row):
+            start_idx = i + 1
+            break
+    if start_idx is None:
+        return pd.DataFrame(), False
+    for i in range(start_idx, len(df)):
+        row = df.iloc[i]
+        if any(any(match_fn(cell, end_kw) for cell in row) for end_kw in end_kw_list):
+            end_idx = i
+            break
+    section = df.iloc[start_idx:end_idx].copy()
+    is_empty = section.replace("", pd.NA).dropna(how="all").empty
+    return section if not is_empty else pd.DataFrame([["기록없음"]]), not is_empty
+
+# 등기부등본 구간 정의: 구간명 -> (시작 키워드, 종료 키워드 목록, 매칭 방식)
+REGISTER_SECTIONS = {
+    "소유지분현황": ("소유지분현황", ["소유권", "저당권"], "partial"),
+    "소유권사항": ("소유권.*사항", ["저당권"], "exact"),
+    "저당권사항": ("3.(근)저당권및전세권등(을구)", ["참고", "비고", "총계", "전산자료"], "exact"),
+}
+
+def row_cell_texts(df):
+    """행마다 비어 있지 않은(NaN이 아닌) 셀의 문자열 리스트"""
+    return [[str(cell) for cell in row if pd.notna(cell)] for row in df.itertuples(index=False, name=None)]
+
+def build_section_index(df, sections=REGISTER_SECTIONS, row_cells=None):
+    """
+    시트를 한 번만 훑어서 모든 구간의 시작/끝 행과 기준 행 위치를 찾는 함수
+    구간마다 extract_section_range를 호출한 것과 같은 위치를 반환하며,
+    고유번호 행, 주요 등기사항 요약 행, [토지]/[건물] 행도 함께 기록
+    row_cells: row_cell_texts(df) 결과가 이미 있으면 다시 만들지 않고 사용
+    """
+    # 키워드는 한 번만 정규화 (partial: 공백 제거 후 끝 키워드를 트라이로, exact: 모든 공백문자 제거)
+    specs = []
+    for name, (start_kw, end_kws, mode) in sections.items():
+        if mode == "partial":
+            specs.append((name, True, start_kw.replace(" ", ""), get_keyword_trie(tuple(kw.replace(" ", "") for kw in end_kws))))
+        else:
+            specs.append((name, False, normalize_exact(start_kw), {normalize_exact(kw) for kw in end_kws}))
+    
+    starts = {}
+    index = {"sections": {}, "identifier_row": None, "summary_row": None, "land_rows": []}
+    
+    if row_cells is None:
+        row_cells = row_cell_texts(df)
+    for i, texts in enumerate(row_cells):
+        row_text = " ".join(texts)
+        
+        # 기준 행 기록
+        if index["identifier_row"] is None and "고유번호" in row_text:
+            index["identifier_row"] = i
+        if index["summary_row"] is None and "약" in row_text:
+            if "주요 등기사항 요약" in row_text or "주요등기사항요약" in re.sub(r"\s+", "", row_text):
+                index["summary_row"] = i
+        stripped = row_text.strip()
+        if stripped.startswith(("[토지]", "[건물]")):
+            index["land_rows"].append((i, stripped))
+        
+        # 구간 시작/끝 검사 (셀 정규화는 행마다 한 번만)
+        cells = [text for text in texts if text]
+        partial_cells = exact_cells = None
+        for name, is_partial, start_kw, end_kws in specs:
+            if name in index["sections"]:
+                continue
+            if is_partial:
+                if partial_cells is None:
+                    partial_cells = [text.replace(" ", "") for text in cells]
+            elif exact_cells is None:
+                exact_cells = {normalize_exact(text) for text in cells}
+            
+            if name not in starts:
+                if (any(start_kw in text for text in partial_cells) if is_partial else start_kw in exact_cells):
+                    starts[name] = i + 1
+            elif i >= starts[name]:
+                if is_partial:
+                    matched = any(end_kws.search(text) for text in partial_cells)
+                else:
+                    matched = not end_kws.isdisjoint(exact_cells)
+                if matched:
+                    index["sections"][name] = (starts[name], i)
+    
+    # 끝 키워드가 없는 구간은 시트 끝까지
+    for name, start in starts.items():
+        index["sections"].setdefault(name, (start, len(df)))
+    return index
+
+def identifier_from_index(index):
+    """
+    build_section_index 결과에서 토지/건물 식별자를 구하는 함수 (extract_identifier와 같은 결과)
+    """
+    land_rows = index["land_rows"]
+    anchor = index["identifier_row"]
+    if anchor is not None:
+        for i, text in land_rows:
+            if anchor < i < anchor + 10:
+                return text
+    
+    # 고유번호 이후에 [토지] 또는 [건물]이 없는 경우, 전체 데이터에서 찾기
+    if land_rows:
+        return land_rows[0][1]
+    return "알수없음"
+
+def slice_section(df, index, name):
+    """
+    build_section_index로 찾은 구간을 잘라내는 함수 (extract_section_range와 같은 반환값)
+    """
+    if name not in index["sections"]:
+        return pd.DataFrame(), False
+    start_idx, end_idx = index["sections"][name]
+    section = df.iloc[start_idx:end_idx].fillna("")
+    section.columns = range(section.shape[1])
+    is_empty = section.replace("", pd.NA).dropna(how="all").empty
+    return section if not is_empty else pd.DataFrame([["기록없음"]]), not is_empty
+
+def header_layout(kind, header_row, col_keywords, resolve):
+    """
+    헤더 행의 열 매핑을 레이아웃 캐시에서 찾고, 처음 보는 배치만 resolve(header_row, col_keywords)로 분석
+    같은 배치의 헤더(앞뒤 공백만 다른 경우 포함)는 파일과 실행이 달라도 분석 결과를 재사용
+    """
+    cache = get_layout_cache(EXTRACTOR_VERSION)
+    signature = header_signature(kind, col_keywords, header_row)
+    layout = cache.get(signature)
+    if layout is None:
+        layout = resolve(header_row, col_keywords)
+        cache.put(signature, layout)
+    return layout
+
+def _resolve_named_layout(header_row, col_keywords):
+    """extract_named_cols의 열 매핑을 헤더 행에서 새로 찾는 함수 (레이아웃 캐시에 없을 때만 호출)"""
+    merged_header = merge_split_headers(header_row)
+
+    # 정확 매칭 -> 부분 매칭 -> 분리된 키워드 순으로 열 찾기 (키워드 집합은 한 번만 검사)
+    exact_cols = get_matcher(tuple(col_keywords), True).first_columns(merged_header)
+    partial_cols = get_matcher(tuple(col_keywords), False).first_columns(merged_header)
+    col_map = {}
+    for target in col_keywords:
+        if target in exact_cols:
+            col_map[target] = exact_cols[target]
+        elif target in partial_cols:
+            col_map[target] = partial_cols[target]
+        else:
+            col_idx = match_split_keyword(merged_header, target)
+            if col_idx is not None:
+                col_map[target] = col_idx
+
+    # 최종지분 특별 처리 (기존 로직 유지하되 더 정확하게)
+    if "최종지분" not in col_map:
+        idx_최종 = None
+        idx_지분 = None
+        for idx, val in merged_header.items():
+            val_str = str(val).strip()
+            if val_str == "최종":
+                idx_최종 = idx
+            elif val_str == "지분":
+                idx_지분 = idx
+        
+        if idx_최종 is not None and idx_지분 is not None and abs(idx_최종 - idx_지분) <= 2:
+            col_map["최종지분"] = (min(idx_최종, idx_지분), max(idx_최종, idx_지분))
+
+    # 최종지분이 한 열이면 다음 열의 헤더가 비어 있을 때만 그 열 값을 이어 붙임
+    share_next_blank = False
+    if isinstance(col_map.get("최종지분"), int):
+        share_next_blank = not str(merged_header.get(col_map["최종지분"] + 1, "")).strip()
+    return {"col_map": col_map, "share_next_blank": share_next_blank}
+
+# 소유지분현황(갑구)에서 필요한 열을 추출
+def extract_named_cols(section, col_keywords):
+    if section.empty:
+        return pd.DataFrame([["기록없음"]])
+
+    # 셀 병합 적용 (헤더와 데이터 구분)
+    section = merge_dataframe_cells(section)
+
+    # 열 매핑은 헤더 배치별로 한 번만 분석 (header_layout)
+    layout = header_layout("named", section.iloc[0], col_keywords, _resolve_named_layout)
+    col_map = layout["col_map"]
+
+    rows = []
+    for i in range(1, len(section)):
+        row = section.iloc[i]
+        row_dict = {}
+        
+        for key in col_keywords:
+            if key == "최종지분":
+                if isinstance(col_map.get("최종지분"), tuple):
+                    idx1, idx2 = col_map["최종지분"]
+                    val1 = str(row.get(idx1, "")).strip()
+                    val2 = str(row.get(idx2, "")).strip()
+                    if val1 and val2:
+                        row_dict[key] = val1 + val2
+                    else:
+                        row_dict[key] = val1 or val2
+                elif isinstance(col_map.get("최종지분"), int):
+                    idx = col_map["최종지분"]
+                    val1 = str(row.get(idx, "")).strip()
+                    # 인접 셀 확인은 헤더가 비어있을 때만
+                    val2 = ""
+                    if (idx + 1) in row and layout["share_next_blank"]:
+                        val2 = str(row.get(idx + 1, "")).strip()
+                    if val1 and val2:
+                        row_dict[key] = val1 + val2
+                    else:
+                        row_dict[key] = val1
+                else:
+                    row_dict[key] = ""
+            elif key in col_map:
+                col_idx = col_map[key]
+                cell_value = row.get(col_idx, "")
+                row_dict[key] = str(cell_value).strip() if pd.notna(cell_value) else ""
+            else:
+                row_dict[key] = ""
+        
+        # 데이터 정리: 등기명의인에 다른 정보가 섞여있는 경우 분리
+        if "등기명의인" in row_dict:
+            owner_text = str(row_dict["등기명의인"]).strip()
+            
+            # 주민등록번호 분리
+            if "(주민)등록번호" in col_keywords:
+                jumin = extract_jumin_number(owner_text)
+                if jumin:
+                    row_dict["(주민)등록번호"] = jumin
+                    owner_text = owner_text.replace(jumin, "").strip()
+            
+            # 지분 정보 분리
+            if "최종지분" in col_keywords and not row_dict.get("최종지분"):
+                extracted_jibun = extract_jibun(owner_text)
+                if extracted_jibun:
+                    row_dict["최종지분"] = extracted_jibun
+                    owner_text = owner_text.replace(extracted_jibun, "").strip()
+            
+            # 주소 정보 분리
+            if "주소" in col_keywords and not row_dict.get("주소"):
+                if is_address_pattern(owner_text):
+                    # 이름과 주소를 분리하려고 시도
+                    parts = owner_text.split()
+                    if len(parts) > 1:
+                        # 첫 번째 부분이 이름이고 나머지가 주소일 가능성
+                        possible_name = parts[0]
+                        possible_address = " ".join(parts[1:])
+                        if is_address_pattern(possible_address):
+                            row_dict["등기명의인"] = possible_name.replace(" ", "")  # 이름 띄어쓰기 제거
+                            row_dict["주소"] = possible_address
+                            continue
+            
+            # 정리된 등기명의인 설정 (띄어쓰기 제거)
+            row_dict["등기명의인"] = owner_text.replace(" ", "")
+            
+        rows.append(row_dict)
+    
+    return pd.DataFrame(rows)
+
+def find_keyword_header(section, col_keywords, max_search_rows=15):
+    section = section.fillna("").astype(str)
+    counts = get_matcher(tuple(col_keywords), True).count_per_row(section.iloc[:max_search_rows])
+    for i, match_count in enumerate(counts):
+        if match_count >= 3:
+            return i, section.iloc[i]
+    return None, None
+
+def find_col_index(header_row, keyword):
+    return get_matcher((keyword,), True).first_columns(header_row).get(keyword)
+
+def _resolve_precise_layout(header_row, col_keywords):
+    """extract_precise_named_cols의 열 매핑을 헤더 행에서 새로 찾는 함수 (레이아웃 캐시에 없을 때만 호출)"""
+    header_row = merge_split_headers(header_row)
+    exact_cols = get_matcher(tuple(col_keywords), True).first_columns(header_row)
+    # fallback to partial match if exact failed
+    partial_cols = get_matcher(tuple(col_keywords), False).first_columns(header_row)
+    col_map = {}
+    for key in col_keywords:
+        if key in exact_cols:
+            col_map[key] = exact_cols[key]
+        elif key in partial_cols:
+            col_map[key] = partial_cols[key]
+    return {"col_map": col_map}
+
+# 소유권사항 (갑구)와 에서 필요한 열 추출
+def extract_precise_named_cols(section, col_keywords):
+    # 셀 병합을 하지 않고 원본 섹션 사용
+    section = section.copy()
+    # always use first row as header
+    col_map = header_layout("precise", section.iloc[0], col_keywords, _resolve_precise_layout)["col_map"]
+    start_row = 1
+
+    if not col_map:
+       # 모든 컬럼에 대해 빈 값을 생성하고, 첫번째 컬럼에만 "기록없음" 표시
+       result = pd.DataFrame(columns=col_keywords)
+       result.loc[0] = [""] * len(col_keywords)
+       result.iloc[0, 0] = "기록없음"
+       return result
+
+    rows = []
+    for i in range(start_row, len(section)):
+        row = section.iloc[i]
+        row_dict = {}
+        for key in col_keywords:
+            if key in col_map:
+                # 해당 열의 정확한 인덱스에서만 값 가져오기
+                col_idx = col_map[key]
+                if col_idx < len(row):
+                    cell_value = row.iloc[col_idx]
+                    row_dict[key] = str(cell_value).strip() if pd.notna(cell_value) else ""
+                else:
+                    row_dict[key] = ""
+            else:
+                row_dict[key] = ""
+        rows.append(row_dict)
+    return pd.DataFrame(rows)
+# 저당권사항 정리에 쓰는 패턴
+_AMOUNT_PATTERN = re.compile(r"(금[\d,]+원)")
+_MAX_CLAIM_PATTERN = re.compile(r"채권최고액[^금]*금\s*([\d,]+)\s*원")
+_MORTGAGE_HOLDER_PATTERN = re.compile(r'(근저당권자\s*[:：]?\s*([^,\n]*))')
+_SURFACE_HOLDER_PATTERN = re.compile(r'(지상권자\s*[:：]?\s*([^,\n]*))')
+
+def _first_amounts(df):
+    """행마다 셀 순서대로 처음 나오는 금액(금...원) 문자열, 없으면 None (배열 반환)"""
+    found = np.full(len(df), None, dtype=object)
+    for col in df.columns:
+        missing = pd.isna(found)
+        if not missing.any():
+            break
+        values = df[col].to_numpy(dtype=object)
+        cells = _text_series([str(value) if pd.notnull(value) else None for value in values])
+        extracted = cells.str.extract(_AMOUNT_PATTERN, expand=False).to_numpy(dtype=object)
+        hit = missing & pd.notna(extracted)
+        found[hit] = extracted[hit]
+    return found
+
+def merge_same_row_if_amount_separated(df):
+    """
+    주요등기사항에 채권최고액이 있으면 현재 행과 다음 행에서 처음 나오는 금액(금...원)을 붙이는 함수
+    (금액이 이미 주요등기사항에 있으면 그대로 둠)
+    셀별 금액을 열 단위로 한 번에 찾은 뒤 다음 행 값은 shift로 가져옴
+    """
+    df = df.copy()
+    if len(df) < 2:
+        return df
+    main = np.array([str(value) for value in df["주요등기사항"]], dtype=object)
+    has_claim = np.array(_contains(_text_series(main), "채권최고액"), dtype=bool)
+    has_claim[-1] = False  # 마지막 행은 다음 행이 없으므로 제외
+    if not has_claim.any():
+        return df
+
+    row_amounts = _first_amounts(df)
+    next_amounts = np.append(row_amounts[1:], None)
+    amounts = np.where(pd.notna(row_amounts), row_amounts, next_amounts)
+    append = has_claim & pd.notna(amounts)
+    append[append] = [amount not in text for amount, text in zip(amounts[append], main[append])]
+    if append.any():
+        updated = df["주요등기사항"].to_numpy(dtype=object).copy()
+        updated[append] = [text + " " + amount for text, amount in zip(main[append], amounts[append])]
+        df["주요등기사항"] = pd.Series(updated, index=df.index, dtype=object).astype(df["주요등기사항"].dtype)
+    return df
+
+def parse_max_claim_amounts(main):
+    """
+    주요등기사항 열에서 채권최고액(원)을 정수로 추출하는 함수 (채권최고액 표기가 없는 행은 None)
+    예: "채권최고액 금433,000,000원" -> 433000000
+    """
+    amounts = np.full(len(main), None, dtype=object)
+    if not len(main):
+        return amounts
+    digits = _text_series(main.to_numpy(dtype=object)).str.extract(_MAX_CLAIM_PATTERN, expand=False)
+    digits = digits.str.replace(",", "", regex=False).to_numpy(dtype=object)
+    found = np.array([isinstance(value, str) and value != "" for value in digits], dtype=bool)
+    amounts[found] = [int(value) for value in digits[found]]
+    return amounts
+
+def is_jumin_number(text):
+    """
+    주민등록번호 패턴을 확인하는 함수
+    예: 123456-1234567 또는 123456-*******
+    """
+    if not isinstance(text, str):
+        return False
+    
+    # 주민등록번호 패턴 (숫자6자리-숫자또는*)
+    pattern = re.compile(r'\d{6}-[\d\*]+')
+    return bool(re.search(pattern, text))
+
+def extract_jumin_number(text):
+    """
+    문자열에서 주민등록번호 패턴을 추출
+    """
+    if not isinstance(text, str):
+        return ""
+    
+    pattern = re.compile(r'\d{6}-[\d\*]+')
+    match = re.search(pattern, text)
+    return match.group(0) if match else ""
+
+def is_jibun_pattern(text):
+    """
+    최종지분 패턴을 확인하는 함수
+    예: 1/2, 50%, 3분의 1, 공유1/3, 단독소유 등
+    """
+    if not isinstance(text, str):
+        return False
+    
+    # 텍스트가 비어있으면 지분 패턴 아님
+    if not text.strip():
+        return False
+    
+    # "단독소유" 키워드 확인
+    if "단독소유" in text or "단독" in text:
+        return True
+    
+    # 분수 패턴 (예: 1/2, 1/3, 공유1/3 등)
+    pattern1 = re.compile(r'(?:공유)?[\d]+[/][\d]+')
+    # 퍼센트 패턴 (예: 50%, 33.3% 등)
+    pattern2 = re.compile(r'[\d]+[.]?[\d]*\s*%')
+    # '분의' 패턴 (예: 3분의 1, 2분의 1 등)
+    pattern3 = re.compile(r'[\d]+\.?[\d]*\s*분\s*의\s*[\d]+\.?[\d]*')
+    # 분의 패턴 - 띄어쓰기 없는 경우 (예: 10139.94분의845.0298)
+    pattern4 = re.compile(r'[\d]+\.?[\d]*분의[\d]+\.?[\d]*')
+    
+    return (bool(re.search(pattern1, text)) or 
+            bool(re.search(pattern2, text)) or 
+            bool(re.search(pattern3, text)) or 
+            bool(re.search(pattern4, text)))
+
+def is_address_pattern(text):
+    """
+    주소 패턴을 확인하는 함수
+    """
+    if not isinstance(text, str):
+        return False
+    
+    # "단독소유" 키워드가 있으면 주소가 아님
+    if "단독소유" in text or "단독" in text:
+        return False
+    
+    # 주소 키워드(ADDRESS_KEYWORDS)를 한 번에 검색
+    text_no_space = _WHITESPACE_PATTERN.sub('', text)
+    return _ADDRESS_TRIE.search(text_no_space)
+
+def extract_jibun(text):
+    """
+    문자열에서 지분 패턴 추출
+    """
+    if not isinstance(text, str):
+        return ""
+    
+    # "단독소유" 키워드 확인
+    if "단독소유" in text:
+        return "단독소유"
+    elif "단독" in text and len(text.strip()) < 10:  # "단독" 단어만 있고 길이가 짧은 경우
+        return "단독소유"
+    
+    # 분수 패턴 (예: 1/2, 1/3, 공유1/3 등)
+    pattern1 = re.compile(r'(?:공유)?[\d]+[/][\d]+')
+    # 퍼센트 패턴 (예: 50%, 33.3% 등)
+    pattern2 = re.compile(r'[\d]+[.]?[\d]*\s*%')
+    # '분의' 패턴 - 띄어쓰기 있는 경우 (예: 3분의 1, 10139.94분 의 845.0298)
+    pattern3 = re.compile(r'[\d]+\.?[\d]*\s*분\s*의\s*[\d]+\.?[\d]*')
+    # 분의 패턴 - 띄어쓰기 없는 경우 (예: 10139.94분의845.0298)
+    pattern4 = re.compile(r'[\d]+\.?[\d]*분의[\d]+\.?[\d]*')
+    
+    # 각 패턴 순서대로 확인
+    match1 = re.search(pattern1, text)
+    if match1:
+        return match1.group(0)
+    
+    match2 = re.search(pattern2, text)
+    if match2:
+        return match2.group(0)
+    
+    match3 = re.search(pattern3, text)
+    if match3:
+        return match3.group(0)
+    
+    match4 = re.search(pattern4, text)
+    if match4:
+        return match4.group(0)
+    
+    return ""
+
+def extract_ownership_type(owner_name):
+    """
+    등기명의인 문자열에서 소유구분 정보(소유자, 공유자 등)를 추출하는 함수
+    """
+    if not isinstance(owner_name, str):
+        return "", owner_name
+    
+    # (소유자), (공유자) 패턴 찾기
+    pattern = r'\((소유자|공유자)\)'
+    match = re.search(pattern, owner_name)
+    
+    if match:
+        ownership_type = match.group(1)  # '소유자' 또는 '공유자' 추출
+        clean_name = owner_name.replace(match.group(0), "").strip()  # 패턴 제거
+        return ownership_type, clean_name
+    else:
+        return "", owner_name
+
+# 소유지분현황 열 단위 정리에 쓰는 패턴 (행별 함수와 같은 정규식)
+_OWNERSHIP_TYPE_PATTERN = re.compile(r'\((소유자|공유자)\)')
+_JUMIN_PATTERN = re.compile(r'(\d{6}-[\d\*]+)')
+# extract_jibun의 지분 패턴 (우선순위 순서)
+_JIBUN_PATTERNS = [
+    re.compile(r'((?:공유)?[\d]+[/][\d]+)'),
+    re.compile(r'([\d]+[.]?[\d]*\s*%)'),
+    re.compile(r'([\d]+\.?[\d]*\s*분\s*의\s*[\d]+\.?[\d]*)'),
+    re.compile(r'([\d]+\.?[\d]*분의[\d]+\.?[\d]*)'),
+]
+_JIBUN_ANY_PATTERN = re.compile("|".join(p.pattern[1:-1] for p in _JIBUN_PATTERNS))
+# 주소에 흔히 포함되는 키워드
+ADDRESS_KEYWORDS = ['시', '도', '군', '구', '읍', '면', '동', '로', '길', '아파트', '빌라', '번지']
+_ADDRESS_TRIE = KeywordTrie(ADDRESS_KEYWORDS)
+_ADDRESS_KEYWORD_PATTERN = _ADDRESS_TRIE.regex
+_WHITESPACE_PATTERN = re.compile(r'\s+')
+
+def _text_series(values):
+    return pd.Series(values, dtype=object)
+
+def _contains(series, text):
+    """문자열 포함 여부를 bool 배열로 반환 (문자열이 아닌 값은 False)"""
+    return series.str.contains(text, regex=False).to_numpy(dtype=bool, na_value=False)
+
+def _matches(series, pattern):
+    return series.str.contains(pattern).to_numpy(dtype=bool, na_value=False)
+
+def _lengths(series):
+    return series.str.len().to_numpy(dtype=float, na_value=np.nan)
+
+def is_jibun_pattern_series(series):
+    """is_jibun_pattern의 열 단위 버전 (문자열 열, bool 배열 반환)"""
+    has_text = (series.str.strip() != "").to_numpy(dtype=bool)
+    return has_text & (_contains(series, "단독") | _matches(series, _JIBUN_ANY_PATTERN))
+
+def is_address_pattern_series(series):
+    """is_address_pattern의 열 단위 버전 (문자열 열, bool 배열 반환)"""
+    compact = series.str.replace(_WHITESPACE_PATTERN, "", regex=True)
+    return ~_contains(series, "단독") & _matches(compact, _ADDRESS_KEYWORD_PATTERN)
+
+def _is_sole_owner(series):
+    """'단독소유'가 있거나 '단독'이 있는 짧은 문자열(10자 미만)인지 - 단독소유로 취급하는 기준"""
+    return _contains(series, "단독소유") | (_contains(series, "단독") & (_lengths(series.str.strip()) < 10))
+
+def extract_jibun_series(series):
+    """extract_jibun의 열 단위 버전 - 패턴 우선순위대로 처음 찾은 지분 문자열, 없으면 빈 문자열 (배열 반환)"""
+    found = np.full(len(series), None, dtype=object)
+    missing = np.ones(len(series), dtype=bool)
+    for pattern in _JIBUN_PATTERNS:
+        extracted = series.str.extract(pattern, expand=False).to_numpy(dtype=object)
+        hit = missing & pd.notna(extracted)
+        found[hit] = extracted[hit]
+        missing &= ~hit
+        if not missing.any():
+            break
+    found[missing] = ""
+    found[_is_sole_owner(series)] = "단독소유"
+    return found
+
+def clean_ownership_rows(szj_df):
+    """
+    소유지분현황 행의 등기명의인, 주민번호, 최종지분, 주소를 열 단위로 정리하는 함수
+    1) 소유구분/주민번호 분리와 주소-지분 교환, 2) 주소의 단독소유 이동, 3) 최종지분 정리 순서로 처리하며
+    각 단계는 앞 단계가 끝난 값을 기준으로 판단 (extract_named_cols 결과처럼 모든 값이 문자열이라고 가정)
+    """
+    szj_df = szj_df.copy()
+    szj_df["소유구분"] = ""
+    if szj_df.empty:
+        return szj_df
+    dtypes = szj_df.dtypes
+    names = np.array(szj_df["등기명의인"], dtype=object)
+    jumins = np.array(szj_df["(주민)등록번호"], dtype=object)
+    shares = np.array(szj_df["최종지분"], dtype=object)
+    addresses = np.array(szj_df["주소"], dtype=object)
+    owner_types = np.array(szj_df["소유구분"], dtype=object)
+
+    # 1-1) 소유구분 추출 - (소유자)/(공유자) 표기를 떼고 띄어쓰기 제거
+    name_series = _text_series(names)
+    has_name = pd.notna(names)
+    found_types = name_series.str.extract(_OWNERSHIP_TYPE_PATTERN, expand=False).to_numpy(dtype=object)
+    owner_types[has_name] = np.where(pd.notna(found_types), found_types, "")[has_name]
+    clean_names = [
+        name.replace(f"({owner_type})", "") if isinstance(owner_type, str) else name
+        for name, owner_type in zip(names, found_types)
+    ]
+    clean_names = _text_series(clean_names).str.strip().str.replace(" ", "", regex=False).to_numpy(dtype=object)
+    new_names = names.copy()
+    new_names[has_name] = clean_names[has_name]
+
+    # 1-2) 등기명의인에 주민번호가 있으면 분리 (원래 등기명의인 기준)
+    found_jumins = name_series.str.extract(_JUMIN_PATTERN, expand=False).to_numpy(dtype=object)
+    has_jumin = has_name & pd.notna(found_jumins)
+    jumins[has_jumin] = found_jumins[has_jumin]
+    new_names[has_jumin] = [
+        name.replace(jumin, "").strip().replace(" ", "")
+        for name, jumin in zip(names[has_jumin], found_jumins[has_jumin])
+    ]
+
+    # 1-3) 주소에 있는 지분을 최종지분으로 이동
+    address_series = _text_series(addresses).str.strip()
+    share_series = _text_series(shares).str.strip()
+    address_text = address_series.to_numpy(dtype=object)
+    share_text = share_series.to_numpy(dtype=object)
+    new_shares = shares.copy()
+    new_addresses = addresses.copy()
+    address_jibun = extract_jibun_series(address_series)
+    moved = pd.notna(addresses) & is_jibun_pattern_series(address_series) & (address_jibun != "")
+    longer = _lengths(_text_series(address_jibun)) > _lengths(share_series)
+    replace_share = moved & ((share_text == "") | longer)
+    new_shares[replace_share] = address_jibun[replace_share]
+    new_addresses[moved] = [
+        address.replace(jibun, "").strip()
+        for address, jibun in zip(address_text[moved], address_jibun[moved])
+    ]
+
+    # 1-4) 최종지분에 주소가 들어 있으면 주소로 이동
+    swapped = (pd.notna(shares) & is_address_pattern_series(share_series)
+               & ((address_text == "") | (_lengths(share_series) > _lengths(address_series))))
+    new_addresses[swapped] = share_text[swapped]
+    new_shares[swapped] = ""
+
+    # 2) 주소에 '단독'이 있고 최종지분에 단독소유가 없으면 이동
+    address_series = _text_series(new_addresses).str.strip()
+    sole = _contains(address_series, "단독") & ~_contains(_text_series(new_shares), "단독소유")
+    if sole.any():
+        new_shares[sole] = "단독소유"
+        new_addresses[sole] = address_series[sole].str.replace(r'단독(?:소유)?', '', regex=True).str.strip().to_numpy(dtype=object)
+
+    # 3) 최종지분에서 지분 표기만 남기고, 주소라면 주소 열로 옮김
+    share_series = _text_series(new_shares).str.strip()
+    share_text = share_series.to_numpy(dtype=object)
+    has_share = pd.notna(new_shares) & (share_text != "")
+    sole = _is_sole_owner(share_series)
+    share_jibun = extract_jibun_series(share_series)
+    has_jibun = share_jibun != ""
+    not_jibun = has_share & ~sole & ~has_jibun & is_address_pattern_series(share_series)
+    fill_address = not_jibun & (_text_series(new_addresses).str.strip() == "").to_numpy(dtype=bool)
+    new_addresses[fill_address] = share_text[fill_address]
+    new_shares[has_share & sole] = "단독소유"
+    new_shares[has_share & ~sole & has_jibun] = share_jibun[has_share & ~sole & has_jibun]
+    new_shares[not_jibun] = ""
+
+    for col, values in (("등기명의인", new_names), ("소유구분", owner_types), ("(주민)등록번호", jumins),
+                        ("최종지분", new_shares), ("주소", new_addresses)):
+        szj_df[col] = pd.Series(values, index=szj_df.index, dtype=object).astype(dtypes[col])
+    return szj_df
+
+def add_share_area_columns(szj_df, land_type, land_area):
+    """
+    지목, 토지면적 열과 최종지분으로 계산한 지분면적, 최종지분 수치화 열을 추가하는 함수
+    지분면적은 정확한 분수로 계산한 뒤 소수점 4자리 문자열로 표시, 변환할 수 없는 값은 None
+    """
+    szj_df = szj_df.copy()
+    szj_df["지목"] = land_type
+    szj_df["토지면적"] = land_area
+    shares, _ = parse_share_column(szj_df["최종지분"], exact=True)
+    has_share = np.array([share is not None for share in shares], dtype=bool)
+
+    area_value = None
+    try:
+        if pd.notna(land_area) and land_area:
+            area_value = Fraction(str(land_area).replace(',', '').strip())
+    except (ValueError, ZeroDivisionError):
+        pass  # 변환 중 오류 발생시 지분면적은 None
+    share_areas = np.full(len(szj_df), None, dtype=object)
+    if area_value is not None:
+        share_areas[has_share] = [format_fixed(area_value * share) for share in shares[has_share]]
+    szj_df["지분면적"] = pd.Series(share_areas, index=szj_df.index, dtype=object)
+
+    numeric = np.full(len(szj_df), None, dtype=object)
+    numeric[has_share] = [float(share) for share in shares[has_share]]
+    szj_df["최종지분 수치화"] = pd.Series(numeric, index=szj_df.index, dtype=object)
+    return szj_df
+
+# 지목 - 더 구체적이고 긴 단어가 먼저 검사되도록 정렬
+LAND_TYPES = ["공장용지", "잡종지", "염전", "도로", "임야", "유지", "하천", "구거", "제방", "양어장","전", "답", "대","광천지","수도용지","제방","염전","과수원","목장용지","학교용지","종교용지","주차장","주유소","창고용지","철도용지","공원","묘지","체육용지","유원지","사적지","잡종지"]
+# 면적을 찾을 행을 고르는 지목 (시트 전체 검색용)
+AREA_LAND_TYPES = ["염전", "도로", "임야", "유지", "답", "전", "대", "공장용지", "잡종지", "하천", "구거", "제방", "양어장"]
+# 지목 키워드는 트라이로 한 번에 찾고, 우선순위는 LAND_TYPES 순서로 판단
+_LAND_TYPE_TRIE = KeywordTrie(LAND_TYPES)
+_AREA_LAND_TYPE_TRIE = KeywordTrie(AREA_LAND_TYPES)
+_HANGUL_PATTERN = re.compile(r'[가-힣]')
+_AREA_PATTERN = re.compile(r'(\d[\d,\.]*)\s*[㎡m²]')
+# 부동산 고유번호 (예: 1234-5678-123456)
+_UNIQUE_NUMBER_PATTERN = re.compile(r'\d{4}-\d{4}-\d{6}')
+
+class RegisterDocument:
+    """
+    등기부 파일 하나의 시트와 여러 추출 함수가 함께 쓰는 파생 정보를 보관하는 객체
+    행 문자열은 처음 필요할 때 한 번만 만들고, 구간 위치, 식별자, 요약 행, 지목, 토지면적,
+    잘라낸 구간도 처음 사용할 때 계산해 재사용
+    """
+
+    def __init__(self, df, section_index=None):
+        self.df = df
+        self._section_index = section_index
+        self._row_cells = None
+        self._row_texts = None
+        self._identifier = None
+        self._unique_number = None
+        self._land_type = None
+        self._land_area = None
+        self._sections = {}
+
+    @property
+    def row_cells(self):
+        """행마다 NaN이 아닌 셀의 문자열 리스트"""
+        if self._row_cells is None:
+            self._row_cells = row_cell_texts(self.df)
+        return self._row_cells
+
+    @property
+    def row_texts(self):
+        """행마다 NaN이 아닌 셀을 띄어쓰기로 이은 문자열"""
+        if self._row_texts is None:
+            self._row_texts = [" ".join(texts) for texts in self.row_cells]
+        return self._row_texts
+
+    @property
+    def section_index(self):
+        """build_section_index 결과 (구간 위치와 기준 행)"""
+        if self._section_index is None:
+            self._section_index = build_section_index(self.df, row_cells=self.row_cells)
+        return self._section_index
+
+    @property
+    def summary_row(self):
+        """주요 등기사항 요약 행 위치 (없으면 None)"""
+        return self.section_index["summary_row"]
+
+    @property
+    def identifier(self):
+        """토지/건물 식별자 ([토지] ... 행, 없으면 '알수없음')"""
+        if self._identifier is None:
+            self._identifier = identifier_from_index(self.section_index)
+        return self._identifier
+
+    @property
+    def unique_number(self):
+        """고유번호 행의 부동산 고유번호 (없으면 '')"""
+        if self._unique_number is None:
+            row = self.section_index["identifier_row"]
+            found = _UNIQUE_NUMBER_PATTERN.search(self.row_texts[row]) if row is not None else None
+            self._unique_number = found.group(0) if found else ""
+        return self._unique_number
+
+    @property
+    def land_type(self):
+        """지목 (요약 행 -> 식별자 -> 시트 전체 순서로 검색, 없으면 '')"""
+        if self._land_type is None:
+            self._land_type = _find_land_type(self)
+        return self._land_type
+
+    @property
+    def land_area(self):
+        """토지면적 문자열 (쉼표 제거, 없으면 '')"""
+        if self._land_area is None:
+            self._land_area = _find_land_area(self)
+        return self._land_area
+
+    def section(self, name):
+        """slice_section과 같은 (구간 데이터프레임, 구간 존재 여부) - 구간마다 한 번만 잘라냄"""
+        if name not in self._sections:
+            self._sections[name] = slice_section(self.df, self.section_index, name)
+        return self._sections[name]
+
+    def summary_land_texts(self):
+        """주요 등기사항 요약 행 다음 9행 중 [토지]가 있는 행 문자열"""
+        summary_row = self.summary_row
+        if summary_row is None:
+            return []
+        texts = self.row_texts[summary_row + 1:summary_row + 10]
+        return [text for text in texts if "[토지]" in text]
+
+def _is_hangul_at(text, pos):
+    return 0 <= pos < len(text) and "가" <= text[pos] <= "힣"
+
+def _is_land_type_word(text, pos, land_type):
+    # 앞뒤가 한글이 아닌 단어인지 (문자열 처음/끝 포함)
+    return not _is_hangul_at(text, pos - 1) and not _is_hangul_at(text, pos + len(land_type))
+
+def _follows_land_tag(text, pos, land_type):
+    # [토지] 다음에 한글 없이 이어지고, 뒤에 한글이 붙지 않은 지목인지
+    tag = text.rfind("[토지]", 0, pos)
+    if tag < 0 or _HANGUL_PATTERN.search(text, tag + 4, pos):
+        return False
+    return not _is_hangul_at(text, pos + len(land_type))
+
+def _near_land_tag(text, hits, land_type, distance):
+    # 처음 나오는 지목 위치가 [토지]에서 distance자 이내인지
+    return abs(hits[land_type][0] - text.find("[토지]")) < distance
+
+def _land_type_near_tag(text, distance, hits=None):
+    # [토지]에서 distance자 이내에 있는 지목 (앞뒤가 한글이 아닌 단어 우선)
+    if hits is None:
+        hits = _LAND_TYPE_TRIE.find_all(text)
+    for lt in LAND_TYPES:
+        if lt in hits and any(_is_land_type_word(text, pos, lt) for pos in hits[lt]):
+            return lt
+    for lt in LAND_TYPES:
+        if lt in hits and _near_land_tag(text, hits, lt, distance):
+            return lt
+    return ""
+
+def _find_land_type(doc):
+    # 1. 주요 등기사항 요약 섹션에서 토지 지목 추출 시도 (최우선)
+    for row_text in doc.summary_land_texts():
+        hits = _LAND_TYPE_TRIE.find_all(row_text)
+        for lt in LAND_TYPES:
+            if lt not in hits:
+                continue
+            # [토지] 다음에 오는 지목 정보 찾기
+            if any(_follows_land_tag(row_text, pos, lt) for pos in hits[lt]):
+                return lt
+            # 간단한 패턴도 확인 - 50자 이내에 있으면 관련성 있음
+            if _near_land_tag(row_text, hits, lt, 50):
+                return lt
+    
+    # 2. 파일 식별자에서 지목 정보 추출 시도
+    identifier = doc.identifier
+    if "[토지]" in identifier:
+        land_type = _land_type_near_tag(identifier, 30)
+        if land_type:
+            return land_type
+    
+    # 3. 데이터프레임 전체에서 찾기 ([토지] 행 우선, 지목과 면적이 같은 행에 있으면 실제 지목일 가능성 높음)
+    for row_text in doc.row_texts:
+        has_tag = "[토지]" in row_text
+        has_area = "㎡" in row_text or "m²" in row_text
+        if not (has_tag or has_area):
+            continue
+        hits = _LAND_TYPE_TRIE.find_all(row_text)
+        if has_tag:
+            land_type = _land_type_near_tag(row_text, 30, hits)
+            if land_type:
+                return land_type
+        if has_area:
+            for lt in LAND_TYPES:
+                if lt in hits:
+                    return lt
+    return ""
+
+def _find_land_area(doc):
+    # 주요 등기사항 요약 섹션에서 면적 추출 시도
+    for row_text in doc.summary_land_texts():
+        area_match = _AREA_PATTERN.search(row_text)
+        if area_match:
+            return area_match.group(1).replace(',', '')
+    
+    # 파일 식별자에서 면적 추출 시도
+    identifier = doc.identifier
+    if "[토지]" in identifier:
+        area_match = _AREA_PATTERN.search(identifier)
+        if area_match:
+            return area_match.group(1).replace(',', '')
+    
+    # 데이터프레임 전체에서 찾기 - 토지종류나 [토지]가 있는 행의 첫 면적
+    for row_text in doc.row_texts:
+        if "[토지]" in row_text or _AREA_LAND_TYPE_TRIE.search(row_text):
+            area_match = _AREA_PATTERN.search(row_text)
+            if area_match:
+                return area_match.group(1).replace(',', '')
+    return ""
+
+def extract_land_type(df, section_index=None):
+    """
+    엑셀 파일에서 토지 지목 정보를 추출하는 함수
+    (요약 행 -> 식별자 -> 시트 전체 순서로 검색, RegisterDocument.land_type과 같은 결과)
+    """
+    return RegisterDocument(df, section_index).land_type
+
+def extract_land_area(df, section_index=None):
+    """
+    엑셀 파일에서 토지면적 정보를 추출하는 함수
+    다양한 형식의 면적 표기를 인식 (RegisterDocument.land_area와 같은 결과)
+    """
+    return RegisterDocument(df, section_index).land_area
+
+def check_san_in_address(address):
+    """
+    토지주소에 '산'이 있는지 확인하는 함수
+    '산'이 숫자 앞에 있으면 'O', 아니면 'X'
+    """
+    if not isinstance(address, str):
+        return ''
+    
+    # 주소에서 마지막 부분을 가져오기
+    parts = address.split()
+    if not parts:
+        return ''
+    
+    # 주소의 마지막 부분에서 '산' 다음에 숫자가 오는 패턴 확인
+    import re
+    for part in parts:
+        if re.search(r'산\d+', part) or re.search(r'산\s*\d+', part):
+            return '산'
+    return ''
+
+def extract_right_holders(df):
+    """
+    주요등기사항에서 근저당권자와 지상권자 정보를 추출하고, 
+    원본 텍스트에서 해당 정보를 제거하는 함수 (열 단위 str.extract로 처리)
+    """
+    df = df.copy()
+    df["근저당권자"] = ""
+    df["지상권자"] = ""
+    if "주요등기사항" not in df.columns or df.empty:
+        return df
+    
+    values = df["주요등기사항"].to_numpy(dtype=object)
+    present = pd.notna(values)
+    main_text = [str(value) for value in values[present]]
+    
+    # 근저당권자 추출 및 제거 (근저당권자: XXX 형태 전체)
+    mortgage = _text_series(main_text).str.extract(_MORTGAGE_HOLDER_PATTERN).to_numpy(dtype=object)
+    modified = [text.replace(full, "") if isinstance(full, str) else text for text, full in zip(main_text, mortgage[:, 0])]
+    
+    # 지상권자 추출 및 제거 (근저당권자를 제거한 텍스트 기준)
+    surface = _text_series(modified).str.extract(_SURFACE_HOLDER_PATTERN).to_numpy(dtype=object)
+    modified = [text.replace(full, "") if isinstance(full, str) else text for text, full in zip(modified, surface[:, 0])]
+    
+    # 수정된 텍스트 정리 (앞뒤 공백, 연속된 쉼표, 시작/끝의 쉼표)
+    modified = (_text_series(modified).str.strip()
+                .str.replace(r',\s*,', ',', regex=True)
+                .str.replace(r'^\s*,\s*|\s*,\s*$', '', regex=True))
+    
+    for col, extracted in (("근저당권자", mortgage[:, 1]), ("지상권자", surface[:, 1])):
+        holders = df[col].to_numpy(dtype=object).copy()
+        matched = pd.notna(extracted)
+        holders[np.flatnonzero(present)[matched]] = _text_series(extracted[matched]).str.strip().to_numpy(dtype=object)
+        df[col] = pd.Series(holders, index=df.index, dtype=object).astype(df[col].dtype)
+    values = values.copy()
+    values[present] = modified.to_numpy(dtype=object)
+    df["주요등기사항"] = pd.Series(values, index=df.index, dtype=object).astype(df["주요등기사항"].dtype)
+    return df
+
+def read_register_source(name, source, reader=None, page_workers=1):
+    """
+    파일 확장자에 따라 엑셀 시트 또는 PDF를 같은 형태의 데이터프레임으로 읽는 함수
+    page_workers는 PDF 페이지를 나눠 처리할 프로세스 수
+    """
+    if name.lower().endswith(".pdf"):
+        return read_pdf_frame(source, page_workers)
+    return read_register_frame(source, reader)
+
+def process_register_file(name, source, reader=None, page_workers=1):
+    """
+    등기부등본 파일(.xlsx 또는 .pdf) 하나를 분석하는 작업 함수 (프로세스 풀에서 실행)
+    source는 파일 경로 또는 파일 내용(bytes), reader는 시트 읽기 방식 (sheet_reader.SHEET_READERS)
+    소유지분현황, 소유권사항, 저당권사항 결과와 고유번호(unique_number)를 딕셔너리로 반환
+    """
+    started = time.perf_counter()
+    profile = new_profile()
+    # 최대 메모리는 이 파일을 처리하는 동안의 값만 기록 (기록을 되돌릴 수 없는 OS에서는 비워 둠)
+    memory_tracked = reset_peak_memory()
+    layouts = get_layout_cache(EXTRACTOR_VERSION)
+    layout_stats = layouts.stats()
+    result = {"file": name, "pid": os.getpid(), "szj": None, "syg": None, "djg": None, "unique_number": None,
+              "error": None, "profile": profile}
+    try:
+        with timed_stage(profile, "파일읽기"):
+            if isinstance(source, (bytes, bytearray)):
+                source = io.BytesIO(source)
+            df = read_register_source(name, source, reader, page_workers)
+        profile["rows"] = len(df)
+
+        # 행 문자열, 구간 위치, 식별자, 지목/면적은 문서 객체에서 한 번만 계산해 공유
+        doc = RegisterDocument(df)
+        with timed_stage(profile, "구간탐색"):
+            # 모든 구간과 기준 행을 한 번에 탐색
+            name = doc.identifier
+            result["unique_number"] = doc.unique_number
+        
+        with timed_stage(profile, "토지정보"):
+            # 토지면적과 지목 정보 추출
+            land_area = doc.land_area
+            land_type = doc.land_type
+
+        with timed_stage(profile, "소유지분현황"):
+            result["szj"] = _ownership_share_frame(doc, name, land_type, land_area)
+        with timed_stage(profile, "소유권사항"):
+            result["syg"] = _ownership_history_frame(doc, name)
+        with timed_stage(profile, "저당권사항"):
+            result["djg"] = _mortgage_frame(doc, name)
+
+    except Exception as e:
+        # 실패한 파일은 결과에서 제외 (오류 내용과 실패 단계는 profile에 기록)
+        result["szj"] = result["syg"] = result["djg"] = None
+        result["error"] = str(e)
+    # 이 파일에서 헤더 레이아웃 캐시를 적중/미스한 횟수
+    profile["layout_hits"], profile["layout_misses"] = (after - before for after, before in zip(layouts.stats(), layout_stats))
+    profile["peak_memory_mb"] = peak_memory_mb() if memory_tracked else None
+    result["elapsed"] = time.perf_counter() - started
+    return result
+
+def _ownership_share_frame(doc, name, land_type, land_area):
+    """소유지분현황(갑구) 결과 데이터프레임 - 구간이 없으면 '기록없음' 한 행"""
+    szj_sec, has_szj = doc.section("소유지분현황")
+    if has_szj:
+        szj_df = extract_named_cols(szj_sec, ["등기명의인", "(주민)등록번호", "최종지분", "주소", "순위번호"])
+        
+        # 등기명의인/주민번호/최종지분/주소 정리 후 지목, 토지면적, 지분면적, 최종지분 수치화 열 추가
+        szj_df = clean_ownership_rows(szj_df)
+        szj_df = add_share_area_columns(szj_df, land_type, land_area)
+        
+        # 열 순서 재배치
+        szj_df.insert(0, "토지주소", name)
+        columns = ["토지주소", "등기명의인", "소유구분", "(주민)등록번호", "주소", "순위번호", "최종지분", "최종지분 수치화", "지목", "토지면적", "지분면적"]
+        szj_df = szj_df[columns]
+        szj_df["그룹정보"] = "있음"  # 그룹 헤더를 사용할 데이터 플래그
+        return szj_df
+    else:
+        # "기록없음" 케이스에도 동일한 컬럼 구조 유지
+        return pd.DataFrame([[name, "기록없음", "", "", "", "", "", "", land_type, land_area, "", "없음"]], 
+                            columns=["토지주소", "등기명의인", "소유구분", "(주민)등록번호", "주소", "순위번호", "최종지분", "최종지분 수치화", "지목", "토지면적", "지분면적", "그룹정보"])
+
+def _ownership_history_frame(doc, name):
+    """소유권사항(갑구) 결과 데이터프레임"""
+    syg_sec, has_syg = doc.section("소유권사항")
+    if has_syg:
+        syg_df = extract_precise_named_cols(syg_sec, ["순위번호", "등기목적", "접수정보", "주요등기사항", "대상소유자"])
+        syg_df.insert(0, "토지주소", name)
+        return syg_df
+    else:
+        return pd.DataFrame([[name, "기록없음"]], columns=["토지주소", "순위번호"])
+
+def _mortgage_frame(doc, name):
+    """저당권사항(을구) 결과 데이터프레임 - 채권최고액, 근저당권자, 지상권자 열 포함"""
+    djg_sec, has_djg = doc.section("저당권사항")
+    if has_djg:
+        djg_df = extract_precise_named_cols(djg_sec, ["순위번호", "등기목적", "접수정보", "주요등기사항", "대상소유자"])
+        
+        # 빈 행 제거 - 빈 문자열을 NA로 변환 후 모든 값이 NA인 행 제거
+        djg_df = djg_df.replace('', pd.NA)
+        djg_df = djg_df.dropna(how='all')
+        
+        # 공백만 있는 행도 제거 (문자열을 trim한 후 빈 문자열인지 확인)
+        mask = ~djg_df.astype(str).apply(lambda row: row.str.strip().eq('').all(), axis=1)
+        djg_df = djg_df[mask].reset_index(drop=True)
+        
+        # 빈 값을 다시 빈 문자열로 변환
+        djg_df = djg_df.fillna('')
+        
+        # "대상소유자" 컬럼에서 모든 띄어쓰기 제거
+        if "대상소유자" in djg_df.columns:
+            djg_df["대상소유자"] = djg_df["대상소유자"].astype(str).str.replace(" ", "")
+        
+        djg_df = merge_same_row_if_amount_separated(djg_df)
+        djg_df = trim_after_reference_note(djg_df)
+        djg_df = extract_right_holders(djg_df)
+        # 채권최고액(원) 숫자 열 - 근저당권자 열 앞에 배치 (주요등기사항 열이 없으면 모두 빈 값)
+        main = djg_df["주요등기사항"] if "주요등기사항" in djg_df.columns else pd.Series(None, index=djg_df.index, dtype=object)
+        djg_df.insert(djg_df.columns.get_loc("근저당권자"), "채권최고액", parse_max_claim_amounts(main))
+        djg_df.insert(0, "토지주소", name)
+        
+        return djg_df
+    else:
+        # 빈 데이터프레임에도 모든 열 포함 - 기록유무 열 제거
+        return pd.DataFrame([[name, "기록없음", "", "", "", "", None, "", ""]], 
+                            columns=["토지주소", "순위번호", "등기목적", "접수정보", "주요등기사항", "대상소유자", "채권최고액", "근저당권자", "지상권자"],
+                            dtype=object)
+
+def run_register_files(items, max_workers=None, reader=None, cache=None, page_workers=1, timeout=None,
+                       max_memory_mb=None):
+    """
+    등기부등본 파일들을 프로세스 풀에서 병렬로 분석하는 함수
+    items는 (파일명, 경로 또는 bytes) 튜플의 iterable, reader는 시트 읽기 방식
+    page_workers는 PDF 한 파일의 페이지를 나눠 처리할 프로세스 수 (파일 단위 병렬과 곱해짐)
+    cache(result_cache.ResultCache)를 주면 내용이 같은 파일은 분석하지 않고 저장된 결과 사용
+    결과는 작업 완료 순서와 관계없이 입력 순서대로 하나씩 반환 (단계별 처리 시간은 결과의 profile에 기록)
+    max_workers가 1이면 프로세스 풀 없이 현재 프로세스에서 순차 처리
+    timeout(초) 또는 max_memory_mb(MB)를 주면 파일마다 한도를 감시하는 프로세스 풀(watchdog_pool)에서 처리하고,
+    한도를 넘은 파일은 작업 프로세스를 종료한 뒤 실패 결과(quarantined)로 반환 (둘 다 None이면 ProcessPoolExecutor 사용)
+    """
+    def lookup(name, source):
+        # 캐시에 있으면 결과 딕셔너리, 없으면 (캐시 키 또는 None), 그리고 조회 시간(초) 반환
+        if cache is None or not isinstance(source, (bytes, bytearray)):
+            return None, None, None
+        started = time.perf_counter()
+        key = cache.key(source)
+        frames = cache.get(key)
+        seconds = time.perf_counter() - started
+        if frames is None:
+            return None, key, seconds
+        result = {"file": name, "pid": os.getpid(), "error": None, "cached": True, "profile": new_profile()}
+        result.update(frames)
+        result["elapsed"] = seconds
+        return result, key, seconds
+
+    def finish(key, result, read_seconds, lookup_seconds):
+        # 압축해제(입력 읽기)와 캐시조회 시간을 파일별 처리통계에 추가
+        stages = result["profile"]["stages"]
+        stages["압축해제"] = read_seconds
+        if lookup_seconds is not None:
+            stages["캐시조회"] = lookup_seconds
+        if key is not None and not result["error"] and not result.get("cached"):
+            cache.put(key, result)
+        return result
+
+    supervised = timeout is not None or max_memory_mb is not None
+    if max_workers == 1 and not supervised:
+        for name, source, read_seconds in _timed_items(items):
+            cached, key, lookup_seconds = lookup(name, source)
+            result = cached if cached is not None else process_register_file(name, source, reader, page_workers)
+            yield finish(key, result, read_seconds, lookup_seconds)
+        return
+    
+    workers = max_workers or os.cpu_count() or 1
+    # 동시에 대기시키는 작업 수를 제한해 파일 내용이 한꺼번에 메모리에 올라가지 않게 함
+    window = workers * 4
+    if supervised:
+        executor = WatchdogPool(workers, timeout=timeout, max_memory_mb=max_memory_mb)
+    else:
+        executor = ProcessPoolExecutor(max_workers=workers)
+    with executor:
+        pending = deque()
+        
+        def take():
+            name, key, job, read_seconds, lookup_seconds = pending.popleft()
+            try:
+                result = job if isinstance(job, dict) else job.result()
+            except BudgetExceeded as e:
+                result = _quarantined_result(name, e)
+            return finish(key, result, read_seconds, lookup_seconds)
+        
+        for name, source, read_seconds in _timed_items(items):
+            cached, key, lookup_seconds = lookup(name, source)
+            if cached is None:
+                cached = executor.submit(process_register_file, name, source, reader, page_workers)
+            pending.append((name, key, cached, read_seconds, lookup_seconds))
+            if len(pending) >= window:
+                yield take()
+        while pending:
+            yield take()
+
+def _quarantined_result(name, error):
+    """처리시간/메모리 한도를 넘어 중단한 파일의 실패 결과"""
+    profile = new_profile()
+    profile["failed_stage"] = "한도초과"
+    return {"file": name, "pid": error.pid, "szj": None, "syg": None, "djg": None, "unique_number": None,
+            "error": str(error), "quarantined": True, "elapsed": error.elapsed, "profile": profile}
+
+def _timed_items(items):
+    """(파일명, 내용) 항목마다 읽는 데 걸린 시간(초)을 붙여 반환 (압축파일에서 꺼내는 시간)"""
+    iterator = iter(items)
+    while True:
+        started = time.perf_counter()
+        try:
+            name, source = next(iterator)
+        except StopIteration:
+            return
+        yield name, source, time.perf_counter() - started
+
+def summarize_worker_timing(results):
+    """
+    작업 프로세스별 처리 파일 수와 처리 시간을 집계하는 함수
+    """
+    stats = {}
+    for result in results:
+        worker = "캐시" if result.get("cached") else str(result["pid"])
+        entry = stats.setdefault(worker, {"처리파일수": 0, "실패파일수": 0, "처리시간(초)": 0.0})
+        entry["처리파일수"] += 1
+        entry["처리시간(초)"] += result["elapsed"]
+        if result["error"]:
+            entry["실패파일수"] += 1
+    
+    rows = []
+    for worker, entry in sorted(stats.items()):
+        rows.append({
+            "작업프로세스": worker,
+            "처리파일수": entry["처리파일수"],
+            "실패파일수": entry["실패파일수"],
+            "처리시간(초)": round(entry["처리시간(초)"], 2),
+            "파일당 평균(초)": round(entry["처리시간(초)"] / entry["처리파일수"], 3),
+        })
+    return pd.DataFrame(rows)
@@ -0,0 +1,246 @@
+import io
+
+import numpy as np
+import pandas as pd
+from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import Alignment, Border, NamedStyle, PatternFill, Side
+from openpyxl.utils import get_column_letter
+from openpyxl.utils.dataframe import dataframe_to_rows
+
+from register_engine import check_san_in_address
+from register_profile import FAILURE_SHEET, PROFILE_SHEET, failure_frame, profile_frame
+from register_summary import (OWNER_SUMMARY_SHEET, PARCEL_CHECK_SHEET, SECURED_DEBT_SHEET, summarize_owners,
+                              summarize_parcel_shares, summarize_secured_debt)
+
+SHEET_NAMES = ["1. 소유지분현황 (갑구)", "2. 소유권사항 (갑구)", "3. 저당권사항 (을구)"]
+
+# 소유지분현황(갑구) 시트의 2단 그룹 헤더 구조 - {그룹명: [컬럼명 리스트]}
+SZJ_GROUP_STRUCTURE = {
+    "토지주소": ["토지주소", "산"],
+    "소유자": ["등기명의인", "소유구분", "(주민)등록번호", "주소", "순위번호"],
+    "토지": ["최종지분", "최종지분 수치화", "지목", "토지면적", "지분면적"]
+}
+
+XLSX_MIME = "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+
+HEADER_STYLE = "등기_헤더"
+DATA_STYLE = "등기_데이터"
+
+
+def _register_styles(wb):
+    """
+    헤더/데이터 셀 공용 스타일을 워크북에 한 번만 등록
+    셀마다 Border, PatternFill 객체를 새로 만들지 않고 이름으로 공유
+    """
+    header = NamedStyle(name=HEADER_STYLE)
+    # 중앙 정렬, 연한 초록색 배경 (RGB: 230, 244, 234), 검은색 얇은 테두리
+    header.alignment = Alignment(horizontal='center', vertical='center')
+    header.fill = PatternFill(start_color="E6F4EA", end_color="E6F4EA", fill_type="solid")
+    black = Side(style='thin', color='000000')
+    header.border = Border(left=black, right=black, top=black, bottom=black)
+    wb.add_named_style(header)
+
+    data = NamedStyle(name=DATA_STYLE)
+    # 데이터 셀에는 가벼운 회색 테두리
+    gray = Side(style='thin', color='D3D3D3')
+    data.border = Border(left=gray, right=gray, top=gray, bottom=gray)
+    wb.add_named_style(data)
+
+
+def _styled_row(ws, values, style):
+    """
+    같은 스타일의 셀로 이루어진 행을 만드는 함수
+    첫 셀에만 스타일 이름을 적용하고 나머지는 내부 스타일 배열을 복사 (이름 조회 반복 방지)
+    """
+    cells = []
+    template = None
+    for value in values:
+        cell = WriteOnlyCell(ws, value=value)
+        if template is None:
+            cell.style = style
+            template = cell._style
+        else:
+            cell._style = template.__copy__()
+        cells.append(cell)
+    return cells
+
+
+def column_widths(df, header_rows=()):
+    """
+    데이터프레임에서 열 너비를 계산하는 함수 (셀을 다시 읽지 않고 str.len()으로 계산)
+    header_rows: 데이터 위에 쓰는 헤더 행 목록 (열 순서와 같은 값 리스트)
+    최소 10, 최대 50 사이로 조정
+    """
+    widths = []
+    for position, col in enumerate(df.columns):
+        lengths = [len(str(row[position])) if row[position] else 0 for row in header_rows if position < len(row)]
+        if len(df):
+            lengths.append(int(df[col].fillna("").astype(str).str.len().max()))
+        max_length = max(lengths, default=0)
+        widths.append(min(max(max_length + 2, 10), 50))
+    return widths
+
+
+def _set_widths(ws, widths):
+    # write-only 시트는 행을 쓰기 전에 열 너비를 지정해야 함
+    for position, width in enumerate(widths, start=1):
+        ws.column_dimensions[get_column_letter(position)].width = width
+
+
+def write_grouped_sheet(ws, df, group_structure):
+    """
+    write-only 시트에 그룹화된 2단 헤더와 데이터를 쓰는 함수
+    group_structure: {그룹명: [컬럼명 리스트]} 형태의 딕셔너리
+    """
+    columns = [col for cols in group_structure.values() for col in cols]
+    group_row = []
+    merges = []
+    for group_name, cols in group_structure.items():
+        start = len(group_row) + 1
+        group_row += [group_name] + [None] * (len(cols) - 1)
+        # 여러 열에 걸친 그룹명은 셀 병합
+        if len(cols) > 1:
+            merges.append(f"{get_column_letter(start)}1:{get_column_letter(start + len(cols) - 1)}1")
+
+    data = df.reindex(columns=columns, fill_value="")
+    _set_widths(ws, column_widths(data, [group_row, columns]))
+    for merged in merges:
+        ws.merged_cells.add(merged)
+
+    ws.append(_styled_row(ws, group_row, HEADER_STYLE))
+    ws.append(_styled_row(ws, columns, HEADER_STYLE))
+    for values in data.itertuples(index=False, name=None):
+        ws.append(_styled_row(ws, values, DATA_STYLE))
+
+
+def write_table_sheet(ws, df):
+    """write-only 시트에 헤더 1행(스타일 적용)과 데이터를 쓰는 함수"""
+    columns = [str(col) for col in df.columns]
+    _set_widths(ws, column_widths(df, [columns]))
+    ws.row_dimensions[1].height = 25
+    rows = dataframe_to_rows(df, index=False, header=True)
+    next(rows)
+    ws.append(_styled_row(ws, columns, HEADER_STYLE))
+    for values in rows:
+        ws.append(values)
+
+
+def write_empty_sheet(ws):
+    """데이터가 없는 시트 - '기록없음' 한 칸에도 헤더 스타일 적용"""
+    ws.column_dimensions["A"].width = 10
+    ws.row_dimensions[1].height = 25
+    ws.append(_styled_row(ws, ["기록없음"], HEADER_STYLE))
+
+
+def _file_ids(frame_list):
+    # 파일별 데이터프레임 목록을 합친 행마다 원본 파일 번호
+    return np.repeat(np.arange(len(frame_list)), [len(df) for df in frame_list])
+
+
+def prepare_result_frames(szj_list, syg_list, djg_list, sources=None):
+    """
+    파일별 결과를 시트별 데이터프레임으로 합치는 함수
+    {시트명: 데이터프레임 또는 None(데이터 없음)} 형태로 반환 (시트 순서대로)
+    소유지분현황 데이터프레임에는 그룹 헤더 사용 여부를 위해 '그룹정보' 열이 남아 있음
+    소유지분현황을 합친 뒤 필지별 지분검증, 소유자별 집계 시트와 저당권사항의 필지별 채권최고액 합계 시트도 추가
+    sources는 파일 순서의 원본 파일 이름 목록으로, 지분검증과 채권최고액 합계는 (원본 파일, 토지주소)별로 함
+    """
+    frames = {}
+    for sheetname, data in zip(SHEET_NAMES, [szj_list, syg_list, djg_list]):
+        if not data:
+            frames[sheetname] = None
+            continue
+        df = pd.concat(data, ignore_index=True)
+        if sheetname == "1. 소유지분현황 (갑구)":
+            # "산" 열 추가
+            df["산"] = df["토지주소"].apply(check_san_in_address)
+
+            # 열 순서 재배치 - "토지주소" 다음에 "산" 위치
+            cols = df.columns.tolist()
+            cols.remove("산")
+            idx = cols.index("토지주소")
+            cols.insert(idx + 1, "산")
+            df = df[cols]
+        elif sheetname == "3. 저당권사항 (을구)":
+            if "순위번호" in df.columns and "등기목적" in df.columns:
+                df = df.rename(columns={"순위번호": "기록유무"})
+                # 기록유무에 등기목적 값만 표시 (등기목적이 비어있으면 "기록없음")
+                df["기록유무"] = df["등기목적"].apply(
+                    lambda x: x if pd.notna(x) and str(x).strip() and str(x).strip() != "기록없음"
+                    else "기록없음"
+                )
+                df = df.drop(columns=["등기목적"])
+        frames[sheetname] = df
+
+    szj_df = frames["1. 소유지분현황 (갑구)"]
+    # 필지별 시트는 (원본 파일, 토지주소)로 필지를 구분 - 행마다 원본 파일 번호 (목록 순서)
+    frames[PARCEL_CHECK_SHEET] = (summarize_parcel_shares(szj_df, _file_ids(szj_list), sources)
+                                  if szj_df is not None else None)
+    frames[OWNER_SUMMARY_SHEET] = summarize_owners(szj_df) if szj_df is not None else None
+    djg_df = frames["3. 저당권사항 (을구)"]
+    frames[SECURED_DEBT_SHEET] = (summarize_secured_debt(djg_df, _file_ids(djg_list), sources)
+                                  if djg_df is not None else None)
+    return frames
+
+
+def collect_result_frames(results, include_stats=False):
+    """
+    run_register_files 결과를 파일 순서대로 모아 시트별 데이터프레임으로 만드는 함수
+    실패한 파일(error가 있는 결과)은 제외하고, 실패한 파일이 있으면 사유를 처리실패 시트에 정리
+    include_stats이면 실패한 파일을 포함한 파일별 처리통계 시트를 마지막에 추가
+    """
+    szj_list, syg_list, djg_list = [], [], []
+    for result in results:
+        if result["error"]:
+            continue
+        szj_list.append(result["szj"])
+        syg_list.append(result["syg"])
+        djg_list.append(result["djg"])
+    sources = [result["file"] for result in results if not result["error"]]
+    frames = prepare_result_frames(szj_list, syg_list, djg_list, sources)
+    if include_stats:
+        frames[PROFILE_SHEET] = profile_frame(results) if results else None
+    failures = failure_frame(results)
+    if len(failures):
+        frames[FAILURE_SHEET] = failures
+    return frames
+
+
+def build_result_workbook(frames):
+    """
+    prepare_result_frames 결과로 결과 워크북을 만드는 함수 (openpyxl write-only 모드)
+    셀을 하나씩 만들어 스타일 객체를 붙이는 대신 행 단위로 스트리밍하고 공용 스타일 사용
+    """
+    wb = Workbook(write_only=True)
+    _register_styles(wb)
+    for sheetname, df in frames.items():
+        ws = wb.create_sheet(title=sheetname)
+        if df is None:
+            write_empty_sheet(ws)
+        elif sheetname == "1. 소유지분현황 (갑구)":
+            # 소유지분현황(갑구) 시트에는 그룹 헤더 적용
+            use_groups = any(df["그룹정보"] == "있음")
+            df = df.drop(columns=["그룹정보"])  # 그룹정보 열 제거
+            if use_groups:
+                write_grouped_sheet(ws, df, SZJ_GROUP_STRUCTURE)
+            else:
+                write_table_sheet(ws, df)
+        else:
+            write_table_sheet(ws, df)
+    return wb
+
+
+def workbook_to_bytes(wb):
+    """
+    워크북을 메모리 버퍼에 저장해 bytes로 반환하는 함수
+    임시 파일을 만들지 않으므로 파일 핸들이나 디스크에 남는 파일이 없음
+    """
+    buffer = io.BytesIO()
+    wb.save(buffer)
+    return buffer.getvalue()
+
+
+def export_result_xlsx(frames):
+    """prepare_result_frames 결과를 결과 엑셀 파일 내용(bytes)으로 변환"""
+    return workbook_to_bytes(build_result_workbook(frames))
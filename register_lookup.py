@@ -0,0 +1,53 @@
+"""
+누적 저장소(register_store)에서 필지 조회 및 일부 필지 내보내기 (원본 등기부 파일을 다시 분석하지 않음)
+
+사용 예:
+    python register_lookup.py 등기부.sqlite --owner 홍길동
+    python register_lookup.py 등기부.sqlite --mortgagee 농협은행 -o 농협은행_담보필지.xlsx
+    python register_lookup.py 등기부.sqlite --jumin 751984-1234567 --address 화성시
+
+저장소는 register_cli.py --store 또는 앱(REGISTER_STORE_PATH 설정 시)에서 분석 결과를 저장해 만듦
+조건을 여러 개 주면 모두 만족하는 필지만 조회
+"""
+import argparse
+import os
+import sys
+import time
+
+from register_cli import log, write_file
+from register_store import RegisterStore
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="누적 저장소에서 등기명의인/근저당권자 등으로 필지를 조회합니다.")
+    parser.add_argument("store", help="SQLite 저장소 경로 (register_cli.py --store로 생성)")
+    parser.add_argument("--owner", help="등기명의인 (띄어쓰기 무시, 정확히 일치)")
+    parser.add_argument("--jumin", help="(주민)등록번호 (뒷자리는 첫 자리만 비교)")
+    parser.add_argument("--mortgagee", help="근저당권자 (정확히 일치)")
+    parser.add_argument("--address", help="토지주소에 포함된 문자열")
+    parser.add_argument("-o", "--output", help="조회한 필지만 결과 엑셀 파일로 저장할 경로")
+    args = parser.parse_args(argv)
+    if not os.path.exists(args.store):
+        parser.error(f"저장소가 없습니다: {args.store}")
+    return args
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    with RegisterStore(args.store) as store:
+        started = time.perf_counter()
+        parcels = store.find_parcels(owner=args.owner, registration_number=args.jumin, mortgagee=args.mortgagee,
+                                     address=args.address)
+        log(f"{len(parcels)}개 필지 (전체 {store.count()}개, {(time.perf_counter() - started) * 1000:.1f}ms)")
+        if len(parcels):
+            print(parcels.to_string(index=False))
+        if args.output:
+            from register_export import collect_result_frames, export_result_xlsx
+
+            write_file(args.output, export_result_xlsx(collect_result_frames(store.parcel_results(parcels["필지키"]))))
+            log(f"{len(parcels)}개 필지 내보내기 -> {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,173 @@
+import json
+import time
+from contextlib import contextmanager
+
+import pandas as pd
+
+PROFILE_SHEET = "7. 처리통계"
+FAILURE_SHEET = "처리실패"
+# 파일별 처리 단계 (표시 순서)
+STAGES = ["압축해제", "캐시조회", "파일읽기", "구간탐색", "토지정보", "소유지분현황", "소유권사항", "저당권사항"]
+# 화면에 표시할 가장 느린 파일 수
+DEFAULT_TOP_N = 20
+
+
+def new_profile():
+    """
+    파일 하나의 처리 통계 - 단계별 시간(초), 입력 행 수, 파일을 처리하는 동안의 최대 메모리(MB), 실패 단계,
+    헤더 레이아웃 캐시 적중/미스 횟수
+    """
+    return {"stages": {}, "rows": 0, "peak_memory_mb": None, "failed_stage": None, "layout_hits": 0, "layout_misses": 0}
+
+
+@contextmanager
+def timed_stage(profile, stage):
+    """
+    with 블록의 실행 시간을 profile의 단계별 시간에 더하는 함수
+    블록에서 예외가 나면 실패 단계로 기록한 뒤 예외를 그대로 다시 발생
+    """
+    started = time.perf_counter()
+    try:
+        yield
+    except BaseException:
+        profile["failed_stage"] = stage
+        raise
+    finally:
+        stages = profile["stages"]
+        stages[stage] = stages.get(stage, 0.0) + time.perf_counter() - started
+
+
+def reset_peak_memory():
+    """
+    현재 프로세스의 최대 메모리(RSS) 기록을 지금 사용량으로 되돌리는 함수 (리눅스 /proc 기준)
+    되돌리지 못하면 False - 이때 peak_memory_mb는 프로세스 전체 최대값이 되므로 사용하지 않음
+    """
+    try:
+        with open("/proc/self/clear_refs", "w") as f:
+            f.write("5")
+    except OSError:
+        return False
+    return True
+
+
+def peak_memory_mb():
+    """마지막 reset_peak_memory 이후 현재 프로세스의 최대 메모리(MB), 확인할 수 없으면 None"""
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith("VmHWM:"):
+                    return round(int(line.split()[1]) / 1024, 1)
+    except (OSError, ValueError):
+        pass
+    return None
+
+
+def _output_rows(result):
+    return sum(len(result[name]) for name in ("szj", "syg", "djg") if result.get(name) is not None)
+
+
+def profile_frame(results):
+    """
+    run_register_files 결과로 파일별 처리통계 데이터프레임을 만드는 함수 (입력 순서 유지)
+    단계별 시간은 STAGES 순서의 열로 표시하고, 해당 단계를 거치지 않은 파일은 빈 값
+    """
+    rows = []
+    for result in results:
+        profile = result.get("profile") or new_profile()
+        if result.get("quarantined"):
+            status = "중단"
+        elif result["error"]:
+            status = "실패"
+        elif result.get("cached"):
+            status = "캐시"
+        else:
+            status = "성공"
+        row = {
+            "파일": result["file"],
+            "작업프로세스": "캐시" if result.get("cached") else str(result["pid"]),
+            "처리결과": status,
+            "실패단계": profile["failed_stage"] or "",
+            "처리시간(초)": round(result["elapsed"], 4),
+            "입력행수": profile["rows"],
+            "출력행수": _output_rows(result),
+            "최대메모리(MB)": profile["peak_memory_mb"],
+            "헤더캐시적중": profile.get("layout_hits", 0),
+            "헤더캐시미스": profile.get("layout_misses", 0),
+        }
+        for stage in STAGES:
+            seconds = profile["stages"].get(stage)
+            row[f"{stage}(초)"] = round(seconds, 4) if seconds is not None else None
+        rows.append(row)
+    columns = ["파일", "작업프로세스", "처리결과", "실패단계", "처리시간(초)", "입력행수", "출력행수", "최대메모리(MB)",
+               "헤더캐시적중", "헤더캐시미스"]
+    return pd.DataFrame(rows, columns=columns + [f"{stage}(초)" for stage in STAGES])
+
+
+def failure_frame(results):
+    """
+    처리하지 못한 파일 목록 (처리실패 시트)
+    처리 중 오류가 난 파일과 처리시간/메모리 한도를 넘어 중단한 파일을 사유와 함께 표시
+    """
+    rows = []
+    for result in results:
+        if not result["error"]:
+            continue
+        profile = result.get("profile") or new_profile()
+        rows.append({
+            "파일": result["file"],
+            "구분": "한도초과 중단" if result.get("quarantined") else "오류",
+            "실패사유": result["error"],
+            "실패단계": profile["failed_stage"] or "",
+            "처리시간(초)": round(result["elapsed"], 4),
+        })
+    return pd.DataFrame(rows, columns=["파일", "구분", "실패사유", "실패단계", "처리시간(초)"])
+
+
+def slowest_files(results, top_n=DEFAULT_TOP_N):
+    """처리 시간이 가장 긴 파일 top_n개의 처리통계"""
+    frame = profile_frame(results)
+    return frame.sort_values("처리시간(초)", ascending=False, kind="stable").head(top_n).reset_index(drop=True)
+
+
+def layout_cache_summary(results):
+    """헤더 레이아웃 캐시 적중/미스 합계와 적중률(%) - 결과 캐시로 재사용한 파일은 헤더를 보지 않으므로 제외"""
+    hits = misses = 0
+    for result in results:
+        profile = result.get("profile") or new_profile()
+        hits += profile.get("layout_hits", 0)
+        misses += profile.get("layout_misses", 0)
+    rate = round(hits * 100 / (hits + misses), 1) if hits + misses else None
+    return {"적중": hits, "미스": misses, "적중률(%)": rate}
+
+
+def build_profile_report(results, total_seconds=None, export_seconds=None, top_n=DEFAULT_TOP_N):
+    """
+    처리통계 JSON 보고서 내용(딕셔너리)을 만드는 함수
+    전체/결과파일 생성 시간, 단계별 합계, 가장 느린 파일 목록과 파일별 통계를 포함
+    """
+    frame = profile_frame(results)
+    stage_totals = {}
+    for stage in STAGES:
+        seconds = frame[f"{stage}(초)"].dropna()
+        if len(seconds):
+            stage_totals[stage] = {"파일수": int(len(seconds)), "합계(초)": round(float(seconds.sum()), 4),
+                                   "최대(초)": round(float(seconds.max()), 4)}
+    # NaN은 JSON에 쓸 수 없으므로 None으로 변환
+    records = frame.astype(object).where(frame.notna(), None).to_dict(orient="records")
+    slowest = sorted(records, key=lambda record: record["처리시간(초)"], reverse=True)[:top_n]
+    return {
+        "파일수": len(frame),
+        "실패파일수": int(frame["처리결과"].isin(["실패", "중단"]).sum()),
+        "중단파일수": int((frame["처리결과"] == "중단").sum()),
+        "캐시사용파일수": int((frame["처리결과"] == "캐시").sum()),
+        "전체시간(초)": round(total_seconds, 4) if total_seconds is not None else None,
+        "결과파일생성(초)": round(export_seconds, 4) if export_seconds is not None else None,
+        "단계별합계": stage_totals,
+        "헤더레이아웃캐시": layout_cache_summary(results),
+        "느린파일": slowest,
+        "파일별": records,
+    }
+
+
+def profile_report_json(report):
+    return json.dumps(report, ensure_ascii=False, indent=2)
@@ -0,0 +1,205 @@
+import re
+import sqlite3
+import time
+
+import pandas as pd
+
+# 필지(등기부 한 건)별로 소유지분/소유권/저당권 행을 저장하는 표와 열 (토지주소 대신 필지키로 연결)
+SZJ_COLUMNS = ["등기명의인", "소유구분", "(주민)등록번호", "주소", "순위번호", "최종지분", "최종지분 수치화", "지목",
+               "토지면적", "지분면적", "그룹정보"]
+SYG_COLUMNS = ["순위번호", "등기목적", "접수정보", "주요등기사항", "대상소유자"]
+DJG_COLUMNS = ["순위번호", "등기목적", "접수정보", "주요등기사항", "대상소유자", "채권최고액", "근저당권자", "지상권자"]
+TABLES = {"szj": ("소유지분", SZJ_COLUMNS), "syg": ("소유권", SYG_COLUMNS), "djg": ("저당권", DJG_COLUMNS)}
+PARCEL_COLUMNS = ["필지키", "고유번호", "토지주소", "원본파일", "갱신시각"]
+# 숫자로 저장하는 열 (나머지는 문자열)
+_COLUMN_TYPES = {"최종지분 수치화": "REAL", "채권최고액": "INTEGER"}
+
+_SCHEMA = [
+    'CREATE TABLE IF NOT EXISTS "필지" ("필지키" TEXT PRIMARY KEY, "고유번호" TEXT, "토지주소" TEXT, '
+    '"원본파일" TEXT, "갱신시각" TEXT)',
+    'CREATE INDEX IF NOT EXISTS "필지_고유번호" ON "필지" ("고유번호")',
+    'CREATE INDEX IF NOT EXISTS "필지_토지주소" ON "필지" ("토지주소")',
+]
+for _table, _columns in TABLES.values():
+    _SCHEMA.append(f'CREATE TABLE IF NOT EXISTS "{_table}" ("필지키" TEXT NOT NULL, "행번호" INTEGER NOT NULL, '
+                   + ", ".join(f'"{col}" {_COLUMN_TYPES.get(col, "TEXT")}' for col in _columns) + ")")
+    _SCHEMA.append(f'CREATE INDEX IF NOT EXISTS "{_table}_필지키" ON "{_table}" ("필지키", "행번호")')
+_SCHEMA += [
+    'CREATE INDEX IF NOT EXISTS "소유지분_등기명의인" ON "소유지분" ("등기명의인")',
+    'CREATE INDEX IF NOT EXISTS "소유지분_등록번호" ON "소유지분" ("(주민)등록번호")',
+    'CREATE INDEX IF NOT EXISTS "저당권_근저당권자" ON "저당권" ("근저당권자")',
+]
+
+_REGISTRATION_NUMBER = re.compile(r'(\d{6})\s*-\s*(\d)[\d*]{6}')
+
+
+def mask_registration_number(text):
+    """(주민)등록번호 뒷자리를 첫 자리만 남기고 가림 (예: 751984-1234567 -> 751984-1******)"""
+    if not isinstance(text, str):
+        return text
+    return _REGISTRATION_NUMBER.sub(lambda m: f"{m.group(1)}-{m.group(2)}******", text)
+
+
+def parcel_key(result):
+    """필지 식별 키 - 고유번호, 없으면 토지주소, 둘 다 없으면 파일 이름"""
+    if result.get("unique_number"):
+        return result["unique_number"]
+    address = _parcel_address(result)
+    return address if address and address != "알수없음" else f"파일:{result['file']}"
+
+
+def _parcel_address(result):
+    for name in ("szj", "syg", "djg"):
+        df = result.get(name)
+        if df is not None and len(df) and "토지주소" in df.columns:
+            return str(df["토지주소"].iloc[0])
+    return ""
+
+
+def _quoted(columns, prefix=""):
+    return ", ".join(f'{prefix}"{col}"' for col in columns)
+
+
+def _sql_value(value):
+    # NaN/None은 NULL, numpy 숫자는 파이썬 숫자로 변환
+    if value is None or (not isinstance(value, str) and pd.isna(value)):
+        return None
+    return value.item() if hasattr(value, "item") else value
+
+
+class RegisterStore:
+    """
+    분석 결과를 업로드/실행이 달라도 계속 누적하는 SQLite 저장소
+    필지(고유번호, 없으면 토지주소)마다 가장 최근에 분석한 등기부의 소유지분/소유권/저당권 행으로 교체(upsert)하며,
+    등기명의인, (주민)등록번호(뒷자리 가림), 근저당권자에 인덱스가 있어 원본 파일 없이 바로 조회/내보내기 가능
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.conn = sqlite3.connect(path)
+        # 앱이 조회하는 동안 배치 실행이 저장할 수 있도록 WAL 모드 사용
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        with self.conn:
+            for statement in _SCHEMA:
+                self.conn.execute(statement)
+
+    def upsert_results(self, results):
+        """run_register_files 결과를 필지별로 저장 (실패한 파일 제외), 저장한 필지 수 반환"""
+        updated_at = time.strftime("%Y-%m-%d %H:%M:%S")
+        count = 0
+        with self.conn:
+            for result in results:
+                if result["error"]:
+                    continue
+                key = parcel_key(result)
+                self.conn.execute(
+                    'INSERT INTO "필지" VALUES (?, ?, ?, ?, ?) ON CONFLICT("필지키") DO UPDATE SET '
+                    '"고유번호" = excluded."고유번호", "토지주소" = excluded."토지주소", '
+                    '"원본파일" = excluded."원본파일", "갱신시각" = excluded."갱신시각"',
+                    (key, result.get("unique_number") or "", _parcel_address(result), result["file"], updated_at))
+                for name, (table, columns) in TABLES.items():
+                    self.conn.execute(f'DELETE FROM "{table}" WHERE "필지키" = ?', (key,))
+                    df = result.get(name)
+                    if df is None or not len(df):
+                        continue
+                    df = df.reindex(columns=columns)
+                    if name == "szj":
+                        df["(주민)등록번호"] = df["(주민)등록번호"].map(mask_registration_number)
+                    placeholders = ", ".join("?" * (len(columns) + 2))
+                    self.conn.executemany(
+                        f'INSERT INTO "{table}" VALUES ({placeholders})',
+                        ([key, position] + [_sql_value(value) for value in values]
+                         for position, values in enumerate(df.itertuples(index=False, name=None))))
+                count += 1
+        return count
+
+    def find_parcels(self, owner=None, registration_number=None, mortgagee=None, address=None):
+        """
+        조건에 맞는 필지 목록 (필지 열 데이터프레임, 토지주소 순)
+        owner(등기명의인), registration_number((주민)등록번호), mortgagee(근저당권자)는 띄어쓰기를 무시한 정확 매칭,
+        address는 토지주소 부분 매칭이며, 여러 조건을 주면 모두 만족하는 필지만 반환
+        """
+        conditions, params = [], []
+        if owner:
+            conditions.append('"필지키" IN (SELECT "필지키" FROM "소유지분" WHERE "등기명의인" = ?)')
+            params.append(owner.replace(" ", ""))
+        if registration_number:
+            conditions.append('"필지키" IN (SELECT "필지키" FROM "소유지분" WHERE "(주민)등록번호" = ?)')
+            params.append(mask_registration_number(registration_number.strip()))
+        if mortgagee:
+            conditions.append('"필지키" IN (SELECT "필지키" FROM "저당권" WHERE "근저당권자" = ?)')
+            params.append(mortgagee.strip())
+        if address:
+            conditions.append('"토지주소" LIKE ?')
+            params.append(f"%{address.strip()}%")
+        where = " WHERE " + " AND ".join(conditions) if conditions else ""
+        query = f'SELECT {_quoted(PARCEL_COLUMNS)} FROM "필지"{where} ORDER BY "토지주소"'
+        return pd.DataFrame(self.conn.execute(query, params).fetchall(), columns=PARCEL_COLUMNS)
+
+    def parcel_frames(self, keys):
+        """
+        필지키 목록의 저장된 행을 결과 파일과 같은 형태로 반환 ({'szj'|'syg'|'djg': 데이터프레임})
+        register_export.prepare_result_frames에 그대로 넘겨 일부 필지만 결과 엑셀로 내보낼 수 있음
+        """
+        return {name: df.drop(columns=["필지키"]) for name, df in self._keyed_frames(keys).items()}
+
+    def parcel_results(self, keys):
+        """
+        필지키 목록의 저장된 행을 필지마다 run_register_files 결과와 같은 딕셔너리로 반환
+        register_export.collect_result_frames에 넘기면 지분검증도 분석 직후처럼 필지(원본 파일)별로 나뉨
+        """
+        keys = list(keys)
+        frames = self._keyed_frames(keys)
+        groups = {name: dict(tuple(df.groupby("필지키", sort=False))) for name, df in frames.items()}
+        parcels = {}
+        for start in range(0, len(keys), 500):
+            chunk = keys[start:start + 500]
+            for key, source, unique_number in self.conn.execute(
+                    f'SELECT "필지키", "원본파일", "고유번호" FROM "필지" WHERE "필지키" IN ({", ".join("?" * len(chunk))})',
+                    chunk):
+                parcels[key] = (source, unique_number or None)
+        results = []
+        for key in keys:
+            source, unique_number = parcels.get(key, (key, None))
+            result = {"file": source, "unique_number": unique_number, "error": None}
+            for name, df in frames.items():
+                part = groups[name].get(key)
+                result[name] = (part if part is not None else df.iloc[:0]).drop(columns=["필지키"]).reset_index(drop=True)
+            results.append(result)
+        return results
+
+    def _keyed_frames(self, keys):
+        # parcel_frames 형태에 필지키 열을 더한 데이터프레임
+        keys = list(keys)
+        frames = {}
+        for name, (table, columns) in TABLES.items():
+            rows = []
+            # SQLite 변수 개수 제한을 넘지 않도록 나눠서 조회
+            for start in range(0, len(keys), 500):
+                chunk = keys[start:start + 500]
+                rows += self.conn.execute(
+                    f'SELECT p."토지주소", p."필지키", t."행번호", {_quoted(columns, "t.")} '
+                    f'FROM "{table}" t JOIN "필지" p ON p."필지키" = t."필지키" '
+                    f'WHERE t."필지키" IN ({", ".join("?" * len(chunk))})', chunk).fetchall()
+            # 요청한 필지 순서, 필지 안에서는 원래 행 순서
+            order = {key: position for position, key in enumerate(keys)}
+            rows.sort(key=lambda row: (order[row[1]], row[2]))
+            df = pd.DataFrame([row[:2] + tuple(row[3:]) for row in rows], columns=["토지주소", "필지키"] + columns,
+                              dtype=object)
+            # 문자열 열은 추출 결과에 있으면 NULL이 아니므로, 모두 NULL인 문자열 열은 원래 결과에 없던 열
+            absent = [col for col in columns if col not in _COLUMN_TYPES and len(df) and df[col].isna().all()]
+            frames[name] = df.drop(columns=absent)
+        return frames
+
+    def count(self):
+        """저장된 필지 수"""
+        return self.conn.execute('SELECT COUNT(*) FROM "필지"').fetchone()[0]
+
+    def close(self):
+        self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
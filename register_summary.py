@@ -0,0 +1,164 @@
+from fractions import Fraction
+
+import numpy as np
+import pandas as pd
+
+from share_parser import format_fixed, parse_share
+
+PARCEL_CHECK_SHEET = "4. 지분검증 (필지별)"
+OWNER_SUMMARY_SHEET = "5. 소유자별 집계"
+SECURED_DEBT_SHEET = "6. 채권최고액 합계 (필지별)"
+
+
+def _parse_share_value(value):
+    if pd.isna(value) or not str(value).strip():
+        return None
+    return parse_share(str(value))
+
+
+def _parse_area_value(value):
+    if pd.isna(value) or not value:
+        return None
+    try:
+        return Fraction(str(value).replace(",", "").strip())
+    except (ValueError, ZeroDivisionError):
+        return None
+
+
+def _factorize_exact(series, parse):
+    """
+    열 값을 (행별 코드 배열, 코드별 정확한 값 목록)으로 변환 - 같은 값은 한 번만 해석
+    해석할 수 없는 값의 코드는 -1
+    """
+    codes, uniques = pd.factorize(series.astype(object), use_na_sentinel=True)
+    values = [parse(value) for value in uniques]
+    invalid = np.array([value is None for value in values] + [True], dtype=bool)
+    codes = np.where(invalid[codes], -1, codes)
+    return codes, values
+
+
+def _grouped_sums(group_codes, value_codes, values, group_count):
+    """
+    그룹별 정확한 값(Fraction)의 합을 구하는 함수
+    (그룹, 값) 쌍의 개수를 해시로 먼저 센 뒤 고유한 쌍마다 한 번만 분수 연산을 하므로 행 수에 선형
+    """
+    sums = [Fraction(0)] * group_count
+    valid = (group_codes >= 0) & (value_codes >= 0)
+    if not valid.any():
+        return sums
+    width = len(values)
+    pairs = pd.Series(group_codes[valid].astype(np.int64) * width + value_codes[valid])
+    for pair, count in pairs.value_counts(sort=False).items():
+        group, value = divmod(int(pair), width)
+        sums[group] += values[value] * count
+    return sums
+
+
+def summarize_parcel_shares(szj_df, file_ids=None, sources=None):
+    """
+    필지별로 최종지분 합계가 1인지 검증하는 함수
+    필지는 (원본 파일, 토지주소)로 구분하므로 주소 문자열이 같은 다른 등기부나 같은 등기부를 두 번 올린 경우도 따로 검증
+    file_ids는 행마다 원본 파일 번호(없으면 토지주소만으로 구분), sources는 파일 번호별 파일 이름
+    지분은 분수로 정확하게 더하며, 해석할 수 없는 지분이 있으면 확인필요로 표시 (빈 지분은 해석불가에서 제외)
+    """
+    keys = pd.DataFrame({"파일": np.zeros(len(szj_df), dtype=np.int64) if file_ids is None else np.asarray(file_ids),
+                         "토지주소": szj_df["토지주소"].astype(object).fillna("").to_numpy()})
+    group_codes, parcels = pd.MultiIndex.from_frame(keys).factorize()
+    owner_rows = (szj_df["그룹정보"] == "있음").to_numpy(dtype=bool)
+    blank_rows = szj_df["최종지분"].map(lambda value: pd.isna(value) or not str(value).strip()).to_numpy(dtype=bool)
+    share_codes, shares = _factorize_exact(szj_df["최종지분"], _parse_share_value)
+
+    share_sums = _grouped_sums(np.where(owner_rows, group_codes, -1), share_codes, shares, len(parcels))
+    owner_counts = np.bincount(group_codes[owner_rows], minlength=len(parcels))
+    blank_counts = np.bincount(group_codes[owner_rows & blank_rows], minlength=len(parcels))
+    unparsed_counts = np.bincount(group_codes[owner_rows & ~blank_rows & (share_codes < 0)], minlength=len(parcels))
+
+    rows = []
+    for position, (file_id, parcel) in enumerate(parcels):
+        total = share_sums[position]
+        if not owner_counts[position]:
+            status = "소유지분 기록없음"
+        elif unparsed_counts[position]:
+            status = "확인필요 (지분 해석불가)"
+        elif total == 1:
+            status = "정상"
+        elif total < 1:
+            status = "지분합계 부족"
+        else:
+            status = "지분합계 초과"
+        rows.append({
+            "토지주소": parcel,
+            "원본파일": sources[file_id] if sources is not None else "",
+            "소유자수": int(owner_counts[position]),
+            "지분합계": str(total) if owner_counts[position] else "",
+            "지분합계 수치화": float(total) if owner_counts[position] else None,
+            "해석불가 지분수": int(unparsed_counts[position]),
+            "빈 지분수": int(blank_counts[position]),
+            "검증결과": status,
+        })
+    return pd.DataFrame(rows, columns=["토지주소", "원본파일", "소유자수", "지분합계", "지분합계 수치화", "해석불가 지분수",
+                                       "빈 지분수", "검증결과"])
+
+
+def summarize_owners(szj_df):
+    """
+    소유자(등기명의인, 주민등록번호)별로 소유 건수와 지분면적 합계를 구하는 함수
+    지분면적은 토지면적 x 최종지분을 분수로 정확하게 더한 뒤 소수점 4자리로 표시
+    """
+    owners = szj_df[szj_df["그룹정보"] == "있음"]
+    keys = owners[["등기명의인", "(주민)등록번호"]].astype(object).fillna("")
+    group_codes, groups = pd.MultiIndex.from_frame(keys).factorize()
+
+    # (토지면적, 최종지분) 조합별로 한 번만 곱셈
+    area_codes, areas = _factorize_exact(owners["토지면적"], _parse_area_value)
+    share_codes, shares = _factorize_exact(owners["최종지분"], _parse_share_value)
+    computable = (area_codes >= 0) & (share_codes >= 0)
+    width = max(len(shares), 1)
+    pair_codes, pairs = pd.factorize(area_codes[computable].astype(np.int64) * width + share_codes[computable])
+    pair_values = [areas[pair // width] * shares[pair % width] for pair in pairs]
+    value_codes = np.full(len(owners), -1, dtype=np.int64)
+    value_codes[computable] = pair_codes
+    area_sums = _grouped_sums(group_codes, value_codes, pair_values, len(groups))
+
+    row_counts = np.bincount(group_codes, minlength=len(groups))
+    skipped_counts = np.bincount(group_codes[~computable], minlength=len(groups))
+    rows = []
+    for position, (name, jumin) in enumerate(groups):
+        rows.append({
+            "등기명의인": name,
+            "(주민)등록번호": jumin,
+            "소유 건수": int(row_counts[position]),
+            # 모든 건이 계산에서 빠진 소유자는 합계를 비워 둠
+            "지분면적 합계": format_fixed(area_sums[position]) if skipped_counts[position] < row_counts[position] else "",
+            "면적 계산제외 건수": int(skipped_counts[position]),
+        })
+    return pd.DataFrame(rows, columns=["등기명의인", "(주민)등록번호", "소유 건수", "지분면적 합계", "면적 계산제외 건수"])
+
+
+def summarize_secured_debt(djg_df, file_ids=None, sources=None):
+    """
+    필지별로 채권최고액이 있는 저당권 건수와 채권최고액 합계(원)를 구하는 함수
+    지분검증과 같이 (원본 파일, 토지주소)로 필지를 구분 (file_ids, sources는 summarize_parcel_shares와 같음)
+    채권최고액이 없는 필지도 0건으로 표시
+    """
+    keys = pd.DataFrame({"파일": np.zeros(len(djg_df), dtype=np.int64) if file_ids is None else np.asarray(file_ids),
+                         "토지주소": djg_df["토지주소"].astype(object).fillna("").to_numpy()})
+    group_codes, parcels = pd.MultiIndex.from_frame(keys).factorize()
+    amounts = djg_df["채권최고액"].to_numpy(dtype=object)
+    secured = pd.notna(amounts)
+
+    debt_counts = np.bincount(group_codes[secured], minlength=len(parcels))
+    # 금액이 커도 정확하도록 int 객체로 합산
+    debt_sums = [0] * len(parcels)
+    for group, amount in zip(group_codes[secured], amounts[secured]):
+        debt_sums[group] += int(amount)
+
+    rows = []
+    for position, (file_id, parcel) in enumerate(parcels):
+        rows.append({
+            "토지주소": parcel,
+            "원본파일": sources[file_id] if sources is not None else "",
+            "채권최고액 건수": int(debt_counts[position]),
+            "채권최고액 합계": debt_sums[position],
+        })
+    return pd.DataFrame(rows, columns=["토지주소", "원본파일", "채권최고액 건수", "채권최고액 합계"])
@@ -0,0 +1,214 @@
+import gzip
+import hashlib
+import io
+import json
+import os
+import tempfile
+import time
+import zipfile
+
+import pandas as pd
+
+try:
+    import pyarrow as pa
+    import pyarrow.ipc
+except ImportError:  # 선택 설치 패키지 - 없으면 gzip JSON 형식으로 저장
+    pa = None
+
+# 캐시 디렉터리 기본값 (환경변수 REGISTER_CACHE_DIR로 변경 가능)
+DEFAULT_CACHE_DIR = os.environ.get("REGISTER_CACHE_DIR", os.path.join(tempfile.gettempdir(), "register_result_cache"))
+# 캐시 전체 크기 상한 (기본 512MB, 넘으면 오래 사용하지 않은 항목부터 삭제)
+DEFAULT_MAX_BYTES = 512 * 1024 ** 2
+
+RESULT_KEYS = ("szj", "syg", "djg")
+# 데이터프레임 외에 함께 저장하는 파일별 값
+RESULT_META_KEYS = ("unique_number",)
+# 저장 형식별 항목 파일 확장자 (Arrow: 표 3개의 Arrow IPC 스트림을 압축해 묶은 zip, JSON: gzip 압축 JSON)
+ARROW_SUFFIX = ".arrow.zip"
+JSON_SUFFIX = ".json.gz"
+# Arrow 스트림 안에서 값을 JSON 문자열로 저장한 열 표시 (여러 타입이 섞인 열)
+_JSON_FIELD = {b"encoding": b"json"}
+_META_FILE = "meta.json"
+
+
+def _column_values(df, col):
+    return [None if value is pd.NA else value for value in df[col].tolist()]
+
+
+def _frame_to_columns(df):
+    """데이터프레임을 열 단위 딕셔너리로 변환 (열 순서 유지)"""
+    columns = [str(col) for col in df.columns]
+    data = {}
+    for col, name in zip(df.columns, columns):
+        data[name] = _column_values(df, col)
+    return {"columns": columns, "data": data}
+
+
+def _columns_to_frame(payload):
+    columns = payload["columns"]
+    return pd.DataFrame({col: payload["data"][col] for col in columns}, columns=columns, dtype=object)
+
+
+def _arrow_column(values):
+    """
+    열 값 목록을 Arrow 배열로 변환 - 값 타입이 한 가지(빈 값 제외)인 열은 그 타입 그대로,
+    int와 str처럼 섞인 열은 값마다 JSON 문자열로 저장해 읽을 때 원래 값으로 복원 (정수가 실수로 바뀌는 등의 변환 방지)
+    """
+    types = {type(value) for value in values if value is not None}
+    if len(types) <= 1:
+        try:
+            return pa.array(values), None
+        except (pa.ArrowInvalid, pa.ArrowTypeError, OverflowError):
+            pass
+    encoded = [None if value is None else json.dumps(value, ensure_ascii=False, default=str) for value in values]
+    return pa.array(encoded, type=pa.string()), _JSON_FIELD
+
+
+def _frame_to_arrow(df):
+    arrays, fields = [], []
+    for col in df.columns:
+        array, metadata = _arrow_column(_column_values(df, col))
+        arrays.append(array)
+        fields.append(pa.field(str(col), array.type, metadata=metadata))
+    table = pa.Table.from_arrays(arrays, schema=pa.schema(fields))
+    buffer = io.BytesIO()
+    with pyarrow.ipc.new_stream(buffer, table.schema) as writer:
+        writer.write_table(table)
+    return buffer.getvalue()
+
+
+def _arrow_to_frame(data):
+    table = pyarrow.ipc.open_stream(data).read_all()
+    columns = {}
+    for field, column in zip(table.schema, table.columns):
+        values = column.to_pylist()
+        if field.metadata == _JSON_FIELD:
+            values = [None if value is None else json.loads(value) for value in values]
+        columns[field.name] = values
+    return pd.DataFrame(columns, columns=table.schema.names, dtype=object)
+
+
+class ResultCache:
+    """
+    파일 내용(SHA-256)과 추출기 버전을 키로 파일별 분석 결과를 저장하는 디스크 캐시
+    결과는 소유지분/소유권/저당권 데이터프레임을 열 형식(Arrow IPC 스트림)으로, 고유번호는 meta.json으로
+    한 zip 파일에 압축해 저장 (pyarrow가 없으면 열 단위 JSON을 gzip으로 압축해 저장)
+    전체 크기가 max_bytes를 넘으면 가장 오래 사용하지 않은 항목부터 삭제 (LRU)
+    """
+
+    def __init__(self, directory=DEFAULT_CACHE_DIR, max_bytes=DEFAULT_MAX_BYTES, version=""):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.version = str(version)
+        self.hits = 0
+        self.misses = 0
+        os.makedirs(directory, exist_ok=True)
+        # 항목 경로 -> (마지막 사용 시각, 크기)
+        self._entries = {}
+        for entry in os.scandir(directory):
+            if entry.name.endswith((ARROW_SUFFIX, JSON_SUFFIX)):
+                stat = entry.stat()
+                self._entries[entry.path] = (stat.st_mtime, stat.st_size)
+        self._total = sum(size for _, size in self._entries.values())
+
+    def key(self, data):
+        digest = hashlib.sha256(data)
+        digest.update(b"\0" + self.version.encode())
+        return digest.hexdigest()
+
+    def _path(self, key):
+        return os.path.join(self.directory, key + (ARROW_SUFFIX if pa is not None else JSON_SUFFIX))
+
+    def get(self, key):
+        """저장된 결과 딕셔너리(szj, syg, djg, unique_number)를 반환, 없으면 None"""
+        path = self._path(key)
+        try:
+            result = _read_arrow_entry(path) if pa is not None else _read_json_entry(path)
+        except (OSError, ValueError, KeyError, zipfile.BadZipFile):
+            self.misses += 1
+            return None
+        # 사용 시각 갱신 (LRU)
+        try:
+            os.utime(path)
+            size = self._entries[path][1] if path in self._entries else os.path.getsize(path)
+        except OSError:
+            size = 0
+        self._total += size - self._entries.get(path, (0, 0))[1]
+        self._entries[path] = (time.time(), size)
+        self.hits += 1
+        return result
+
+    def put(self, key, result):
+        """분석 결과를 저장 (임시 파일에 쓴 뒤 교체하여 중간 상태가 남지 않게 함)"""
+        path = self._path(key)
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as raw:
+                if pa is not None:
+                    _write_arrow_entry(raw, result)
+                else:
+                    _write_json_entry(raw, result)
+            os.replace(tmp_path, path)
+        except OSError:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            return
+        size = os.path.getsize(path)
+        self._total += size - self._entries.get(path, (0, 0))[1]
+        self._entries[path] = (os.path.getmtime(path), size)
+        self._evict()
+
+    def _evict(self):
+        if self._total <= self.max_bytes:
+            return
+        # 한 번 정리할 때 상한의 90%까지 비워서 매번 정렬하지 않게 함
+        target = self.max_bytes * 0.9
+        for path, (_, size) in sorted(self._entries.items(), key=lambda item: item[1][0]):
+            if self._total <= target:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+            self._total -= size
+            del self._entries[path]
+
+    def clear(self):
+        for path in list(self._entries):
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+        self._entries.clear()
+        self._total = 0
+
+
+def _write_arrow_entry(raw, result):
+    # 파일별 표는 행이 적어 스트림마다 압축하는 것보다 zip에서 한 번에 압축하는 편이 작고 빠름
+    with zipfile.ZipFile(raw, "w", zipfile.ZIP_DEFLATED) as zf:
+        for name in RESULT_KEYS:
+            zf.writestr(name + ".arrow", _frame_to_arrow(result[name]))
+        zf.writestr(_META_FILE, json.dumps({name: result.get(name) for name in RESULT_META_KEYS}, ensure_ascii=False))
+
+
+def _read_arrow_entry(path):
+    with zipfile.ZipFile(path) as zf:
+        result = {name: _arrow_to_frame(zf.read(name + ".arrow")) for name in RESULT_KEYS}
+        meta = json.loads(zf.read(_META_FILE))
+    result.update({name: meta.get(name) for name in RESULT_META_KEYS})
+    return result
+
+
+def _write_json_entry(raw, result):
+    payload = {name: _frame_to_columns(result[name]) for name in RESULT_KEYS}
+    payload.update({name: result.get(name) for name in RESULT_META_KEYS})
+    with gzip.GzipFile(fileobj=raw, mode="wb", compresslevel=6) as f:
+        f.write(json.dumps(payload, ensure_ascii=False, default=str).encode("utf-8"))
+
+
+def _read_json_entry(path):
+    with gzip.open(path, "rt", encoding="utf-8") as f:
+        payload = json.load(f)
+    result = {name: _columns_to_frame(payload[name]) for name in RESULT_KEYS}
+    result.update({name: payload.get(name) for name in RESULT_META_KEYS})
+    return result
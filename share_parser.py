@@ -0,0 +1,98 @@
+import re
+from fractions import Fraction
+from functools import lru_cache
+
+import numpy as np
+import pandas as pd
+
+# 해석 결과를 보관할 지분 문자열 수 (가장 오래 사용하지 않은 값부터 삭제)
+SHARE_CACHE_SIZE = 8192
+
+# 지분 표기 형태 - 앞에 있는 형태가 우선 (형태 이름, 정규식, 값 그룹 이름)
+# 분수는 분자/분모, '분의'는 분모/분자 순서로 표기하며 퍼센트는 값 하나
+_SHARE_FORMS = [
+    ("분수", r'(?:공유)?(?P<f_num>\d+)/(?P<f_den>\d+)', ("f_num", "f_den")),
+    ("퍼센트", r'(?P<p_val>[\d\.]+)\s*%', ("p_val",)),
+    ("분의", r'(?P<b_den>\d+\.?\d*)\s*분\s*의\s*(?P<b_num>\d+\.?\d*)', ("b_num", "b_den")),
+    ("분의(붙여쓰기)", r'(?P<n_den>\d+\.?\d*)분의(?P<n_num>\d+\.?\d*)', ("n_num", "n_den")),
+]
+
+# 형태별 정규식을 순서대로 이어 붙인 하나의 패턴
+# 각 형태 앞의 '.*?' 때문에 앞 형태를 문자열 전체에서 찾지 못했을 때만 다음 형태를 검사함
+# (분모가 0이면 그다음 형태부터 다시 검사해야 하므로 시작 형태별로 하나씩 컴파일)
+_SHARE_PATTERNS = [
+    re.compile("|".join(f".*?{pattern}" for _, pattern, _ in _SHARE_FORMS[start:]), re.DOTALL)
+    for start in range(len(_SHARE_FORMS))
+]
+
+
+@lru_cache(maxsize=SHARE_CACHE_SIZE)
+def parse_share(text):
+    """
+    최종지분 문자열을 정확한 분수(Fraction)로 변환하는 함수, 해석할 수 없으면 None
+    예: "2분의 1" -> 1/2, "1/3" -> 1/3, "50%" -> 1/2, "단독소유" -> 1,
+        "10139.94분의845.0298" -> 469461/5633300 (소수점 값도 반올림 없이 유지)
+    """
+    text = text.strip()
+    if not text:
+        return None
+
+    # 단독소유는 1
+    if "단독소유" in text or ("단독" in text and len(text) < 10):
+        return Fraction(1)
+
+    start = 0
+    while start < len(_SHARE_FORMS):
+        match = _SHARE_PATTERNS[start].match(text)
+        if match is None:
+            return None
+        for position in range(start, len(_SHARE_FORMS)):
+            groups = _SHARE_FORMS[position][2]
+            if match.group(groups[0]) is not None:
+                break
+        try:
+            values = [Fraction(match.group(name)) for name in groups]
+        except ValueError:
+            return None  # "1.2.3%"처럼 숫자로 읽을 수 없는 값
+        if len(values) == 1:
+            return values[0] / 100
+        numerator, denominator = values
+        if denominator != 0:
+            return numerator / denominator
+        # 분모가 0이면 다음 형태로 다시 검사
+        start = position + 1
+    return None
+
+
+def parse_share_column(values, exact=False):
+    """
+    최종지분 열 전체를 한 번에 변환하는 함수 (같은 문자열은 한 번만 해석)
+    (값 배열, 실패 마스크) 튜플을 반환
+    - 값 배열: exact이면 Fraction 또는 None 객체 배열, 아니면 float 배열 (해석하지 못한 값은 NaN)
+    - 실패 마스크: 값이 있는데 지분으로 해석하지 못한 행이 True인 bool 배열
+    """
+    codes, uniques = pd.factorize(pd.Series(values, dtype=object), use_na_sentinel=True)
+    parsed = []
+    failed = []
+    for value in uniques:
+        text = str(value) if value else ""
+        share = parse_share(text) if text else None
+        parsed.append(share)
+        failed.append(share is None and bool(text.strip()))
+
+    # 마지막 자리는 빈 값(NaN, codes == -1)용
+    failed_mask = np.array(failed + [False], dtype=bool)[codes]
+    if exact:
+        return np.array(parsed + [None], dtype=object)[codes], failed_mask
+    floats = np.array([float(share) if share is not None else np.nan for share in parsed] + [np.nan])
+    return floats[codes], failed_mask
+
+
+def format_fixed(value, digits=4):
+    """
+    분수를 소수점 digits자리 문자열로 변환 (정확한 값 기준으로 반올림, 5는 짝수 쪽으로)
+    예: Fraction(1, 3) -> "0.3333"
+    """
+    scaled = round(value * 10 ** digits)
+    whole, rest = divmod(abs(scaled), 10 ** digits)
+    return f"{'-' if scaled < 0 else ''}{whole}.{rest:0{digits}d}"
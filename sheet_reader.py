@@ -0,0 +1,110 @@
+import pandas as pd
+from openpyxl import load_workbook
+from openpyxl.cell.cell import ERROR_CODES
+
+try:
+    from python_calamine import CalamineWorkbook
+except ImportError:  # 선택 설치 패키지
+    CalamineWorkbook = None
+
+
+def _cell_text(value):
+    """
+    셀 값을 문자열로 변환하는 함수
+    pandas로 읽었을 때와 같은 표기가 되도록 정수로 떨어지는 실수는 정수로 표시
+    """
+    if value is None:
+        return ""
+    if isinstance(value, float):
+        if value != value:  # NaN
+            return ""
+        return str(int(value)) if value.is_integer() else str(value)
+    if isinstance(value, str):
+        # 엑셀 오류값(#N/A 등)은 빈 셀로 취급
+        return "" if value in ERROR_CODES else value
+    return str(value)
+
+
+def _iter_openpyxl_rows(source):
+    """openpyxl 읽기 전용 모드로 첫 번째 시트의 행을 순서대로 반환"""
+    wb = load_workbook(source, read_only=True, data_only=True, keep_links=False)
+    try:
+        ws = wb[wb.sheetnames[0]]
+        yield from ws.iter_rows(values_only=True)
+    finally:
+        wb.close()
+
+
+def _iter_calamine_rows(source):
+    """python-calamine(Rust 기반)으로 첫 번째 시트의 행을 순서대로 반환"""
+    if hasattr(source, "read"):
+        wb = CalamineWorkbook.from_filelike(source)
+    else:
+        wb = CalamineWorkbook.from_path(source)
+    try:
+        # 앞쪽의 빈 행/열도 포함해야 openpyxl과 행 위치가 같아짐
+        yield from wb.get_sheet_by_index(0).to_python(skip_empty_area=False)
+    finally:
+        wb.close()
+
+
+# 사용 가능한 시트 읽기 백엔드 (이름: 행 iterator 함수)
+SHEET_READERS = {"openpyxl": _iter_openpyxl_rows}
+if CalamineWorkbook is not None:
+    SHEET_READERS["calamine"] = _iter_calamine_rows
+
+DEFAULT_READER = "calamine" if "calamine" in SHEET_READERS else "openpyxl"
+
+
+def trim_rows(rows):
+    """
+    문자열 셀 목록의 행들을 정리하는 제너레이터
+    행 끝의 빈 셀과 끝부분의 빈 행(서식만 있는 행 등)은 제외하고 튜플로 반환
+    """
+    blank_rows = 0
+    for cells in rows:
+        cells = list(cells)
+        while cells and not cells[-1]:
+            cells.pop()
+        if not cells:
+            # 뒤에 내용이 있는 행이 나올 때만 빈 행을 내보냄
+            blank_rows += 1
+            continue
+        for _ in range(blank_rows):
+            yield ()
+        blank_rows = 0
+        yield tuple(cells)
+
+
+def iter_sheet_rows(source, reader=None):
+    """
+    엑셀 파일 첫 번째 시트의 행을 문자열 튜플로 하나씩 반환하는 제너레이터
+    행 끝의 빈 셀과 시트 끝의 빈 행(서식만 있는 행 등)은 제외
+    """
+    reader = reader or DEFAULT_READER
+    if reader not in SHEET_READERS:
+        raise ValueError(f"지원하지 않는 시트 읽기 방식입니다: {reader} (사용 가능: {', '.join(SHEET_READERS)})")
+
+    yield from trim_rows([_cell_text(v) for v in values] for values in SHEET_READERS[reader](source))
+
+
+def rows_to_frame(rows, header=True):
+    """
+    문자열 튜플 행 목록을 빈 문자열로 채워진 데이터프레임으로 만드는 함수
+    header가 True이면 pd.ExcelFile.parse와 같이 첫 번째 행을 제외 (헤더 행으로 취급)
+    """
+    width = max((len(row) for row in rows), default=0)
+    if header:
+        rows = rows[1:]
+    if not rows or not width:
+        return pd.DataFrame()
+    padded = [row + ("",) * (width - len(row)) for row in rows]
+    return pd.DataFrame(padded, dtype=object)
+
+
+def read_register_frame(source, reader=None, header=True):
+    """
+    등기부등본 시트를 빈 문자열로 채워진 데이터프레임으로 읽는 함수
+    header가 True이면 pd.ExcelFile.parse와 같이 첫 번째 행을 제외 (헤더 행으로 취급)
+    """
+    return rows_to_frame(list(iter_sheet_rows(source, reader)), header)
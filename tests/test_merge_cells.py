@@ -0,0 +1,75 @@
+"""
+벡터화된 merge_dataframe_cells가 행마다 merge_adjacent_cells를 적용한 결과와 같은지 검사
+(속도 비교는 benchmarks/bench_merge_cells.py)
+"""
+import numpy as np
+import pandas as pd
+import pytest
+
+from register_engine import merge_adjacent_cells, merge_dataframe_cells
+
+
+def merge_rowwise(df):
+    """벡터화 이전 구현 (행마다 merge_adjacent_cells 적용)"""
+    if df.empty:
+        return df
+    merged_df = df.copy()
+    for i in range(len(merged_df)):
+        merged_df.iloc[i] = merge_adjacent_cells(merged_df.iloc[i])
+    return merged_df
+
+
+def frame(rows, columns=None):
+    return pd.DataFrame(rows, columns=columns, dtype=object)
+
+
+def assert_same_merge(df):
+    expected = merge_rowwise(df.copy())
+    actual = merge_dataframe_cells(df.copy())
+    assert list(actual.columns) == list(expected.columns)
+    assert list(actual.index) == list(expected.index)
+    assert actual.astype(str).values.tolist() == expected.astype(str).values.tolist()
+
+
+CASES = {
+    "빈 행만": [["", "", "", ""], ["", "", "", ""]],
+    "빈 행 섞임": [["홍길동", "", "", ""], ["", "", "", ""], ["1/2", "", "서울", "강남구"]],
+    "앞뒤 공백 열": [["", "", "김", "철수", "", ""], ["", "서울시", "", "중구", "", ""]],
+    "공백만 있는 셀": [["  ", "홍", " \t", "길동", "   "], [" ", " ", "  ", " ", " "]],
+    "간격 2와 3": [["a", "", "b", "", "", "c"], ["a", "", "", "b", "", "c"]],
+    "그룹이 3칸 초과": [["a", "b", "c", "d", "", "", "e", "f"]],
+    "하이픈/슬래시 연결": [["751984-", "1234567", "", "2/", "3"], ["공유자 -", "지분", "", "", ""]],
+    "숫자 셀": [[1, "", 2.5, "", "", 3], [0, 0, "", "", "", ""], [10, "원", "", "", "", ""]],
+    "NaN과 빈 문자열": [[np.nan, "", "a", "b"], [None, "x", np.nan, ""], ["", "", "", np.nan]],
+    "셀이 10개 초과": [[str(i) for i in range(12)]],
+}
+
+
+@pytest.mark.parametrize("rows", CASES.values(), ids=CASES.keys())
+def test_matches_rowwise(rows):
+    assert_same_merge(frame(rows))
+
+
+def test_single_column():
+    assert_same_merge(frame([["홍길동"], [""], ["1/2"]]))
+
+
+def test_empty_frame():
+    df = frame([])
+    assert merge_dataframe_cells(df).empty
+
+
+def test_section_labels_and_index():
+    # 구간 슬라이스처럼 열 라벨이 0부터 시작하지 않고 행 인덱스도 이어지지 않는 경우
+    df = frame([["", "공유자", "", "지분", "", ""], ["", "", "홍", "길동", "", "1/3"], ["", "", "", "", "", ""]],
+               columns=[3, 4, 5, 6, 7, 8])
+    df.index = [17, 18, 21]
+    assert_same_merge(df)
+
+
+def test_random_rows():
+    rng = np.random.default_rng(0)
+    choices = np.array(["", " ", "홍길동", "1/2", "서울-", "/", "2", "중구"], dtype=object)
+    for _ in range(20):
+        shape = (int(rng.integers(1, 30)), int(rng.integers(1, 14)))
+        assert_same_merge(frame(rng.choice(choices, size=shape).tolist()))
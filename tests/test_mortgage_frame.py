@@ -0,0 +1,44 @@
+"""저당권사항(을구) 추출 회귀 검사"""
+import pandas as pd
+
+from register_engine import process_register_file
+
+
+def register_sheet(mortgage_rows):
+    rows = [
+        ["[토지] 경기도 화성시 우정읍 조암리 1-1  대  100㎡", "", "", ""],
+        ["고유번호 1234-2012-000001", "", "", ""],
+        ["1. 소유지분현황 ( 갑구 )", "", "", ""],
+        ["등기명의인", "(주민)등록번호", "최종지분", "주소"],
+        ["홍길동", "751984-*******", "2분의 1", "서울특별시 중구"],
+        ["김철수", "820101-*******", "2분의 1", "서울특별시 강남구"],
+    ] + mortgage_rows
+    return pd.DataFrame([row + [""] * (4 - len(row)) for row in rows], dtype=object)
+
+
+def process_frame(df, monkeypatch):
+    monkeypatch.setattr("register_engine.read_register_source", lambda *args: df)
+    return process_register_file("header_only.xlsx", b"")
+
+
+def test_header_only_mortgage_section_keeps_file(monkeypatch):
+    # 을구 구간에 헤더만 있고 기록 행이 없는 경우 - 파일 전체가 처리실패가 되면 안 됨
+    df = register_sheet([["3.(근)저당권및전세권등(을구)"], ["순위번호", "주요등기사항"], ["비고"]])
+    result = process_frame(df, monkeypatch)
+    assert result["error"] is None
+    assert len(result["szj"]) == 2
+    djg = result["djg"]
+    assert len(djg) == 0
+    assert list(djg.columns[-3:]) == ["채권최고액", "근저당권자", "지상권자"]
+
+
+def test_mortgage_amount_parsed(monkeypatch):
+    df = register_sheet([
+        ["3.(근)저당권및전세권등(을구)"],
+        ["순위번호", "등기목적", "주요등기사항", "대상소유자"],
+        ["1", "근저당권설정", "채권최고액 금433,000,000원 근저당권자 농협은행", "홍길동"],
+        ["비고"],
+    ])
+    result = process_frame(df, monkeypatch)
+    assert result["error"] is None
+    assert result["djg"]["채권최고액"].tolist() == [433000000]
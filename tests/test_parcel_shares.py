@@ -0,0 +1,75 @@
+"""필지별 지분검증(summarize_parcel_shares) 검사"""
+import pandas as pd
+
+from register_export import PARCEL_CHECK_SHEET, SECURED_DEBT_SHEET, prepare_result_frames
+
+
+def ownership_frame(address, shares):
+    return pd.DataFrame({
+        "토지주소": address,
+        "등기명의인": [f"소유자{i}" for i in range(len(shares))],
+        "(주민)등록번호": "",
+        "최종지분": shares,
+        "토지면적": "100",
+        "그룹정보": "있음",
+    })
+
+
+def parcel_check(szj_list, sources=None):
+    return prepare_result_frames(szj_list, [], [], sources)[PARCEL_CHECK_SHEET]
+
+
+def test_same_address_in_different_files_is_checked_separately():
+    check = parcel_check([ownership_frame("알수없음", ["1/2", "1/2"]), ownership_frame("알수없음", ["1/4", "3/4"])],
+                         ["a.xlsx", "b.xlsx"])
+    assert check["원본파일"].tolist() == ["a.xlsx", "b.xlsx"]
+    assert check["검증결과"].tolist() == ["정상", "정상"]
+
+
+def test_duplicate_upload_is_not_over_allocated():
+    df = ownership_frame("화성시 1-1", ["1/3", "2/3"])
+    check = parcel_check([df, df.copy()])
+    assert len(check) == 2
+    assert set(check["검증결과"]) == {"정상"}
+
+
+def test_blank_share_is_not_unparsed():
+    check = parcel_check([ownership_frame("화성시 1-1", ["1/2", "", None])], ["a.xlsx"])
+    row = check.iloc[0]
+    assert row["해석불가 지분수"] == 0
+    assert row["빈 지분수"] == 2
+    assert row["검증결과"] == "지분합계 부족"
+
+
+def test_unparsed_share_needs_review():
+    check = parcel_check([ownership_frame("화성시 1-1", ["1/2", "절반"])], ["a.xlsx"])
+    assert check.iloc[0]["해석불가 지분수"] == 1
+    assert check.iloc[0]["검증결과"] == "확인필요 (지분 해석불가)"
+
+
+def mortgage_frame(address, amounts):
+    return pd.DataFrame({
+        "토지주소": address,
+        "순위번호": [str(i + 1) for i in range(len(amounts))],
+        "등기목적": "근저당권설정",
+        "채권최고액": pd.Series(amounts, dtype=object),
+        "근저당권자": "농협은행",
+    })
+
+
+def secured_debt(djg_list, sources=None):
+    szj_list = [ownership_frame(df["토지주소"].iloc[0], ["1/2", "1/2"]) for df in djg_list]
+    return prepare_result_frames(szj_list, [], djg_list, sources)[SECURED_DEBT_SHEET]
+
+
+def test_secured_debt_duplicate_upload_not_summed():
+    df = mortgage_frame("화성시 1-1", [100000000, None])
+    debt = secured_debt([df, df.copy()], ["a.xlsx", "a.xlsx"])
+    assert debt["채권최고액 합계"].tolist() == [100000000, 100000000]
+    assert debt["채권최고액 건수"].tolist() == [1, 1]
+
+
+def test_secured_debt_unknown_addresses_kept_apart():
+    debt = secured_debt([mortgage_frame("알수없음", [300]), mortgage_frame("알수없음", [500, 700])],
+                        ["a.xlsx", "b.xlsx"])
+    assert debt[["원본파일", "채권최고액 합계"]].values.tolist() == [["a.xlsx", 300], ["b.xlsx", 1200]]
@@ -0,0 +1,15 @@
+import pytest
+
+from register_profile import peak_memory_mb, reset_peak_memory
+
+
+def test_peak_memory_is_reset_per_file():
+    if not reset_peak_memory():
+        pytest.skip("최대 메모리 기록을 되돌릴 수 없는 환경")
+    before = peak_memory_mb()
+    block = bytearray(200 * 1024 * 1024)
+    assert peak_memory_mb() >= before + 150
+    del block
+    # 큰 파일 다음에 처리한 파일에는 앞 파일의 최대값이 남지 않음
+    assert reset_peak_memory()
+    assert peak_memory_mb() < before + 50
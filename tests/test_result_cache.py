@@ -0,0 +1,53 @@
+"""결과 캐시(ResultCache) 저장/복원 검사"""
+import math
+
+import pandas as pd
+import pytest
+
+import result_cache
+from result_cache import ResultCache
+
+
+def sample_result():
+    szj = pd.DataFrame({
+        "토지주소": ["화성시 1-1", "화성시 1-1"],
+        "등기명의인": ["홍길동", None],
+        "최종지분 수치화": [0.5, float("nan")],
+        "토지면적": ["1,234", 1234],  # 문자열과 숫자가 섞인 열
+        "그룹정보": ["있음", "있음"],
+    }, dtype=object)
+    syg = pd.DataFrame([["화성시 1-1", "기록없음"]], columns=["토지주소", "순위번호"], dtype=object)
+    djg = pd.DataFrame({"토지주소": ["화성시 1-1"], "채권최고액": [433000000], "근저당권자": [""]}, dtype=object)
+    return {"szj": szj, "syg": syg, "djg": djg, "unique_number": "1234-2012-000001"}
+
+
+def cells(df):
+    return list(df.columns), [[(type(value), repr(value)) for value in row] for row in df.itertuples(index=False)]
+
+
+@pytest.mark.parametrize("columnar", [True, False], ids=["arrow", "json"])
+def test_round_trip(tmp_path, monkeypatch, columnar):
+    if columnar:
+        pytest.importorskip("pyarrow")
+    else:
+        monkeypatch.setattr(result_cache, "pa", None)
+    cache = ResultCache(str(tmp_path), version="test")
+    result = sample_result()
+    key = cache.key(b"register bytes")
+    assert cache.get(key) is None
+    cache.put(key, result)
+    restored = cache.get(key)
+    assert restored["unique_number"] == result["unique_number"]
+    for name in ("szj", "syg", "djg"):
+        assert cells(restored[name]) == cells(result[name])
+    assert math.isnan(restored["szj"]["최종지분 수치화"][1])
+    assert cache.hits == 1 and cache.misses == 1
+
+
+def test_empty_frame_keeps_columns(tmp_path):
+    cache = ResultCache(str(tmp_path), version="test")
+    result = sample_result()
+    result["djg"] = pd.DataFrame(columns=["토지주소", "채권최고액"], dtype=object)
+    cache.put("k", result)
+    restored = cache.get("k")
+    assert list(restored["djg"].columns) == ["토지주소", "채권최고액"] and len(restored["djg"]) == 0
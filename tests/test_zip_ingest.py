@@ -0,0 +1,60 @@
+"""압축파일 읽기(iter_zip_members)의 크기/중첩 한도 검사"""
+import io
+import zipfile
+
+import pytest
+
+from zip_ingest import ZipSizeLimitError, iter_zip_members
+
+
+def zip_bytes(entries):
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w", zipfile.ZIP_STORED) as zf:
+        for name, data in entries:
+            zf.writestr(name, data)
+    return buffer.getvalue()
+
+
+def nested_chain(depth, leaf=b"x" * 10):
+    # depth단계로 중첩된 zip (가장 안쪽에 등기부 파일 하나)
+    data = zip_bytes([("leaf.xlsx", leaf)])
+    for level in range(depth):
+        data = zip_bytes([(f"level{level}.zip", data)])
+    return data
+
+
+def test_nested_members_counted_once():
+    inner = zip_bytes([("a.xlsx", b"x" * 6000), ("b.xlsx", b"y" * 3000)])
+    outer = zip_bytes([("in.zip", inner), ("c.pdf", b"z" * 500)])
+    names = [name for name, _ in iter_zip_members(io.BytesIO(outer), max_total_size=9500)]
+    assert names == ["in.zip/a.xlsx", "in.zip/b.xlsx", "c.pdf"]
+    with pytest.raises(ZipSizeLimitError):
+        list(iter_zip_members(io.BytesIO(outer), max_total_size=9499))
+
+
+def test_nesting_within_depth():
+    names = [name for name, _ in iter_zip_members(io.BytesIO(nested_chain(2)), max_depth=3)]
+    assert names == ["level1.zip/level0.zip/leaf.xlsx"]
+
+
+def test_nesting_too_deep():
+    with pytest.raises(ZipSizeLimitError, match="중첩 깊이"):
+        list(iter_zip_members(io.BytesIO(nested_chain(4)), max_depth=3))
+
+
+def test_self_repeating_nesting_stops():
+    # 자기 자신을 계속 담는 zip처럼 같은 내용을 반복해서 중첩 - 깊이 한도에서 멈춰야 함
+    data = zip_bytes([("loop.xlsx", b"x")])
+    for _ in range(50):
+        data = zip_bytes([("loop.zip", data), ("loop.xlsx", b"x")])
+    with pytest.raises(ZipSizeLimitError):
+        list(iter_zip_members(io.BytesIO(data)))
+
+
+def test_nested_archives_charged_to_budget():
+    # 분석 대상이 아닌 항목만 든 내부 zip을 여러 개 넣어도 내부 zip 크기는 한도에 포함
+    inner = zip_bytes([("note.txt", b"n" * 1000)])
+    outer = zip_bytes([(f"in{i}.zip", inner) for i in range(5)])
+    with pytest.raises(ZipSizeLimitError, match="압축 해제 크기"):
+        list(iter_zip_members(io.BytesIO(outer), max_total_size=3 * len(inner)))
+    assert list(iter_zip_members(io.BytesIO(outer), max_total_size=5 * len(inner))) == []
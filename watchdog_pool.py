@@ -0,0 +1,178 @@
+import multiprocessing
+import os
+import time
+from collections import deque
+from multiprocessing.connection import wait
+
+# 작업 프로세스의 처리시간/메모리를 확인하는 간격 (초)
+POLL_INTERVAL = 0.2
+
+
+class BudgetExceeded(Exception):
+    """작업이 처리시간 또는 메모리 한도를 넘어 작업 프로세스를 종료한 경우 (elapsed: 종료까지 걸린 시간, pid: 종료한 프로세스)"""
+
+    def __init__(self, reason, elapsed=0.0, pid=None):
+        super().__init__(reason)
+        self.elapsed = elapsed
+        self.pid = pid
+
+
+def process_rss_mb(pid):
+    """프로세스의 현재 메모리 사용량(MB), 확인할 수 없으면 None (리눅스 /proc 기준)"""
+    try:
+        with open(f"/proc/{pid}/statm") as f:
+            pages = int(f.read().split()[1])
+    except (OSError, ValueError, IndexError):
+        return None
+    return pages * os.sysconf("SC_PAGE_SIZE") / 1024 ** 2
+
+
+def _worker_main(conn):
+    # 작업 프로세스: (함수, 인자)를 받아 실행하고 (성공 여부, 결과 또는 예외)를 돌려줌, None을 받으면 종료
+    while True:
+        try:
+            task = conn.recv()
+        except EOFError:
+            return
+        if task is None:
+            return
+        fn, args = task
+        try:
+            reply = (True, fn(*args))
+        except Exception as e:
+            reply = (False, e)
+        try:
+            conn.send(reply)
+        except Exception as e:  # 결과를 pickle할 수 없는 경우
+            conn.send((False, RuntimeError(f"결과를 전달할 수 없습니다: {e}")))
+
+
+class _Job:
+    """WatchdogPool.submit이 반환하는 작업 (concurrent.futures.Future의 result()와 같은 방식으로 사용)"""
+
+    def __init__(self, pool, fn, args):
+        self._pool = pool
+        self.fn = fn
+        self.args = args
+        self.done = False
+        self._value = None
+        self._error = None
+
+    def _set(self, value=None, error=None):
+        self.done = True
+        self._value = value
+        self._error = error
+
+    def result(self):
+        while not self.done:
+            self._pool._pump(block=True)
+        if self._error is not None:
+            raise self._error
+        return self._value
+
+
+class WatchdogPool:
+    """
+    작업마다 처리시간(timeout, 초)과 메모리(max_memory_mb, MB) 한도를 감시하는 프로세스 풀
+    한도를 넘은 작업은 작업 프로세스를 강제 종료하고 result()에서 BudgetExceeded를 발생시키며,
+    종료한 프로세스는 새 프로세스로 교체하므로 다른 작업은 계속 처리됨
+    메모리는 /proc에서 읽으므로 리눅스에서만 감시 (다른 OS에서는 처리시간만 감시)
+    """
+
+    def __init__(self, max_workers, timeout=None, max_memory_mb=None):
+        self.timeout = timeout
+        self.max_memory_mb = max_memory_mb
+        self._context = multiprocessing.get_context()
+        self._idle = [self._start() for _ in range(max_workers)]
+        # 연결 -> (작업 프로세스, 작업, 시작 시각)
+        self._busy = {}
+        self._queue = deque()
+
+    def _start(self):
+        parent, child = self._context.Pipe()
+        # PDF 페이지 병렬 처리가 하위 프로세스를 만들 수 있도록 daemon으로 만들지 않음
+        process = self._context.Process(target=_worker_main, args=(child,))
+        process.start()
+        child.close()
+        return process, parent
+
+    def _replace(self, worker):
+        process, conn = worker
+        process.kill()
+        process.join()
+        conn.close()
+        self._idle.append(self._start())
+
+    def _over_memory(self, worker):
+        if self.max_memory_mb is None:
+            return False
+        rss = process_rss_mb(worker[0].pid)
+        return rss is not None and rss > self.max_memory_mb
+
+    def submit(self, fn, *args):
+        job = _Job(self, fn, args)
+        self._queue.append(job)
+        self._pump(block=False)
+        return job
+
+    def _pump(self, block):
+        # 대기 중인 작업을 쉬는 프로세스에 배정
+        while self._queue and self._idle:
+            worker = self._idle.pop()
+            job = self._queue.popleft()
+            worker[1].send((job.fn, job.args))
+            self._busy[worker[1]] = (worker, job, time.monotonic())
+        if not self._busy:
+            return
+
+        for conn in wait(list(self._busy), timeout=POLL_INTERVAL if block else 0):
+            worker, job, started = self._busy.pop(conn)
+            try:
+                ok, value = conn.recv()
+            except (EOFError, OSError):
+                # 작업 도중 프로세스가 종료됨 (운영체제의 메모리 부족 종료 등)
+                job._set(error=BudgetExceeded("작업 프로세스가 비정상 종료되었습니다",
+                                              time.monotonic() - started, worker[0].pid))
+                self._replace(worker)
+                continue
+            if ok:
+                job._set(value)
+            else:
+                job._set(error=value)
+            # 메모리를 많이 차지한 프로세스는 다음 파일이 한도에 걸리지 않도록 교체
+            if self._over_memory(worker):
+                self._replace(worker)
+            else:
+                self._idle.append(worker)
+
+        now = time.monotonic()
+        for conn, (worker, job, started) in list(self._busy.items()):
+            if self.timeout is not None and now - started > self.timeout:
+                reason = f"처리시간 한도 초과 ({self.timeout:g}초)"
+            elif self._over_memory(worker):
+                reason = f"메모리 한도 초과 ({self.max_memory_mb:g}MB)"
+            else:
+                continue
+            del self._busy[conn]
+            job._set(error=BudgetExceeded(reason, now - started, worker[0].pid))
+            self._replace(worker)
+
+    def shutdown(self):
+        for process, conn in self._idle:
+            try:
+                conn.send(None)
+            except OSError:
+                pass
+        for worker, job, _ in self._busy.values():
+            worker[0].kill()
+        for process, conn in self._idle + [worker for worker, _, _ in self._busy.values()]:
+            process.join()
+            conn.close()
+        self._idle = []
+        self._busy = {}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.shutdown()
@@ -0,0 +1,160 @@
+import hashlib
+import os
+import tempfile
+import zipfile
+
+# 압축 해제 후 전체 크기 상한 (기본 2GB)
+MAX_TOTAL_UNCOMPRESSED = 2 * 1024 ** 3
+# 분석 대상 파일 확장자 (엑셀 변환본과 PDF 원본)
+REGISTER_SUFFIXES = (".xlsx", ".pdf")
+# 내부 zip 파일은 이 크기까지만 메모리에 두고 그 이상은 임시 파일로 넘김
+SPOOL_MAX_MEMORY = 64 * 1024 ** 2
+# zip 안의 zip을 탐색할 최대 깊이 (자기 자신을 담은 zip이나 깊게 중첩된 zip 방지)
+MAX_NESTED_DEPTH = 3
+
+
+class ZipSizeLimitError(ValueError):
+    """압축 해제 크기 또는 내부 zip 중첩 깊이가 상한을 넘었을 때 발생하는 오류"""
+
+
+def member_display_name(info):
+    """
+    zip 항목의 파일명을 반환하는 함수
+    UTF-8 플래그가 없는 항목(윈도우 탐색기 압축 등)은 cp949로 다시 해석
+    """
+    name = info.filename
+    if not info.flag_bits & 0x800:
+        try:
+            name = name.encode("cp437").decode("cp949")
+        except (UnicodeEncodeError, UnicodeDecodeError):
+            pass
+    return name
+
+
+def upload_digest(source, chunk_size=1024 * 1024):
+    """
+    업로드된 압축파일 내용의 SHA-256 해시를 계산하는 함수
+    파일 객체는 읽은 뒤 원래 위치로 되돌려서 이후 압축 해제에 그대로 사용할 수 있음
+    """
+    digest = hashlib.sha256()
+    position = source.tell()
+    source.seek(0)
+    while True:
+        chunk = source.read(chunk_size)
+        if not chunk:
+            break
+        digest.update(chunk)
+    source.seek(position)
+    return digest.hexdigest()
+
+
+def _is_skipped(name):
+    """맥OS 메타데이터, 엑셀 임시 파일 등 분석 대상이 아닌 항목인지 확인"""
+    base = name.rsplit("/", 1)[-1]
+    return name.startswith("__MACOSX/") or "/__MACOSX/" in name or base.startswith(("._", "~$"))
+
+
+class _SizeBudget:
+    """
+    압축 해제한 누적 크기를 추적하는 객체
+    분석 대상 파일(used)과 임시 버퍼에 복사한 내부 zip(nested_used)을 따로 세어 각각 같은 상한을 적용
+    """
+
+    def __init__(self, limit):
+        self.limit = limit
+        self.used = 0
+        self.nested_used = 0
+
+    def _raise(self, name):
+        raise ZipSizeLimitError(f"압축 해제 크기가 허용 한도({self.limit // 1024 ** 2}MB)를 초과했습니다: {name}")
+
+    def check(self, size, name):
+        """size만큼 더 풀어도 상한 이내인지 확인 (누적 크기는 늘리지 않음)"""
+        if self.limit is not None and self.used + size > self.limit:
+            self._raise(name)
+
+    def reserve(self, size, name):
+        self.check(size, name)
+        self.used += size
+
+    def reserve_nested(self, size, name):
+        """내부 zip을 임시 버퍼에 복사하기 전에 내부 zip 누적 크기에 더함"""
+        if self.limit is not None and self.nested_used + size > self.limit:
+            self._raise(name)
+        self.nested_used += size
+
+
+def iter_zip_members(source, suffixes=REGISTER_SUFFIXES, max_total_size=MAX_TOTAL_UNCOMPRESSED,
+                     nested_zips=True, max_depth=MAX_NESTED_DEPTH, _budget=None, _prefix="", _depth=0):
+    """
+    압축파일을 디스크에 풀지 않고 분석 대상 항목을 순서대로 꺼내는 제너레이터
+    하위 폴더의 파일을 포함하며, nested_zips가 True이면 zip 안의 zip도 max_depth 단계까지 탐색
+    (더 깊이 중첩되었거나 내부 zip 누적 크기가 상한을 넘으면 ZipSizeLimitError)
+    (항목 경로, 파일 내용 bytes) 튜플을 반환
+    """
+    budget = _budget or _SizeBudget(max_total_size)
+    with zipfile.ZipFile(source, "r") as z:
+        members = []
+        for info in z.infolist():
+            if info.is_dir():
+                continue
+            name = member_display_name(info)
+            if _is_skipped(name):
+                continue
+            lower = name.lower()
+            if lower.endswith(suffixes) or (nested_zips and lower.endswith(".zip")):
+                members.append((info, name))
+
+        # 선언된 크기로 먼저 검사해서 큰 압축파일은 읽기 전에 거부
+        # 내부 zip은 안의 항목을 풀 때 크기를 세므로 내부 zip 자체의 크기는 여기에 더하지 않음 (내부 zip 누적 크기로 따로 제한)
+        budget.check(sum(info.file_size for info, name in members if not name.lower().endswith(".zip")),
+                     _prefix or "업로드 파일")
+
+        for info, name in members:
+            if name.lower().endswith(".zip"):
+                if _depth >= max_depth:
+                    raise ZipSizeLimitError(f"압축파일 중첩 깊이가 허용 한도({max_depth}단계)를 초과했습니다: {_prefix + name}")
+                # 내부 zip 크기는 분석 대상 파일과 별도의 누적 크기로 제한 (중첩으로 한도를 우회하지 못하도록)
+                budget.reserve_nested(info.file_size, _prefix + name)
+                # 내부 zip은 임의 접근이 필요하므로 spool 버퍼에 복사 후 재귀 탐색
+                with tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_MEMORY) as spool:
+                    with z.open(info) as member:
+                        while True:
+                            chunk = member.read(1024 * 1024)
+                            if not chunk:
+                                break
+                            spool.write(chunk)
+                    spool.seek(0)
+                    yield from iter_zip_members(spool, suffixes, max_total_size, nested_zips, max_depth,
+                                                _budget=budget, _prefix=_prefix + name + "/", _depth=_depth + 1)
+            else:
+                budget.reserve(info.file_size, _prefix + name)
+                yield _prefix + name, z.read(info)
+
+
+def iter_input_files(paths, suffixes=REGISTER_SUFFIXES, max_total_size=MAX_TOTAL_UNCOMPRESSED, nested_zips=True):
+    """
+    경로 목록(압축파일, 폴더, 개별 파일)에서 분석 대상 파일을 순서대로 꺼내는 제너레이터
+    폴더는 하위 폴더까지 이름순으로 탐색하고, 압축파일은 iter_zip_members로 내부 항목을 읽음
+    압축 해제 크기 상한은 압축파일마다 따로 적용
+    (파일 경로, 파일 내용 bytes) 튜플을 반환
+    """
+    for path in paths:
+        if os.path.isdir(path):
+            files = []
+            for root, dirs, names in os.walk(path):
+                dirs.sort()
+                files += [os.path.join(root, name) for name in sorted(names) if not _is_skipped(name)]
+        elif os.path.exists(path):
+            files = [path]
+        else:
+            raise FileNotFoundError(f"입력 경로를 찾을 수 없습니다: {path}")
+
+        for file_path in files:
+            lower = file_path.lower()
+            if lower.endswith(".zip"):
+                yield from iter_zip_members(file_path, suffixes, max_total_size, nested_zips,
+                                            _prefix=file_path + "/")
+            elif lower.endswith(suffixes):
+                with open(file_path, "rb") as f:
+                    yield file_path, f.read()